@@ -20,6 +20,7 @@ load_dotenv()
 print("6. Environment variables loaded.")
 
 from config.settings import settings
+from src.core.warmup import start_background_warm_up
 from src.ui.pages import MainPage, DebugPage
 from src.utils.logger import setup_logger
 from src.utils.exceptions import ConfigurationError
@@ -57,6 +58,9 @@ def main():
         }
     )
     
+    # Warm up the renderer once per process, without holding up the page
+    start_background_warm_up()
+    
     # Initialize session state
     if 'app_initialized' not in st.session_state:
         initialize_session_state()
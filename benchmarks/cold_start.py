@@ -0,0 +1,89 @@
+"""
+Measure cold-start render time with and without the template bytecode cache.
+
+Every sample runs in a fresh interpreter, so it pays all first-render costs:
+
+    python benchmarks/cold_start.py            # template load + HTML render
+    python benchmarks/cold_start.py --pdf      # include the WeasyPrint PDF write
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+# Executed in a child interpreter; prints a JSON timing record.
+CHILD_SCRIPT = """
+import json, sys, time
+start = time.perf_counter()
+from src.core.cv_generator import CVGenerator
+from src.core.data_processor import DataProcessor
+imported = time.perf_counter()
+
+lang, render_pdf = sys.argv[1], sys.argv[2] == '1'
+with open(f'data/sample/personal_{lang}.json', 'rb') as f:
+    cv_data = DataProcessor(lang=lang).load_from_file(f.read())
+
+loaded = time.perf_counter()
+generator = CVGenerator(lang=lang)
+template_ready = time.perf_counter()
+if render_pdf:
+    generator.generate_pdf_bytes(cv_data)
+else:
+    generator.render_html_preview(cv_data)
+done = time.perf_counter()
+
+print(json.dumps({
+    'import': imported - start,
+    'template': template_ready - loaded,
+    'render': done - template_ready,
+    'first_render': done - loaded,
+}))
+"""
+
+
+def run_sample(env: dict, lang: str, render_pdf: bool) -> dict:
+    """Run one cold-start sample in a fresh interpreter."""
+    result = subprocess.run(
+        [sys.executable, '-c', CHILD_SCRIPT, lang, '1' if render_pdf else '0'],
+        cwd=PROJECT_ROOT, env=env, capture_output=True, text=True, check=True
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--runs', type=int, default=5, help="Samples per mode")
+    parser.add_argument('--lang', default='en', choices=['en', 'fa'])
+    parser.add_argument('--pdf', action='store_true', help="Also write the PDF")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        modes = {
+            'no bytecode cache': {'TEMPLATE_BYTECODE_CACHE_DIR': ''},
+            'precompiled bytecode': {'TEMPLATE_BYTECODE_CACHE_DIR': cache_dir},
+        }
+
+        # Build step: populate the bytecode cache once
+        subprocess.run(
+            [sys.executable, 'scripts/precompile_templates.py'],
+            cwd=PROJECT_ROOT, env={**os.environ, 'TEMPLATE_BYTECODE_CACHE_DIR': cache_dir},
+            capture_output=True, check=True
+        )
+
+        for mode, overrides in modes.items():
+            env = {**os.environ, **overrides}
+            samples = [run_sample(env, args.lang, args.pdf) for _ in range(args.runs)]
+            template_ms = statistics.median(s['template'] for s in samples) * 1000
+            first_ms = statistics.median(s['first_render'] for s in samples) * 1000
+            print(f"{mode:>22}: template load {template_ms:7.1f} ms | "
+                  f"first render {first_ms:7.1f} ms (median of {args.runs})")
+
+
+if __name__ == '__main__':
+    main()
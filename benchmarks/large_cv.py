@@ -0,0 +1,89 @@
+"""
+Compare single-pass and chunked rendering as a CV grows:
+
+    python benchmarks/large_cv.py
+    python benchmarks/large_cv.py --sizes 100 1000 --chunk-items 100
+
+The sample CV is padded to the given number of list items (publications,
+projects, jobs and degrees). Every sample runs in a fresh
+interpreter with the render cache disabled and reports render time, page
+count (of the single pass) and peak memory.
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+# Executed in a child interpreter; prints a JSON record.
+CHILD_SCRIPT = """
+import json, resource, sys, time
+from src.core.cv_generator import CVGenerator
+from src.core.data_processor import DataProcessor
+
+lang, items, mode, chunk_items = sys.argv[1], int(sys.argv[2]), sys.argv[3], int(sys.argv[4])
+with open(f'data/sample/personal_{lang}.json', 'rb') as f:
+    cv_data = DataProcessor(lang=lang).load_from_file(f.read())
+
+# Spread the items over the sections that grow in academic CVs
+shares = {('publications', 'items'): 0.6, ('projects', 'items'): 0.2,
+          ('experience', 'jobs'): 0.1, ('education', 'degrees'): 0.1}
+for (section, key), share in shares.items():
+    template = (cv_data.get(section) or {}).get(key) or []
+    if template:
+        count = max(1, round(items * share))
+        cv_data[section][key] = [template[i % len(template)] for i in range(count)]
+
+generator = CVGenerator(lang=lang)
+generator.render_html_preview(cv_data)
+start = time.perf_counter()
+if mode == 'chunked':
+    pdf_bytes = generator.generate_large_pdf(cv_data, chunk_items=chunk_items, use_cache=False)
+else:
+    pdf_bytes = generator.generate_pdf_bytes(cv_data, use_cache=False)
+seconds = time.perf_counter() - start
+peak_rss_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+print(json.dumps({
+    'seconds': seconds,
+    'size_kb': len(pdf_bytes) / 1024,
+    'pages': generator.count_pages(cv_data) if mode == 'single' else None,
+    'peak_rss_mb': peak_rss_mb,
+}))
+"""
+
+
+def run_sample(lang: str, items: int, mode: str, chunk_items: int) -> dict:
+    """Render one sample in a fresh interpreter."""
+    env = {**os.environ, 'LOG_LEVEL': 'WARNING'}
+    result = subprocess.run(
+        [sys.executable, '-c', CHILD_SCRIPT, lang, str(items), mode, str(chunk_items)],
+        cwd=PROJECT_ROOT, env=env, capture_output=True, text=True, check=True
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10, 50, 200, 500, 1000, 2000],
+                        help="Total list items per sample")
+    parser.add_argument('--lang', default='en', choices=['en', 'fa'])
+    parser.add_argument('--chunk-items', type=int, default=150, help="List items per chunk")
+    args = parser.parse_args()
+
+    print(f"{'items':>6} {'pages':>6} | {'single pass':>28} | {'chunked':>28}")
+    print(f"{'':>13} | {'seconds':>8} {'size KB':>8} {'peak MB':>10} | "
+          f"{'seconds':>8} {'size KB':>8} {'peak MB':>10}")
+    for items in args.sizes:
+        single, chunked = (run_sample(args.lang, items, mode, args.chunk_items)
+                           for mode in ('single', 'chunked'))
+        print(f"{items:>6} {single['pages']:>6} | " + " | ".join(
+            f"{r['seconds']:>8.2f} {r['size_kb']:>8.0f} {r['peak_rss_mb']:>10.0f}"
+            for r in (single, chunked)
+        ))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,54 @@
+"""
+Compare PDF output profiles by file size and render time:
+
+    python benchmarks/pdf_profiles.py --lang fa
+    python benchmarks/pdf_profiles.py --profiles draft-fast email-small
+
+Renders the sample CV in one process with the render cache disabled, after
+a warm-up render that loads fonts, stylesheets and the profile picture.
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+os.chdir(PROJECT_ROOT)
+os.environ.setdefault('LOG_LEVEL', 'WARNING')
+
+from config.settings import settings  # noqa: E402
+from src.core.cv_generator import CVGenerator  # noqa: E402
+from src.core.data_processor import DataProcessor  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--runs', type=int, default=3, help="Renders per profile")
+    parser.add_argument('--lang', default='en', choices=['en', 'fa'])
+    parser.add_argument('--profiles', nargs='+', choices=list(settings.PDF_PROFILES),
+                        default=list(settings.PDF_PROFILES), help="Profiles to compare (default: all)")
+    args = parser.parse_args()
+
+    with open(f'data/sample/personal_{args.lang}.json', 'rb') as f:
+        cv_data = DataProcessor(lang=args.lang).load_from_file(f.read())
+    generator = CVGenerator(lang=args.lang)
+    generator.generate_pdf_bytes(cv_data, use_cache=False)
+
+    print(f"{'profile':<16}{'size (KB)':>12}{'median (ms)':>14}{'min (ms)':>12}")
+    for profile in args.profiles:
+        timings = []
+        for _ in range(args.runs):
+            start = time.perf_counter()
+            pdf_bytes = generator.generate_pdf_bytes(cv_data, use_cache=False, profile=profile)
+            timings.append(time.perf_counter() - start)
+        print(
+            f"{profile:<16}{len(pdf_bytes) / 1024:>12.1f}"
+            f"{statistics.median(timings) * 1000:>14.0f}{min(timings) * 1000:>12.0f}"
+        )
+
+
+if __name__ == '__main__':
+    main()
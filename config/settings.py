@@ -3,7 +3,7 @@
 Configuration settings for the CV Generator application.
 """
 import os
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 from dataclasses import dataclass
 from pathlib import Path
 
@@ -24,17 +24,68 @@ class Settings:
     
     # File Paths
     TEMPLATE_FILE: str = 'templates/cv_template.html'
+    # Visual variants of the CV by name; each template is styled by the .css file of the same name
+    TEMPLATE_VARIANTS: Dict[str, str] = None
+    TEMPLATE_BYTECODE_CACHE_DIR: Optional[str] = os.getenv('TEMPLATE_BYTECODE_CACHE_DIR', '.cache/jinja')
     DATA_DIRECTORY: str = 'data'
     SAMPLE_DATA_DIRECTORY: str = 'data/sample'
 
     PROJECT_ROOT = Path(__file__).parent.parent
     ASSETS_DIR = PROJECT_ROOT / 'assets'
+    ASSET_STORE_DIR = ASSETS_DIR / 'vendor'
+    
+    # Asset Fetching
+    ASSET_OFFLINE: bool = os.getenv('ASSET_OFFLINE', 'false').lower() == 'true'
+    
+    # Remote stylesheets (fonts, icons) imported ahead of the template stylesheet, per language
+    REMOTE_STYLESHEETS: Dict[str, List[str]] = None
     
     # CV Sections
     CV_SECTIONS: List[str] = None
     
     # PDF Configuration
     PDF_MAX_SIZE_MB: float = 10.0
+    PDF_DETERMINISTIC: bool = os.getenv('PDF_DETERMINISTIC', 'true').lower() == 'true'
+    PDF_SOURCE_DATE_EPOCH: Optional[str] = os.getenv('SOURCE_DATE_EPOCH')
+    # Named output profiles trading file size against render time and quality
+    PDF_PROFILES: Dict[str, Dict[str, Any]] = None
+    PDF_PROFILE: str = os.getenv('PDF_PROFILE', 'standard')
+    # Image data kept by the image cache of profiles with cache_images
+    PDF_IMAGE_CACHE_MB: float = 32.0
+    
+    # Rendered PDF Cache
+    RENDER_CACHE_ENABLED: bool = os.getenv('RENDER_CACHE_ENABLED', 'true').lower() == 'true'
+    RENDER_CACHE_MEMORY_MB: float = 64.0
+    RENDER_CACHE_DIR: Optional[str] = os.getenv('RENDER_CACHE_DIR', '.cache/pdf')
+    RENDER_CACHE_DISK_MB: float = 512.0
+    # Laid-out documents kept so a full PDF can follow a preview without a second layout
+    PREVIEW_LAYOUT_CACHE_SIZE: int = 2
+    # List items per separately laid-out chunk of CVs rendered with generate_large_pdf
+    LARGE_CV_CHUNK_ITEMS: int = int(os.getenv('LARGE_CV_CHUNK_ITEMS', '150'))
+    # Render the sample CVs at start-up so the first request does not pay for lazy loading
+    WARM_UP_ENABLED: bool = os.getenv('WARM_UP_ENABLED', 'true').lower() == 'true'
+    # Render the standard CV in the background as soon as its data is loaded
+    SPECULATIVE_RENDER_ENABLED: bool = os.getenv('SPECULATIVE_RENDER_ENABLED', 'true').lower() == 'true'
+    
+    # Render Worker Pool
+    RENDER_POOL_ENABLED: bool = os.getenv('RENDER_POOL_ENABLED', 'false').lower() == 'true'
+    RENDER_POOL_WORKERS: int = int(os.getenv('RENDER_POOL_WORKERS', '2'))
+    RENDER_POOL_MAX_QUEUE: int = int(os.getenv('RENDER_POOL_MAX_QUEUE', '32'))
+    RENDER_POOL_START_METHOD: str = os.getenv('RENDER_POOL_START_METHOD', 'spawn')
+    RENDER_TIMEOUT_SECONDS: float = float(os.getenv('RENDER_TIMEOUT_SECONDS', '60'))
+    RENDER_WORKER_MAX_JOBS: int = int(os.getenv('RENDER_WORKER_MAX_JOBS', '200'))
+    RENDER_WORKER_MAX_RSS_MB: int = int(os.getenv('RENDER_WORKER_MAX_RSS_MB', '768'))
+    
+    # HTTP Render Service
+    SERVER_HOST: str = os.getenv('SERVER_HOST', '127.0.0.1')
+    SERVER_PORT: int = int(os.getenv('SERVER_PORT', '8600'))
+    SERVER_MAX_BODY_MB: float = float(os.getenv('SERVER_MAX_BODY_MB', '5'))
+    SERVER_KEEPALIVE_SECONDS: float = float(os.getenv('SERVER_KEEPALIVE_SECONDS', '30'))
+    
+    # Profile Image (printed size in CSS px, matching .profile-pic in the stylesheet)
+    PROFILE_IMAGE_SIZE_PX: int = 120
+    PROFILE_IMAGE_DPI: int = 300
+    PROFILE_IMAGE_QUALITY: int = 85
     
     # UI Configuration
     PAGE_TITLE: str = "AI-Powered CV Generator"
@@ -46,6 +97,37 @@ class Settings:
         if self.SUPPORTED_LANGUAGES is None:
             self.SUPPORTED_LANGUAGES = ['en', 'fa']
         
+        if self.REMOTE_STYLESHEETS is None:
+            font_awesome = 'https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.4.0/css/all.min.css'
+            roboto = 'https://fonts.googleapis.com/css2?family=Roboto:wght@400;500;700&display=swap'
+            vazirmatn = 'https://fonts.googleapis.com/css2?family=Vazirmatn:wght@400;500;700&display=swap'
+            self.REMOTE_STYLESHEETS = {
+                'en': [font_awesome, roboto],
+                'fa': [font_awesome, roboto, vazirmatn]
+            }
+        
+        if self.TEMPLATE_VARIANTS is None:
+            self.TEMPLATE_VARIANTS = {'classic': self.TEMPLATE_FILE}
+        
+        if self.PDF_PROFILES is None:
+            # WeasyPrint options (full_fonts, hinting, uncompressed_pdf, optimize_images,
+            # jpeg_quality, dpi) plus image_dpi/image_quality for the profile picture
+            # and cache_images to share decoded images across renders
+            self.PDF_PROFILES = {
+                'standard': {},
+                'draft-fast': {
+                    'full_fonts': True, 'uncompressed_pdf': True,
+                    'image_dpi': 150, 'cache_images': True
+                },
+                'email-small': {
+                    'hinting': False, 'optimize_images': True, 'jpeg_quality': 70, 'dpi': 150,
+                    'image_dpi': 150, 'image_quality': 70, 'cache_images': True
+                },
+                'print-quality': {
+                    'hinting': True, 'image_dpi': 300, 'image_quality': 95, 'cache_images': True
+                },
+            }
+        
         if self.CV_SECTIONS is None:
             self.CV_SECTIONS = [
                 'personal', 'summary', 'skills', 'experience', 
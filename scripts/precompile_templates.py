@@ -0,0 +1,31 @@
+"""
+Precompile the CV templates into the Jinja2 bytecode cache.
+
+Run this as a build/deploy step so freshly started processes load compiled
+template code instead of compiling it on the first render:
+
+    python scripts/precompile_templates.py
+"""
+import os
+import sys
+from pathlib import Path
+
+# Make the project root importable when run as a script
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from config.settings import settings
+from src.core.template_cache import template_registry
+
+
+def main():
+    """Precompile all templates in the configured template directory."""
+    template_dir = os.path.dirname(settings.TEMPLATE_FILE)
+    timings = template_registry.precompile(template_dir)
+
+    for name, seconds in timings.items():
+        print(f"{name}: {seconds * 1000:.1f} ms")
+    print(f"Bytecode cache: {template_registry.bytecode_cache_dir}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,39 @@
+"""
+Download the remote fonts, stylesheets and webfonts used by the CV template
+into the local asset store so PDF rendering never needs the network:
+
+    python scripts/vendor_assets.py
+
+Commit or ship the resulting ``assets/vendor`` directory with the app, and set
+``ASSET_OFFLINE=true`` on hosts without network access.
+"""
+import os
+import sys
+from pathlib import Path
+
+# Make the project root importable when run as a script
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from config.settings import settings
+from src.core.assets import AssetStore, find_remote_urls, vendor_assets
+
+
+def main():
+    """Vendor every remote URL referenced by the configured template and stylesheet."""
+    urls = [url for lang_urls in settings.REMOTE_STYLESHEETS.values() for url in lang_urls]
+    stylesheet_file = os.path.splitext(settings.TEMPLATE_FILE)[0] + '.css'
+    for path in (settings.TEMPLATE_FILE, stylesheet_file):
+        with open(path, 'r', encoding='utf-8') as f:
+            urls.extend(find_remote_urls(f.read()))
+    urls = list(dict.fromkeys(urls))
+
+    store = AssetStore()
+    vendored = vendor_assets(urls, store)
+
+    print(f"Vendored {len(vendored)} assets into {store.root}")
+    for url in vendored:
+        print(f"  {url}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,379 @@
+"""
+Headless command-line interface for building CV PDFs:
+
+    python -m src data/ --lang en fa --output-dir build/cv
+
+Each input is either a JSON file holding a complete CV or a data directory
+with one JSON file per section (``<section>_<lang>.json``). Inputs are
+rendered in parallel on a render worker pool; outputs whose inputs, template,
+stylesheet, profile picture and assets are unchanged since the last build
+are skipped. With ``--bundle`` the PDFs are also packed into one ZIP archive.
+Run from the project root, like the Streamlit app.
+
+This module must not import Streamlit or LangChain.
+"""
+import argparse
+import hashlib
+import json
+import os
+import sys
+import time
+from typing import Dict, Any, List, Optional
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+from config.settings import settings  # noqa: E402
+
+MANIFEST_NAME = '.cv-build-manifest.json'
+
+
+class BuildTarget:
+    """One PDF to build: a CV source in one language."""
+
+    __slots__ = ('source', 'lang', 'output_name', 'input_files', 'is_directory')
+
+    def __init__(self, source: str, lang: str, output_name: str,
+                 input_files: List[str], is_directory: bool):
+        self.source = source
+        self.lang = lang
+        self.output_name = output_name
+        self.input_files = input_files
+        self.is_directory = is_directory
+
+    def load(self) -> Dict[str, Any]:
+        """Load the CV data of this target."""
+        from src.core.data_processor import DataProcessor
+
+        processor = DataProcessor(lang=self.lang)
+        if self.is_directory:
+            return processor.load_data_from_directory(self.source)
+        with open(self.source, 'rb') as f:
+            return processor.load_from_file(f.read())
+
+
+def _is_complete_cv(path: str) -> bool:
+    """Whether a JSON file holds a complete CV rather than a single section."""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return False
+    return isinstance(data, dict) and len(set(data) & set(settings.CV_SECTIONS)) >= 2
+
+
+def _language_suffix(stem: str) -> Optional[str]:
+    """Get the language encoded in a ``name_<lang>`` file stem, if any."""
+    for lang in settings.SUPPORTED_LANGUAGES:
+        if stem.endswith(f"_{lang}"):
+            return lang
+    return None
+
+
+def discover_targets(inputs: List[str], langs: List[str]) -> List[BuildTarget]:
+    """
+    Expand input paths into build targets.
+
+    A JSON file named ``<name>_<lang>.json`` is built in that language only;
+    other JSON files are built in every requested language. A directory is
+    built once per language that has section files in it; a directory whose
+    only file for a language is a complete CV (like ``data/sample``) is built
+    from that file.
+
+    Args:
+        inputs: JSON files and data directories
+        langs: Languages to build
+
+    Returns:
+        List of build targets
+
+    Raises:
+        FileNotFoundError: If an input does not exist
+        ValueError: If two targets would write the same output file
+    """
+    targets = []
+    for path in inputs:
+        path = os.path.normpath(path)
+        if os.path.isfile(path):
+            stem = os.path.splitext(os.path.basename(path))[0]
+            file_lang = _language_suffix(stem)
+            for lang in ([file_lang] if file_lang else langs):
+                if lang not in langs:
+                    continue
+                name = stem if file_lang else f"{stem}_{lang}"
+                targets.append(BuildTarget(path, lang, f"{name}.pdf", [path], False))
+        elif os.path.isdir(path):
+            base = os.path.basename(os.path.abspath(path))
+            for lang in langs:
+                files = [
+                    os.path.join(path, f"{section}_{lang}.json") for section in settings.CV_SECTIONS
+                ]
+                files = [f for f in files if os.path.isfile(f)]
+                if not files:
+                    continue
+                output_name = f"{base}_{lang}.pdf"
+                if len(files) == 1 and _is_complete_cv(files[0]):
+                    targets.append(BuildTarget(files[0], lang, output_name, files, False))
+                else:
+                    targets.append(BuildTarget(path, lang, output_name, files, True))
+        else:
+            raise FileNotFoundError(f"Input not found: {path}")
+
+    seen = {}
+    for target in targets:
+        if target.output_name in seen:
+            raise ValueError(
+                f"{seen[target.output_name]} and {target.source} would both be written "
+                f"to {target.output_name}"
+            )
+        seen[target.output_name] = target.source
+    return targets
+
+
+def _file_digest(path: Optional[str]) -> Optional[str]:
+    """SHA-256 of a file's content, or None if it does not exist."""
+    if not path or not os.path.isfile(path):
+        return None
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 16), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def build_environment_digest(options: Dict[str, Any]) -> str:
+    """
+    Fingerprint everything besides the CV data that affects the output.
+
+    The PDF profile is hashed by its resolved settings and the template
+    variant by its template and stylesheet paths and content, so editing
+    either in the settings invalidates the outputs built with it.
+
+    Args:
+        options: Render options passed to every job
+
+    Returns:
+        Hex digest
+    """
+    from importlib.metadata import PackageNotFoundError, version
+    from src.core.images import profile_images
+    from src.core.render_cache import RenderCache
+
+    variant = options.get('variant')
+    template_file = settings.TEMPLATE_VARIANTS[variant] if variant else settings.TEMPLATE_FILE
+    stylesheet_file = os.path.splitext(template_file)[0] + '.css'
+    profile = options.get('profile') or settings.PDF_PROFILE
+    profile_image = profile_images.find_profile_image()
+    # Read from the package metadata, so this process does not have to load WeasyPrint
+    try:
+        weasyprint_version = version('weasyprint')
+    except PackageNotFoundError:
+        weasyprint_version = None
+    return RenderCache.make_key(
+        template=[template_file, _file_digest(template_file)],
+        stylesheet=[stylesheet_file, _file_digest(stylesheet_file)],
+        profile_settings=settings.PDF_PROFILES.get(profile, {}),
+        image=_file_digest(str(profile_image) if profile_image else None),
+        image_settings=[settings.PROFILE_IMAGE_SIZE_PX, settings.PROFILE_IMAGE_DPI,
+                        settings.PROFILE_IMAGE_QUALITY],
+        remote_stylesheets=settings.REMOTE_STYLESHEETS,
+        assets=_file_digest(os.path.join(settings.ASSET_STORE_DIR, 'manifest.json')),
+        weasyprint=weasyprint_version,
+        deterministic=settings.PDF_DETERMINISTIC,
+        source_date_epoch=settings.PDF_SOURCE_DATE_EPOCH,
+        options=options
+    )
+
+
+def target_fingerprint(target: BuildTarget, environment_digest: str) -> str:
+    """Fingerprint a target's inputs together with the build environment."""
+    from src.core.render_cache import RenderCache
+
+    return RenderCache.make_key(
+        environment=environment_digest,
+        lang=target.lang,
+        inputs={os.path.basename(f): _file_digest(f) for f in target.input_files}
+    )
+
+
+def load_manifest(output_dir: str) -> Dict[str, Any]:
+    """Load the build manifest of an output directory."""
+    try:
+        with open(os.path.join(output_dir, MANIFEST_NAME), 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+        return manifest.get('outputs', {})
+    except (OSError, ValueError):
+        return {}
+
+
+def save_manifest(output_dir: str, outputs: Dict[str, Any]):
+    """Write the build manifest of an output directory atomically."""
+    from src.utils.file_utils import atomic_write
+
+    content = json.dumps({'version': 1, 'outputs': outputs}, indent=2, sort_keys=True)
+    atomic_write(os.path.join(output_dir, MANIFEST_NAME), content.encode('utf-8'))
+
+
+def write_bundle(bundle_path: str, output_dir: str, output_names: List[str]):
+    """Pack PDFs from the output directory into a ZIP archive, streaming each in chunks."""
+    from src.core.bundle import BundleWriter
+
+    with BundleWriter(bundle_path) as bundle:
+        for output_name in output_names:
+            bundle.add_file(output_name, os.path.join(output_dir, output_name))
+    print(f"  bundled    {bundle_path}  ({bundle.files} PDFs, {os.path.getsize(bundle_path) / 1024:.0f} KB)")
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Create the command-line argument parser."""
+    parser = argparse.ArgumentParser(
+        prog='python -m src',
+        description='Build CV PDFs from JSON data without the web interface.'
+    )
+    parser.add_argument(
+        'inputs', nargs='*', default=[settings.DATA_DIRECTORY],
+        help=f"JSON files or data directories to build (default: {settings.DATA_DIRECTORY})"
+    )
+    parser.add_argument(
+        '-l', '--lang', nargs='+', choices=settings.SUPPORTED_LANGUAGES,
+        default=settings.SUPPORTED_LANGUAGES, help='Languages to build (default: all)'
+    )
+    parser.add_argument(
+        '-o', '--output-dir', default='output', help='Directory for the PDFs (default: output)'
+    )
+    parser.add_argument(
+        '-j', '--workers', type=int, default=None,
+        help='Parallel render processes (default: number of CPU cores)'
+    )
+    parser.add_argument(
+        '-f', '--force', action='store_true', help='Rebuild all outputs, even unchanged ones'
+    )
+    parser.add_argument(
+        '-p', '--profile', choices=list(settings.PDF_PROFILES), default=settings.PDF_PROFILE,
+        help=f"PDF output profile (default: {settings.PDF_PROFILE})"
+    )
+    parser.add_argument(
+        '--variant', choices=list(settings.TEMPLATE_VARIANTS), default=None,
+        help='Template variant (default: the template in TEMPLATE_FILE)'
+    )
+    parser.add_argument(
+        '-b', '--bundle', metavar='ZIP',
+        help='Also pack the PDFs of all inputs into this ZIP archive'
+    )
+    parser.add_argument(
+        '--no-cache', action='store_true', help='Bypass the render cache'
+    )
+    parser.add_argument(
+        '-v', '--verbose', action='store_true', help='Show log messages from the renderer'
+    )
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Run the command-line interface.
+
+    Args:
+        argv: Command-line arguments. Defaults to sys.argv[1:]
+
+    Returns:
+        Process exit code: 0 on success, 1 if any build failed
+    """
+    args = build_parser().parse_args(argv)
+
+    # Quiet the renderer's INFO logging here and in the worker processes
+    if not args.verbose:
+        os.environ.setdefault('LOG_LEVEL', 'WARNING')
+
+    from src.core.batch import generate_many
+
+    start = time.perf_counter()
+    try:
+        targets = discover_targets(args.inputs, args.lang)
+    except (FileNotFoundError, ValueError) as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 1
+    if not targets:
+        print("Nothing to build: no CV data found for the requested languages.")
+        return 0
+
+    os.makedirs(args.output_dir, exist_ok=True)
+    options = {'profile': args.profile}
+    if args.variant:
+        options['variant'] = args.variant
+    if args.no_cache:
+        options['use_cache'] = False
+    environment_digest = build_environment_digest(options)
+    manifest = load_manifest(args.output_dir)
+
+    pending = []
+    skipped = 0
+    for target in targets:
+        fingerprint = target_fingerprint(target, environment_digest)
+        output_path = os.path.join(args.output_dir, target.output_name)
+        entry = manifest.get(target.output_name)
+        if (not args.force and entry and entry.get('fingerprint') == fingerprint
+                and os.path.isfile(output_path)):
+            skipped += 1
+            print(f"  unchanged  {output_path}")
+            continue
+        pending.append((target, fingerprint))
+
+    built = failed = 0
+    render_seconds = 0.0
+    submitted = []
+
+    def jobs():
+        nonlocal failed
+        for target, fingerprint in pending:
+            try:
+                cv_data = target.load()
+            except Exception as e:
+                failed += 1
+                manifest.pop(target.output_name, None)
+                print(f"  FAILED     {target.source}  {e}", file=sys.stderr)
+                continue
+            submitted.append((target, fingerprint))
+            # Workers write the PDFs straight to the output directory
+            output_path = os.path.join(args.output_dir, target.output_name)
+            yield cv_data, target.lang, dict(options, output_path=output_path)
+
+    if pending:
+        # A worker process per target at most: each one pays the full WeasyPrint start-up
+        workers = min(args.workers or os.cpu_count() or 1, len(pending))
+        for result in generate_many(jobs(), workers=workers):
+            target, fingerprint = submitted[result.index]
+            output_path = os.path.join(args.output_dir, target.output_name)
+            if result.ok:
+                manifest[target.output_name] = {
+                    'fingerprint': fingerprint,
+                    'source': target.source,
+                    'lang': target.lang,
+                }
+                built += 1
+                render_seconds += result.render_seconds or 0.0
+                print(
+                    f"  built      {output_path}  ({result.size / 1024:.0f} KB, "
+                    f"{(result.render_seconds or 0) * 1000:.0f} ms)"
+                )
+            else:
+                manifest.pop(target.output_name, None)
+                failed += 1
+                print(f"  FAILED     {output_path}  {result.error}", file=sys.stderr)
+        save_manifest(args.output_dir, manifest)
+
+    if args.bundle:
+        # Failed targets were dropped from the manifest; skip their stale outputs
+        write_bundle(args.bundle, args.output_dir,
+                     [target.output_name for target in targets if target.output_name in manifest])
+
+    elapsed = time.perf_counter() - start
+    summary = f"Built {built}, unchanged {skipped}, failed {failed} in {elapsed:.2f}s"
+    if built:
+        summary += (
+            f" (render {render_seconds:.2f}s total, {render_seconds / built * 1000:.0f} ms avg, "
+            f"{built / elapsed:.1f} PDFs/s)"
+        )
+    print(summary)
+    return 1 if failed else 0
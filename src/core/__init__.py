@@ -1,5 +1,19 @@
-from .cv_generator import CVGenerator
-from .ai_agent import CVAgent
 from .data_processor import DataProcessor
+from .batch import RenderResult, generate_languages, generate_many, generate_matrix
+from .bundle import BundleWriter, generate_bundle, zip_pdfs
+from .template_cache import TemplateRegistry, template_registry
 
-__all__ = ['CVGenerator', 'CVAgent', 'DataProcessor']
\ No newline at end of file
+__all__ = ['CVGenerator', 'CVAgent', 'DataProcessor', 'RenderResult', 'generate_many',
+           'generate_languages', 'generate_matrix', 'BundleWriter', 'generate_bundle', 'zip_pdfs',
+           'TemplateRegistry', 'template_registry']
+
+
+def __getattr__(name):
+    # The generator pulls in WeasyPrint and the AI agent LangChain; import them only when asked for
+    if name == 'CVGenerator':
+        from .cv_generator import CVGenerator
+        return CVGenerator
+    if name == 'CVAgent':
+        from .ai_agent import CVAgent
+        return CVAgent
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
@@ -0,0 +1,347 @@
+import hashlib
+import json
+import re
+import threading
+from collections import Counter, deque
+from pathlib import Path
+from typing import Dict, Any, Iterable, List, Optional, Tuple
+from urllib.parse import urljoin
+
+try:
+    from weasyprint.urls import URLFetcher, URLFetcherResponse
+except ImportError:  # WeasyPrint < 68 uses plain fetcher functions returning dicts
+    from weasyprint.urls import default_url_fetcher
+    URLFetcher = URLFetcherResponse = None
+
+from config.settings import settings
+from src.utils.exceptions import FileLoadError
+from src.utils.file_utils import atomic_write
+from src.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+# url(...) references and @import "..." rules inside fetched stylesheets
+CSS_URL_PATTERN = re.compile(r"""url\(\s*['"]?([^'")\s]+)['"]?\s*\)|@import\s+['"]([^'"]+)['"]""")
+
+# Schemes that are always resolved locally and never count as network traffic
+LOCAL_SCHEMES = ('data:', 'file:')
+
+_FetcherBase = URLFetcher if URLFetcher is not None else object
+
+
+def _make_response(url: str, body: bytes, mime_type: Optional[str]):
+    """Build a fetcher result in the format the installed WeasyPrint expects."""
+    if URLFetcherResponse is not None:
+        headers = {'Content-Type': mime_type} if mime_type else None
+        return URLFetcherResponse(url, body, headers)
+    return {'string': body, 'mime_type': mime_type, 'redirected_url': url}
+
+
+class AssetStore:
+    """
+    Content-addressed store of vendored remote assets (fonts, CSS, webfonts).
+
+    Blobs live under ``objects/<sha256[:2]>/<sha256>`` and ``manifest.json``
+    maps each original URL to its digest and MIME type, so identical files
+    fetched from different URLs are stored once.
+    """
+
+    def __init__(self, root: Optional[str] = None):
+        """
+        Initialize the store.
+
+        Args:
+            root: Store directory. Defaults to settings.ASSET_STORE_DIR
+        """
+        self.root = Path(root or settings.ASSET_STORE_DIR)
+        self.manifest_path = self.root / 'manifest.json'
+        self._lock = threading.Lock()
+        self._manifest: Optional[Dict[str, Dict[str, str]]] = None
+
+    def _load_manifest(self) -> Dict[str, Dict[str, str]]:
+        """Load the manifest on first use."""
+        if self._manifest is None:
+            try:
+                with open(self.manifest_path, 'r', encoding='utf-8') as f:
+                    self._manifest = json.load(f)
+                logger.info(f"Loaded asset manifest with {len(self._manifest)} entries")
+            except FileNotFoundError:
+                self._manifest = {}
+            except (OSError, json.JSONDecodeError) as e:
+                logger.error(f"Could not read asset manifest {self.manifest_path}: {e}")
+                self._manifest = {}
+        return self._manifest
+
+    def _blob_path(self, digest: str) -> Path:
+        return self.root / 'objects' / digest[:2] / digest
+
+    def lookup(self, url: str) -> Optional[Tuple[bytes, Optional[str]]]:
+        """
+        Get a vendored asset.
+
+        Args:
+            url: Original asset URL
+
+        Returns:
+            Tuple of (content, MIME type), or None if the URL is not vendored
+        """
+        with self._lock:
+            entry = self._load_manifest().get(url)
+        if entry is None:
+            return None
+
+        try:
+            with open(self._blob_path(entry['sha256']), 'rb') as f:
+                return f.read(), entry.get('mime_type')
+        except OSError as e:
+            logger.error(f"Vendored asset missing for {url}: {e}")
+            return None
+
+    def add(self, url: str, body: bytes, mime_type: Optional[str]) -> str:
+        """
+        Store an asset and record it in the manifest.
+
+        Args:
+            url: Original asset URL
+            body: Asset content
+            mime_type: MIME type reported when the asset was fetched
+
+        Returns:
+            SHA-256 digest of the stored content
+        """
+        digest = hashlib.sha256(body).hexdigest()
+        blob_path = self._blob_path(digest)
+        if not blob_path.exists():
+            blob_path.parent.mkdir(parents=True, exist_ok=True)
+            atomic_write(blob_path, body)
+
+        with self._lock:
+            manifest = self._load_manifest()
+            manifest[url] = {'sha256': digest, 'mime_type': mime_type}
+            atomic_write(
+                self.manifest_path,
+                json.dumps(manifest, indent=2, sort_keys=True).encode('utf-8')
+            )
+        return digest
+
+    def digest(self) -> str:
+        """
+        Get a digest identifying the exact set of vendored assets.
+
+        Returns:
+            Hex SHA-256 digest of the manifest (URLs and content digests)
+        """
+        with self._lock:
+            manifest = json.dumps(self._load_manifest(), sort_keys=True)
+        return hashlib.sha256(manifest.encode('utf-8')).hexdigest()
+
+    def urls(self) -> List[str]:
+        """Get all vendored URLs."""
+        with self._lock:
+            return sorted(self._load_manifest())
+
+
+class AssetFetcher(_FetcherBase):
+    """
+    WeasyPrint URL fetcher that serves assets from memory and the local store.
+
+    Lookups go through an in-memory layer, then the vendored AssetStore, and
+    only then fall through to the network. Every network fall-through is
+    counted per URL so missing vendored assets show up in the statistics.
+    With ``offline`` enabled the network is never used.
+    """
+
+    def __init__(self, store: Optional[AssetStore] = None, offline: Optional[bool] = None):
+        """
+        Initialize the fetcher.
+
+        Args:
+            store: Vendored asset store. Defaults to the store in settings.ASSET_STORE_DIR
+            offline: Refuse network fetches. Defaults to settings.ASSET_OFFLINE
+        """
+        super().__init__()
+        self.store = store or AssetStore()
+        self.offline = settings.ASSET_OFFLINE if offline is None else offline
+
+        self._lock = threading.Lock()
+        self._memory: Dict[str, Tuple[bytes, Optional[str], str]] = {}
+        self._memory_hits = 0
+        self._store_hits = 0
+        self._network_fetches = Counter()
+        self._blocked = Counter()
+
+    def fetch(self, url: str, headers: Optional[Dict[str, str]] = None):
+        """Fetch ``url`` for WeasyPrint."""
+        body, mime_type, final_url = self.get(url)
+        return _make_response(final_url, body, mime_type)
+
+    def __call__(self, url: str):
+        return self.fetch(url)
+
+    def get(self, url: str) -> Tuple[bytes, Optional[str], str]:
+        """
+        Resolve an asset through the memory layer, the store and the network.
+
+        Args:
+            url: Absolute asset URL
+
+        Returns:
+            Tuple of (content, MIME type, final URL)
+
+        Raises:
+            FileLoadError: If the asset is not available locally in offline mode
+        """
+        if url.startswith(LOCAL_SCHEMES):
+            return self._fetch_remote(url)
+
+        with self._lock:
+            cached = self._memory.get(url)
+            if cached is not None:
+                self._memory_hits += 1
+                return cached
+
+        stored = self.store.lookup(url)
+        if stored is not None:
+            resource = (stored[0], stored[1], url)
+            with self._lock:
+                self._memory[url] = resource
+                self._store_hits += 1
+            return resource
+
+        if self.offline:
+            with self._lock:
+                self._blocked[url] += 1
+            logger.warning(f"Asset not vendored, network disabled: {url}")
+            raise FileLoadError(f"Asset not available offline: {url}")
+
+        logger.warning(f"Asset not vendored, fetching from network: {url}")
+        resource = self._fetch_remote(url)
+        with self._lock:
+            self._network_fetches[url] += 1
+            self._memory[url] = resource
+        return resource
+
+    def _fetch_remote(self, url: str) -> Tuple[bytes, Optional[str], str]:
+        """Fetch ``url`` with WeasyPrint's default fetcher and read it fully."""
+        if URLFetcher is not None:
+            response = URLFetcher.fetch(self, url)
+            try:
+                return response.read(), response.content_type, response.url
+            finally:
+                response.close()
+
+        result = default_url_fetcher(url)
+        body = result.get('string')
+        if body is None:
+            file_obj = result['file_obj']
+            try:
+                body = file_obj.read()
+            finally:
+                file_obj.close()
+        if isinstance(body, str):
+            body = body.encode(result.get('encoding') or 'utf-8')
+        return body, result.get('mime_type'), result.get('redirected_url') or url
+
+    def register(self, url: str, body: bytes, mime_type: str):
+        """
+        Serve in-process content under ``url`` from the memory layer.
+
+        Args:
+            url: URL that templates reference
+            body: Content to serve
+            mime_type: MIME type of the content
+        """
+        with self._lock:
+            self._memory[url] = (body, mime_type, url)
+
+    def unregister(self, url: str):
+        """
+        Stop serving ``url`` from the memory layer.
+
+        Args:
+            url: URL previously passed to register()
+        """
+        with self._lock:
+            self._memory.pop(url, None)
+
+    def clear_memory(self):
+        """Drop the in-memory layer."""
+        with self._lock:
+            self._memory.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get fetcher statistics.
+
+        Returns:
+            Dictionary with memory/store hit counts and per-URL network fall-throughs
+        """
+        with self._lock:
+            return {
+                'memory_hits': self._memory_hits,
+                'store_hits': self._store_hits,
+                'network_fetches': sum(self._network_fetches.values()),
+                'network_urls': dict(self._network_fetches),
+                'blocked_urls': dict(self._blocked),
+                'memory_entries': len(self._memory),
+                'offline': self.offline,
+            }
+
+
+def find_remote_urls(text: str) -> List[str]:
+    """
+    Find absolute http(s) URLs referenced from HTML or CSS.
+
+    Args:
+        text: HTML or CSS source
+
+    Returns:
+        Unique URLs in order of appearance
+    """
+    urls = re.findall(r"""https?://[^'"()\s<>]+""", text)
+    return list(dict.fromkeys(urls))
+
+
+def vendor_assets(urls: Iterable[str], store: Optional[AssetStore] = None) -> List[str]:
+    """
+    Download assets into the store, following references inside stylesheets.
+
+    Args:
+        urls: Entry-point URLs (e.g. font and icon stylesheets)
+        store: Target store. Defaults to the store in settings.ASSET_STORE_DIR
+
+    Returns:
+        List of all URLs that were vendored
+    """
+    store = store or AssetStore()
+    fetcher = AssetFetcher(store=store, offline=False)
+
+    queue = deque(urls)
+    seen = set()
+    vendored = []
+    while queue:
+        url = queue.popleft()
+        if url in seen or url.startswith(LOCAL_SCHEMES):
+            continue
+        seen.add(url)
+
+        try:
+            body, mime_type, final_url = fetcher._fetch_remote(url)
+        except Exception as e:
+            logger.error(f"Could not vendor {url}: {e}")
+            continue
+        store.add(url, body, mime_type)
+        vendored.append(url)
+        logger.info(f"Vendored {url} ({len(body)} bytes)")
+
+        if mime_type == 'text/css':
+            css = body.decode('utf-8', errors='replace')
+            for match in CSS_URL_PATTERN.finditer(css):
+                reference = match.group(1) or match.group(2)
+                queue.append(urljoin(final_url, reference))
+
+    return vendored
+
+
+# Global fetcher shared by all renders in this process
+asset_fetcher = AssetFetcher()
@@ -0,0 +1,303 @@
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Dict, Any, Iterable, Iterator, Optional, Sequence, Tuple
+
+from config.settings import settings
+from src.core.data_processor import DataProcessor
+from src.core.render_pool import RenderFuture, RenderPool, get_render_pool
+from src.utils.exceptions import RenderQueueFullError
+from src.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+# How long to wait before resubmitting to a full shared queue with none of our jobs in flight (seconds)
+QUEUE_FULL_RETRY_INTERVAL = 0.05
+
+
+@dataclass
+class RenderResult:
+    """Outcome of one job of a batch render."""
+
+    index: int
+    lang: str
+    variant: Optional[str] = None
+    pdf_bytes: Optional[bytes] = None
+    output_path: Optional[str] = None
+    size: Optional[int] = None
+    error: Optional[Exception] = None
+    worker_pid: Optional[int] = None
+    queued_seconds: Optional[float] = None
+    render_seconds: Optional[float] = None
+    total_seconds: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        """Whether the job produced a PDF."""
+        return self.error is None and self.size is not None
+
+
+def _normalize_job(job: Sequence) -> tuple:
+    """Unpack a (cv_data, lang[, options]) job."""
+    if len(job) == 2:
+        cv_data, lang = job
+        options = {}
+    elif len(job) == 3:
+        cv_data, lang, options = job
+    else:
+        raise ValueError("Jobs must be (cv_data, lang) or (cv_data, lang, options) tuples")
+    return cv_data, lang, dict(options or {})
+
+
+def generate_many(jobs: Iterable[Sequence], ordered: bool = False,
+                  workers: Optional[int] = None, pool: Optional[RenderPool] = None,
+                  max_in_flight: Optional[int] = None) -> Iterator[RenderResult]:
+    """
+    Render many CVs in parallel and yield the results as they finish.
+
+    Jobs are fanned out over a pool of render worker processes; at most
+    ``max_in_flight`` are submitted at a time, so ``jobs`` may be a lazy
+    iterable of any length. A failing job is reported in its result and
+    does not stop the batch. When a shared pool's queue is full, the next
+    job waits for one of the batch's jobs to finish and is then resubmitted.
+    Closing the generator early cancels the batch's queued jobs and
+    interrupts its running ones (see RenderPool.cancel()).
+
+    Args:
+        jobs: Iterable of (cv_data, lang) or (cv_data, lang, options) tuples, where
+            options are keyword arguments for CVGenerator.generate_pdf_bytes, plus
+            an optional per-job ``timeout`` and ``output_path``. Jobs with an
+            output path are written to that file by the worker, and their
+            results carry the size instead of the PDF bytes
+        ordered: Yield results in job order instead of completion order
+        workers: Worker processes for a dedicated pool. Defaults to the CPU count
+        pool: Existing RenderPool to use instead of starting a dedicated one
+        max_in_flight: Maximum jobs submitted but not yet yielded. Defaults to four per worker
+
+    Yields:
+        RenderResult for every job
+    """
+    own_pool = pool is None
+    if own_pool:
+        workers = workers or os.cpu_count() or 1
+        pool = RenderPool(workers=workers, max_queue=max_in_flight or workers * 4)
+    max_in_flight = max_in_flight or min(pool.size * 4, pool.max_queue)
+
+    job_iter = enumerate(jobs)
+    in_flight: Dict[RenderFuture, tuple] = {}
+    finished: Dict[int, RenderResult] = {}
+    next_index = 0
+    exhausted = False
+    held = None  # Job turned away by a full queue, resubmitted before the next one
+    succeeded = failed = 0
+    batch_start = time.perf_counter()
+
+    def submit_more():
+        nonlocal exhausted, held
+        while not exhausted and len(in_flight) + len(finished) < max_in_flight:
+            if held is not None:
+                (index, job), held = held, None
+            else:
+                try:
+                    index, job = next(job_iter)
+                except StopIteration:
+                    exhausted = True
+                    return
+            submitted_at = time.perf_counter()
+            lang = options = None
+            try:
+                cv_data, lang, options = _normalize_job(job)
+                future = pool.submit(cv_data, lang, **options)
+            except RenderQueueFullError:
+                # Other clients of a shared pool fill its queue: retry once a job
+                # of this batch has finished, or after a short pause if none is running
+                held = (index, job)
+                if in_flight:
+                    return
+                time.sleep(QUEUE_FULL_RETRY_INTERVAL)
+                continue
+            except Exception as e:
+                variant = options.get('variant') if options else None
+                finished[index] = RenderResult(index=index, lang=lang, variant=variant, error=e)
+                continue
+            in_flight[future] = (index, lang, options.get('variant'), options.get('output_path'),
+                                 submitted_at)
+
+    def collect(future: RenderFuture) -> RenderResult:
+        index, lang, variant, output_path, submitted_at = in_flight.pop(future)
+        result = RenderResult(
+            index=index, lang=lang, variant=variant, output_path=output_path,
+            worker_pid=future.worker_pid,
+            queued_seconds=future.queued_seconds,
+            render_seconds=future.render_seconds,
+            total_seconds=time.perf_counter() - submitted_at
+        )
+        try:
+            output = future.result()
+        except Exception as e:
+            result.error = e
+        else:
+            if output_path:
+                result.size = output
+            else:
+                result.pdf_bytes, result.size = output, len(output)
+        return result
+
+    try:
+        if own_pool:
+            pool.start()
+        submit_more()
+        while in_flight or finished:
+            ready = [index for index in finished if not ordered or index == next_index]
+            if not ready:
+                done, _ = wait(list(in_flight), return_when=FIRST_COMPLETED)
+                for future in done:
+                    result = collect(future)
+                    finished[result.index] = result
+                continue
+
+            for index in sorted(ready):
+                result = finished.pop(index)
+                next_index = index + 1
+                if result.ok:
+                    succeeded += 1
+                else:
+                    failed += 1
+                    logger.warning(f"Batch job {index} ({result.lang}) failed: {result.error}")
+                yield result
+                if ordered:
+                    break
+            submit_more()
+    finally:
+        # Closed early by the caller: drop queued jobs and stop the running ones
+        for future in list(in_flight):
+            pool.cancel(future)
+        if own_pool:
+            pool.shutdown()
+        logger.info(
+            f"Batch finished: {succeeded} succeeded, {failed} failed "
+            f"in {time.perf_counter() - batch_start:.2f}s"
+        )
+
+
+def _render_in_process(index: int, cv_data: Dict[str, Any], lang: str,
+                       options: Dict[str, Any]) -> RenderResult:
+    """Render one job in this process, reporting a failure in the result."""
+    from src.core.cv_generator import CVGenerator
+
+    start = time.perf_counter()
+    # Like the pool workers, pick the template variant with the generator, not a render option
+    variant = options.pop('variant', None)
+    result = RenderResult(index=index, lang=lang, variant=variant)
+    try:
+        pdf_bytes = CVGenerator(lang=lang, variant=variant).generate_pdf_bytes(cv_data, **options)
+        result.pdf_bytes, result.size = pdf_bytes, len(pdf_bytes)
+    except Exception as e:
+        logger.warning(f"Batch job {index} ({lang}) failed: {e}")
+        result.error = e
+    result.render_seconds = result.total_seconds = time.perf_counter() - start
+    return result
+
+
+def generate_languages(cv_data_by_lang: Dict[str, Dict[str, Any]],
+                       pool: Optional[RenderPool] = None,
+                       **options: Any) -> Dict[str, RenderResult]:
+    """
+    Render a CV in several languages at once.
+
+    Renders run on the worker pool when one is given or the shared pool is
+    enabled. Otherwise they run on threads of this process, which share its
+    warm template, stylesheet and font caches; starting worker processes
+    for a handful of renders would cost more than it saves. WeasyPrint's
+    layout is pure Python and holds the GIL, so the threads only overlap
+    file access, text shaping and PDF compression: the languages take
+    nearly as long as rendering them one after another. Enable the render
+    pool for truly parallel renders.
+
+    Args:
+        cv_data_by_lang: CV data per language code, e.g. from
+            DataProcessor.load_languages_from_directory()
+        pool: Worker pool to use. Defaults to the shared pool when
+            settings.RENDER_POOL_ENABLED is set
+        **options: Keyword arguments for CVGenerator.generate_pdf_bytes, plus an
+            optional template ``variant``, used for every language
+
+    Returns:
+        RenderResult per language code, in the order given
+    """
+    if pool is None and settings.RENDER_POOL_ENABLED:
+        pool = get_render_pool()
+    jobs = [(cv_data, lang, options) for lang, cv_data in cv_data_by_lang.items()]
+    if pool is not None:
+        results = generate_many(jobs, ordered=True, pool=pool)
+        return {result.lang: result for result in results}
+    if not jobs:
+        return {}
+
+    with ThreadPoolExecutor(max_workers=len(jobs), thread_name_prefix='render-language') as executor:
+        futures = [
+            executor.submit(_render_in_process, index, cv_data, lang, dict(options))
+            for index, (cv_data, lang, _) in enumerate(jobs)
+        ]
+        results = [future.result() for future in futures]
+    return {result.lang: result for result in results}
+
+
+def generate_matrix(cv_data_by_lang: Dict[str, Dict[str, Any]],
+                    variants: Optional[Sequence[str]] = None,
+                    pool: Optional[RenderPool] = None,
+                    **options: Any) -> Dict[Tuple[str, str], RenderResult]:
+    """
+    Render a CV in every combination of template variant and language.
+
+    Each language's data is preprocessed once and shared by all variants.
+    The renders run in parallel on worker processes, each of which loads the
+    fonts, profile picture and assets once and reuses them for every
+    variant. Render time and size are logged for every variant.
+
+    Args:
+        cv_data_by_lang: CV data per language code, e.g. from
+            DataProcessor.load_languages_from_directory()
+        variants: Names in settings.TEMPLATE_VARIANTS. Defaults to all variants
+        pool: Worker pool to use. Defaults to the shared pool when
+            settings.RENDER_POOL_ENABLED is set, otherwise a dedicated pool
+            with up to one worker per CPU core
+        **options: Keyword arguments for CVGenerator.generate_pdf_bytes, used for every render
+
+    Returns:
+        RenderResult per (variant, language code), in the order given
+
+    Raises:
+        ValueError: If a variant does not exist
+    """
+    variants = list(variants or settings.TEMPLATE_VARIANTS)
+    unknown = [variant for variant in variants if variant not in settings.TEMPLATE_VARIANTS]
+    if unknown:
+        raise ValueError(
+            f"Unknown template variant(s): {', '.join(unknown)}. "
+            f"Available: {', '.join(settings.TEMPLATE_VARIANTS)}"
+        )
+
+    processed = {
+        lang: DataProcessor(lang=lang).preprocess_data(cv_data)
+        for lang, cv_data in cv_data_by_lang.items()
+    }
+    jobs = [
+        (processed_data, lang, dict(options, variant=variant, preprocessed=True))
+        for variant in variants for lang, processed_data in processed.items()
+    ]
+
+    if pool is None and settings.RENDER_POOL_ENABLED:
+        pool = get_render_pool()
+    workers = min(len(jobs), os.cpu_count() or 1)
+    results = {}
+    for result in generate_many(jobs, ordered=True, workers=workers, pool=pool):
+        results[(result.variant, result.lang)] = result
+        if result.ok:
+            logger.info(
+                f"Variant '{result.variant}' ({result.lang}): {result.size / 1024:.0f} KB "
+                f"in {result.render_seconds:.2f}s"
+            )
+    return results
+
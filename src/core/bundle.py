@@ -0,0 +1,220 @@
+import contextlib
+import os
+import shutil
+import tempfile
+import zipfile
+from io import BytesIO
+from typing import Dict, BinaryIO, Iterable, List, Optional, Sequence, Tuple, Union
+
+from config.settings import settings
+from src.core.batch import RenderResult, _normalize_job, generate_many
+from src.core.render_pool import RenderPool, get_render_pool
+from src.utils.file_utils import atomic_open
+from src.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+# Fixed entry timestamp (the earliest a ZIP can hold), so identical PDFs give identical archives
+_ZIP_DATE_TIME = (1980, 1, 1, 0, 0, 0)
+
+# Read size when copying PDFs from disk into the archive
+_COPY_CHUNK_SIZE = 1 << 16
+
+
+class _DiscardableStream:
+    """Forwards writes to a binary stream until discarded, then drops them."""
+
+    def __init__(self, stream: BinaryIO):
+        self.stream = stream
+        self.discarded = False
+
+    def write(self, data: bytes) -> int:
+        if not self.discarded:
+            self.stream.write(data)
+        return len(data)
+
+    def flush(self):
+        if not self.discarded:
+            self.stream.flush()
+
+    # zipfile rewrites entry headers on seekable targets; streams without tell() are written sequentially
+    def tell(self) -> int:
+        return self.stream.tell()
+
+    def seek(self, *args) -> int:
+        return self.stream.seek(*args)
+
+
+class BundleWriter:
+    """
+    Streams PDFs into a ZIP archive as they are produced.
+
+    The archive is written straight to its target: a file path, which is
+    replaced atomically when the bundle is closed, or any binary file-like
+    object, including non-seekable ones such as sockets and HTTP responses.
+    PDFs already on disk are copied in small chunks, so memory use stays
+    flat however large the bundle grows. PDFs are compressed already and are
+    stored as is.
+
+    Use it as a context manager; an exception inside the block discards a
+    bundle written to a path.
+    """
+
+    def __init__(self, target: Union[str, os.PathLike, BinaryIO]):
+        """
+        Open the bundle for writing.
+
+        Args:
+            target: Output file path or binary file-like object
+        """
+        self.target = target
+        self.files = 0
+        self.bytes_added = 0
+        self._names = set()
+        self._exit_stack = contextlib.ExitStack()
+        stream = target if hasattr(target, 'write') else self._exit_stack.enter_context(atomic_open(target))
+        self._stream = _DiscardableStream(stream)
+        self._archive = zipfile.ZipFile(self._stream, 'w', zipfile.ZIP_STORED)
+
+    def _entry(self, name: str, size: int) -> zipfile.ZipInfo:
+        """Create the archive entry for a new file, rejecting duplicate names."""
+        if name in self._names:
+            raise ValueError(f"Duplicate file name in bundle: {name}")
+        self._names.add(name)
+        info = zipfile.ZipInfo(name, date_time=_ZIP_DATE_TIME)
+        info.file_size = size
+        return info
+
+    def add(self, name: str, pdf_bytes: bytes):
+        """
+        Add a PDF held in memory.
+
+        Args:
+            name: File name inside the archive
+            pdf_bytes: PDF content
+        """
+        self._archive.writestr(self._entry(name, len(pdf_bytes)), pdf_bytes)
+        self.files += 1
+        self.bytes_added += len(pdf_bytes)
+
+    def add_file(self, name: str, path: Union[str, os.PathLike]):
+        """
+        Copy a PDF from disk into the archive in chunks.
+
+        Args:
+            name: File name inside the archive
+            path: Path of the PDF
+        """
+        size = os.path.getsize(path)
+        with open(path, 'rb') as source, self._archive.open(self._entry(name, size), 'w') as entry:
+            shutil.copyfileobj(source, entry, _COPY_CHUNK_SIZE)
+        self.files += 1
+        self.bytes_added += size
+
+    def close(self):
+        """Finish the archive and, for a path target, move it into place."""
+        self._archive.close()
+        self._exit_stack.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        else:
+            # Close the archive without writing its directory to the target, and
+            # remove a path target's temporary file
+            self._stream.discarded = True
+            try:
+                with contextlib.suppress(ValueError, OSError):
+                    self._archive.close()
+            finally:
+                self._exit_stack.__exit__(exc_type, exc, tb)
+        return False
+
+
+def zip_pdfs(pdfs: Dict[str, bytes]) -> bytes:
+    """
+    Pack PDFs held in memory into a ZIP archive.
+
+    Entries carry a fixed timestamp, so identical PDFs always produce an
+    identical archive.
+
+    Args:
+        pdfs: PDF content by file name
+
+    Returns:
+        ZIP archive as bytes
+    """
+    buffer = BytesIO()
+    with BundleWriter(buffer) as bundle:
+        for name, pdf_bytes in pdfs.items():
+            bundle.add(name, pdf_bytes)
+    return buffer.getvalue()
+
+
+def generate_bundle(jobs: Iterable[Tuple[str, Sequence]],
+                    target: Union[str, os.PathLike, BinaryIO],
+                    workers: Optional[int] = None,
+                    pool: Optional[RenderPool] = None,
+                    spool_dir: Optional[str] = None) -> List[RenderResult]:
+    """
+    Render many CVs in parallel and stream them into one ZIP archive.
+
+    Workers write each PDF to a spool file, which is copied into the archive
+    as soon as its render finishes and then deleted. PDFs never pass through
+    this process's memory, and at most one spool file per job in flight
+    exists at a time. A failing job is left out of the archive and reported
+    in its result.
+
+    Args:
+        jobs: Iterable of (file name in the archive, job) pairs, where each job
+            is a (cv_data, lang) or (cv_data, lang, options) tuple as for generate_many
+        target: Output file path or binary file-like object
+        workers: Worker processes for a dedicated pool. Defaults to the CPU count,
+            capped at the number of jobs when ``jobs`` has a length
+        pool: Worker pool to use. Defaults to the shared pool when
+            settings.RENDER_POOL_ENABLED is set, otherwise a dedicated pool
+        spool_dir: Directory for the spool files. Defaults to the system temp directory
+
+    Returns:
+        RenderResult of every job, in job order; successful results carry the size only
+    """
+    if pool is None and settings.RENDER_POOL_ENABLED:
+        pool = get_render_pool()
+    if pool is None and workers is None:
+        workers = os.cpu_count() or 1
+        if hasattr(jobs, '__len__'):
+            workers = max(1, min(len(jobs), workers))
+
+    names: List[str] = []
+    results: Dict[int, RenderResult] = {}
+
+    with tempfile.TemporaryDirectory(prefix='cv-bundle-', dir=spool_dir) as spool, \
+            BundleWriter(target) as bundle:
+
+        def spooled_jobs():
+            for name, job in jobs:
+                cv_data, lang, options = _normalize_job(job)
+                options['output_path'] = os.path.join(spool, f"{len(names)}.pdf")
+                names.append(name)
+                yield cv_data, lang, options
+
+        for result in generate_many(spooled_jobs(), workers=workers, pool=pool):
+            if result.ok:
+                try:
+                    bundle.add_file(names[result.index], result.output_path)
+                except (OSError, ValueError) as e:
+                    result.error = e
+            if result.output_path and os.path.exists(result.output_path):
+                os.remove(result.output_path)
+            result.output_path = None
+            results[result.index] = result
+
+    succeeded = sum(1 for result in results.values() if result.ok)
+    logger.info(
+        f"Bundle written: {succeeded} of {len(results)} PDFs, "
+        f"{bundle.bytes_added / (1024 * 1024):.2f} MB"
+    )
+    return [results[index] for index in sorted(results)]
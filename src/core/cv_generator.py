@@ -1,43 +1,313 @@
+import asyncio
+import functools
+import math
 import os
-from typing import Dict, Any, Optional
-import base64
-from pathlib import Path
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import Dict, Any, BinaryIO, List, Optional, Tuple, Union
 
-from jinja2 import Environment, FileSystemLoader
-from weasyprint import HTML
+from weasyprint import CSS, DEFAULT_OPTIONS as WEASYPRINT_OPTIONS, HTML, __version__ as WEASYPRINT_VERSION
 
 from config.settings import settings
+from src.core.assets import asset_fetcher
 from src.core.data_processor import DataProcessor
-from src.utils.exceptions import TemplateNotFoundError, PDFGenerationError
+from src.core.images import ProcessedImage, profile_images
+from src.core.large_cv import chunk_page_css, split_into_chunks
+from src.core.render_cache import render_cache
+from src.core.render_pool import RenderPool, get_render_pool
+from src.core.stylesheets import stylesheet_cache
+from src.core.template_cache import template_registry
+from src.utils.exceptions import (
+    CVGeneratorException, DataValidationError, TemplateNotFoundError, PDFGenerationError,
+    RenderTimeoutError
+)
+from src.utils.file_utils import atomic_open
 from src.utils.logger import setup_logger
 
 logger = setup_logger(__name__)
 
 
+# Appended to the stylesheet of HTML previews: shows the body as an A4 page
+# with WeasyPrint's default margins. Screen only, so printing is unaffected.
+_SCREEN_PAGE_CSS = """
+@media screen {
+    html { background: #d9d9d9; }
+    body { box-sizing: border-box; width: 210mm; min-height: 297mm; margin: 16px auto; padding: 75px; }
+}
+"""
+
+
+class ImageCache:
+    """
+    Bounded image cache shared by renders whose PDF profile sets cache_images.
+
+    WeasyPrint keeps decoded images and their encoded data in a dict, and a
+    laid-out document reads that data back from the dict when it is written,
+    so single entries cannot be evicted safely. Instead, once the dict holds
+    more than ``max_bytes`` of image data, renders that start afterwards get
+    a fresh dict. The old one is freed with the last document using it.
+    """
+
+    def __init__(self, max_bytes: Optional[int] = None):
+        """
+        Initialize the cache.
+
+        Args:
+            max_bytes: Image data after which a new dict is started. Defaults to settings.PDF_IMAGE_CACHE_MB
+        """
+        if max_bytes is None:
+            max_bytes = int(settings.PDF_IMAGE_CACHE_MB * 1024 * 1024)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._images: Dict[str, Any] = {}
+        self._resets = 0
+
+    def _size(self) -> int:
+        """Bytes of image data in the current dict. Caller holds the lock."""
+        # list() copies the values atomically while renders may be adding to the dict
+        return sum(len(value) for value in list(self._images.values()) if isinstance(value, bytes))
+
+    def get(self) -> Dict[str, Any]:
+        """
+        Get the dict to pass as WeasyPrint's ``cache`` option for a new render.
+
+        Returns:
+            The shared dict, replaced by an empty one if it has outgrown max_bytes
+        """
+        with self._lock:
+            if self._size() > self.max_bytes:
+                self._images = {}
+                self._resets += 1
+            return self._images
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get image cache statistics.
+
+        Returns:
+            Dictionary with the entries and bytes of the current dict and the number of resets
+        """
+        with self._lock:
+            return {
+                'entries': len(self._images),
+                'bytes': self._size(),
+                'max_bytes': self.max_bytes,
+                'resets': self._resets,
+            }
+
+
+# Decoded images shared by renders whose PDF profile sets cache_images
+image_cache = ImageCache()
+
+
+def _render_error(message: str, error: Exception) -> CVGeneratorException:
+    """Wrap a render failure, keeping failures caused by the CV data a DataValidationError."""
+    if isinstance(error, DataValidationError):
+        return DataValidationError(f"{message}: {error}")
+    return PDFGenerationError(f"{message}: {error}")
+
+
+class _CountingWriter:
+    """Forwards writes to a binary stream and counts the bytes written."""
+
+    def __init__(self, stream: BinaryIO):
+        self.stream = stream
+        self.size = 0
+
+    def write(self, data: bytes) -> int:
+        self.stream.write(data)
+        self.size += len(data)
+        return len(data)
+
+
+class _RenderInputs:
+    """Everything a render depends on, prepared from the CV data."""
+
+    __slots__ = ('processed_data', 'profile_image', 'stylesheet_entry',
+                 'deterministic', 'document_date', 'cache_key', 'profile', 'options')
+
+    def __init__(self, processed_data: Dict[str, Any], profile_image: Optional[ProcessedImage],
+                 stylesheet_entry, deterministic: bool, document_date: Optional[str],
+                 cache_key: str, profile: str, options: Dict[str, Any]):
+        self.processed_data = processed_data
+        self.profile_image = profile_image
+        self.stylesheet_entry = stylesheet_entry
+        self.deterministic = deterministic
+        self.document_date = document_date
+        self.cache_key = cache_key
+        self.profile = profile
+        # WeasyPrint layout and PDF options of the profile
+        self.options = options
+
+
+class PdfPreview:
+    """PDF of selected pages of a CV, for on-screen preview."""
+
+    __slots__ = ('pdf_bytes', 'page_count', 'first_page', 'last_page', 'cache_key')
+
+    def __init__(self, pdf_bytes: bytes, page_count: int, first_page: int, last_page: int,
+                 cache_key: Optional[str] = None):
+        self.pdf_bytes = pdf_bytes
+        self.page_count = page_count
+        self.first_page = first_page
+        self.last_page = last_page
+        # Render cache key of the laid-out document, see CVGenerator.has_cached_layout()
+        self.cache_key = cache_key
+
+
+class FitResult:
+    """PDF of a CV scaled to fit a number of pages, with the search statistics."""
+
+    __slots__ = ('pdf_bytes', 'scale', 'page_count', 'fits', 'passes', 'seconds')
+
+    def __init__(self, pdf_bytes: bytes, scale: float, page_count: int, fits: bool,
+                 passes: int, seconds: float):
+        self.pdf_bytes = pdf_bytes
+        self.scale = scale
+        self.page_count = page_count
+        self.fits = fits
+        self.passes = passes
+        self.seconds = seconds
+
+
+class LayoutCache:
+    """
+    Small LRU of laid-out WeasyPrint documents keyed by render cache key.
+
+    Laid-out documents are large, so only a few recent ones are kept: enough
+    to write the full PDF after a preview without a second layout.
+    """
+
+    def __init__(self, max_entries: Optional[int] = None):
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Number of documents to keep. Defaults to settings.PREVIEW_LAYOUT_CACHE_SIZE
+        """
+        self.max_entries = settings.PREVIEW_LAYOUT_CACHE_SIZE if max_entries is None else max_entries
+        self._lock = threading.Lock()
+        self._documents: OrderedDict = OrderedDict()
+
+    def get(self, key: str):
+        with self._lock:
+            document = self._documents.get(key)
+            if document is not None:
+                self._documents.move_to_end(key)
+            return document
+
+    def put(self, key: str, document):
+        with self._lock:
+            self._documents[key] = document
+            self._documents.move_to_end(key)
+            while len(self._documents) > self.max_entries:
+                self._documents.popitem(last=False)
+
+    def pop(self, key: str):
+        with self._lock:
+            return self._documents.pop(key, None)
+
+    def __contains__(self, key: str) -> bool:
+        with self._lock:
+            return key in self._documents
+
+    def clear(self):
+        with self._lock:
+            self._documents.clear()
+
+
+# Global layout cache shared by all CVGenerator instances
+layout_cache = LayoutCache()
+
+
+class RenderStats:
+    """Output size and render time per PDF profile, for comparing profiles."""
+
+    def __init__(self):
+        """Initialize empty statistics."""
+        self._lock = threading.Lock()
+        self._profiles: Dict[str, Dict[str, float]] = {}
+
+    def record(self, profile: str, size: int, seconds: float):
+        """
+        Record a finished render.
+
+        Args:
+            profile: PDF profile name
+            size: PDF size in bytes
+            seconds: Render time
+        """
+        with self._lock:
+            entry = self._profiles.setdefault(
+                profile, {'renders': 0, 'bytes': 0, 'seconds': 0.0, 'last_bytes': 0, 'last_seconds': 0.0}
+            )
+            entry['renders'] += 1
+            entry['bytes'] += size
+            entry['seconds'] += seconds
+            entry['last_bytes'] = size
+            entry['last_seconds'] = seconds
+
+    def clear(self):
+        with self._lock:
+            self._profiles.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get per-profile statistics.
+
+        Returns:
+            Dictionary mapping profile names to render counts, average and last size and time
+        """
+        with self._lock:
+            return {
+                profile: {
+                    'renders': int(entry['renders']),
+                    'avg_kb': entry['bytes'] / entry['renders'] / 1024,
+                    'avg_seconds': entry['seconds'] / entry['renders'],
+                    'last_kb': entry['last_bytes'] / 1024,
+                    'last_seconds': entry['last_seconds'],
+                }
+                for profile, entry in self._profiles.items()
+            }
+
+
+# Global render statistics of this process (cache hits are not counted)
+render_stats = RenderStats()
+
+
 class CVGenerator:
     """
     Generates CV PDFs from JSON data using HTML templates and WeasyPrint.
     Supports both English (LTR) and Farsi (RTL) languages.
     """
 
-    def __init__(self, lang: str = 'en', template_path: str = None):
+    def __init__(self, lang: str = 'en', template_path: str = None, variant: Optional[str] = None):
         """
         Initialize the CV Generator.
 
         Args:
             lang: Language code ('en' for English, 'fa' for Farsi)
-            template_path: Path to template directory. Defaults to settings.TEMPLATE_FILE
+            template_path: Path to template directory. Defaults to the directory of the template
+            variant: Name of a template variant in settings.TEMPLATE_VARIANTS.
+                Defaults to settings.TEMPLATE_FILE
             
         Raises:
-            ValueError: If language is not supported
+            ValueError: If language or template variant is not supported
             TemplateNotFoundError: If template file cannot be loaded
         """
         if lang not in settings.SUPPORTED_LANGUAGES:
             raise ValueError(f"Language must be one of {settings.SUPPORTED_LANGUAGES}")
         
         self.lang = lang
-        self.template_path = template_path or os.path.dirname(settings.TEMPLATE_FILE)
-        self.template_name = os.path.basename(settings.TEMPLATE_FILE)
+        self.variant = variant
+        template_file = self._resolve_variant(variant)
+        self.template_path = template_path or os.path.dirname(template_file)
+        self.template_name = os.path.basename(template_file)
+        self.stylesheet_path = os.path.join(
+            self.template_path, os.path.splitext(self.template_name)[0] + '.css'
+        )
         
         # Initialize data processor for preprocessing
         self.data_processor = DataProcessor(lang=lang)
@@ -45,88 +315,711 @@ class CVGenerator:
         # Set up Jinja2 template engine
         self._setup_template_engine()
 
+    @staticmethod
+    def _resolve_variant(variant: Optional[str]) -> str:
+        """
+        Look up the template file of a template variant.
+
+        Args:
+            variant: Variant name, or None for settings.TEMPLATE_FILE
+
+        Returns:
+            Path of the template file
+
+        Raises:
+            ValueError: If the variant does not exist
+        """
+        if variant is None:
+            return settings.TEMPLATE_FILE
+        if variant not in settings.TEMPLATE_VARIANTS:
+            raise ValueError(
+                f"Unknown template variant '{variant}'. "
+                f"Available: {', '.join(settings.TEMPLATE_VARIANTS)}"
+            )
+        return settings.TEMPLATE_VARIANTS[variant]
+
     def _setup_template_engine(self):
-        """Set up Jinja2 environment and load template."""
+        """Load the compiled template from the shared template registry."""
         try:
-            self.env = Environment(loader=FileSystemLoader(self.template_path))
-            self.template = self.env.get_template(self.template_name)
+            self.template = template_registry.get_template(self.template_path, self.template_name)
+            self.env = self.template.environment
             logger.info(f"Template loaded successfully: {self.template_name}")
+        except TemplateNotFoundError:
+            raise
         except Exception as e:
             logger.error(f"Error loading template {self.template_name}: {e}")
             raise TemplateNotFoundError(f"Could not load template: {e}")
 
-    def _get_profile_image_base64(self) -> str:
+    def _refresh_template(self):
+        """Pick up template edits made on disk since this generator was created."""
+        entry = template_registry.get_entry(self.template_path, self.template_name)
+        self.template = entry.template
+        self.env = self.template.environment
+        self.template_digest = entry.digest
+
+    def _render_cache_key(self, processed_data: Dict[str, Any],
+                          profile_image: Optional[ProcessedImage],
+                          stylesheet_digest: str, **options: Any) -> str:
+        """Build the render cache key from everything that affects the PDF."""
+        return render_cache.make_key(
+            data=processed_data,
+            lang=self.lang,
+            template=self.template_digest,
+            stylesheet=stylesheet_digest,
+            image=profile_image.digest if profile_image else None,
+            assets=asset_fetcher.store.digest(),
+            weasyprint=WEASYPRINT_VERSION,
+            options=options
+        )
+
+    @staticmethod
+    def _resolve_profile(profile: Optional[str]) -> Tuple[str, Dict[str, Any]]:
         """
-        Load profile picture, with a fallback to a default image.
-        Looks for 'profile.jpg' first, then 'default_profile_pic.jpg'.
+        Look up a PDF profile.
+
+        Args:
+            profile: Profile name. Defaults to settings.PDF_PROFILE
+
+        Returns:
+            Tuple of (profile name, profile settings)
+
+        Raises:
+            ValueError: If the profile does not exist
         """
-        assets_dir = Path(settings.PROJECT_ROOT) / 'assets'
-        primary_pic_path = assets_dir / 'profile.jpg'
-        default_pic_path = assets_dir / 'default_profile_pic.jpg'
+        profile = profile or settings.PDF_PROFILE
+        if profile not in settings.PDF_PROFILES:
+            raise ValueError(
+                f"Unknown PDF profile '{profile}'. Available: {', '.join(settings.PDF_PROFILES)}"
+            )
+        return profile, settings.PDF_PROFILES[profile]
 
-        image_path_to_load = None
-        if primary_pic_path.exists():
-            image_path_to_load = primary_pic_path
-            logger.info(f"Found primary profile picture: {primary_pic_path}")
-        elif default_pic_path.exists():
-            image_path_to_load = default_pic_path
-            logger.info(f"Using default profile picture: {default_pic_path}")
+    @staticmethod
+    def _weasyprint_options(profile: Dict[str, Any]) -> Dict[str, Any]:
+        """Translate profile settings into the options this WeasyPrint version supports."""
+        options = {}
+        for key, value in profile.items():
+            if key in WEASYPRINT_OPTIONS:
+                options[key] = value
+            elif key not in ('image_dpi', 'image_quality', 'cache_images'):
+                logger.warning(f"Ignoring PDF profile option unsupported by WeasyPrint: {key}")
+        if profile.get('cache_images') and 'cache' in WEASYPRINT_OPTIONS:
+            options['cache'] = image_cache.get()
+        return options
 
-        if image_path_to_load:
-            try:
-                with open(image_path_to_load, "rb") as img_file:
-                    return base64.b64encode(img_file.read()).decode("utf-8")
-            except Exception as e:
-                logger.error(f"Could not read or encode image file {image_path_to_load}: {e}")
-        
-        logger.warning("No profile picture found (neither profile.jpg nor default_profile_pic.jpg).")
-        return ""
+    @staticmethod
+    def _get_document_date(deterministic: bool) -> Optional[str]:
+        """
+        Get the W3C date stamped into the PDF metadata.
+
+        Deterministic renders use SOURCE_DATE_EPOCH when set and omit the
+        dates otherwise; regular renders record the current time.
+        """
+        if deterministic:
+            if not settings.PDF_SOURCE_DATE_EPOCH:
+                return None
+            timestamp = datetime.fromtimestamp(int(settings.PDF_SOURCE_DATE_EPOCH), timezone.utc)
+        else:
+            timestamp = datetime.now(timezone.utc)
+        return timestamp.strftime('%Y-%m-%dT%H:%M:%SZ')
 
-    def generate_pdf_bytes(self, cv_data: Dict[str, Any]) -> Optional[bytes]:
+    def generate_pdf_bytes(self, cv_data: Dict[str, Any],
+                           use_cache: Optional[bool] = None,
+                           deterministic: Optional[bool] = None,
+                           profile: Optional[str] = None,
+                           preprocessed: bool = False) -> Optional[bytes]:
         """
         Generate PDF from CV data and return as bytes.
 
+        Identical inputs are served from the shared render cache. In
+        deterministic mode the metadata dates and the PDF file identifier are
+        pinned, so identical inputs always produce byte-identical output.
+
         Args:
             cv_data: Complete CV data dictionary
+            use_cache: Whether to use the render cache. Defaults to settings.RENDER_CACHE_ENABLED
+            deterministic: Pin metadata and identifiers. Defaults to settings.PDF_DETERMINISTIC
+            profile: Name of a PDF profile in settings.PDF_PROFILES. Defaults to settings.PDF_PROFILE
+            preprocessed: cv_data was already passed through DataProcessor.preprocess_data()
             
         Returns:
             PDF content as bytes, or None if generation failed
             
         Raises:
             PDFGenerationError: If PDF generation fails
+            DataValidationError: If the CV data cannot be preprocessed or does not fit the template
+        """
+        pdf_bytes, _ = self._generate_pdf(cv_data, None, use_cache, deterministic, profile,
+                                          preprocessed)
+        return pdf_bytes
+
+    def write_pdf(self, cv_data: Dict[str, Any], target: Union[str, os.PathLike, BinaryIO],
+                  use_cache: Optional[bool] = None,
+                  deterministic: Optional[bool] = None,
+                  profile: Optional[str] = None,
+                  preprocessed: bool = False) -> int:
         """
+        Generate PDF from CV data and write it to a file or stream.
+
+        Paths are written atomically. File objects only need a ``write``
+        method, so sockets, HTTP responses and spooled temporary files work.
+        When the render cache is not used, WeasyPrint writes the PDF straight
+        to the target without building it in memory first.
+
+        Args:
+            cv_data: Complete CV data dictionary
+            target: Output file path or binary file-like object
+            use_cache: Whether to use the render cache. Defaults to settings.RENDER_CACHE_ENABLED
+            deterministic: Pin metadata and identifiers. Defaults to settings.PDF_DETERMINISTIC
+            profile: Name of a PDF profile in settings.PDF_PROFILES. Defaults to settings.PDF_PROFILE
+            preprocessed: cv_data was already passed through DataProcessor.preprocess_data()
+
+        Returns:
+            Number of bytes written
+
+        Raises:
+            PDFGenerationError: If PDF generation or writing fails
+            DataValidationError: If the CV data cannot be preprocessed or does not fit the template
+        """
+        if hasattr(target, 'write'):
+            _, size = self._generate_pdf(cv_data, target, use_cache, deterministic, profile,
+                                         preprocessed)
+            return size
+        try:
+            with atomic_open(target) as f:
+                _, size = self._generate_pdf(cv_data, f, use_cache, deterministic, profile,
+                                             preprocessed)
+        except OSError as e:
+            logger.error(f"Error writing PDF to {target}: {e}")
+            raise PDFGenerationError(f"Could not write PDF to {target}: {e}")
+        return size
+
+    def _prepare_render(self, cv_data: Dict[str, Any], deterministic: Optional[bool],
+                        profile: Optional[str] = None,
+                        preprocessed: bool = False) -> _RenderInputs:
+        """Preprocess the data and collect everything the render depends on."""
         if not self.template:
             raise PDFGenerationError("Template not loaded")
-        
-        try:
-            # Preprocess data for template compatibility
-            processed_data = self.data_processor.preprocess_data(cv_data)
+
+        self._refresh_template()
+
+        # Preprocess data for template compatibility, unless the caller shares preprocessed data
+        if preprocessed:
+            processed_data = cv_data
+        else:
+            processed_data = self._preprocess(cv_data)
             logger.info("Data preprocessing completed")
+
+        profile, profile_settings = self._resolve_profile(profile)
+        profile_image = profile_images.get_profile_image(
+            profile_settings.get('image_dpi'), profile_settings.get('image_quality')
+        )
+        stylesheet_entry = stylesheet_cache.get_entry(self.stylesheet_path, self.lang)
+
+        if deterministic is None:
+            deterministic = settings.PDF_DETERMINISTIC
+        document_date = self._get_document_date(deterministic)
+        cache_key = self._render_cache_key(
+            processed_data, profile_image, stylesheet_entry.digest,
+            deterministic=deterministic, document_date=document_date, profile=profile_settings
+        )
+        return _RenderInputs(processed_data, profile_image, stylesheet_entry,
+                             deterministic, document_date, cache_key,
+                             profile, self._weasyprint_options(profile_settings))
+
+    def _preprocess(self, cv_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Preprocess the data for template compatibility.
+
+        Raises:
+            DataValidationError: If the CV data cannot be preprocessed
+        """
+        try:
+            return self.data_processor.preprocess_data(cv_data)
+        except Exception as e:
+            raise DataValidationError(f"CV data could not be preprocessed: {type(e).__name__}: {e}")
+
+    def _render_template(self, **context: Any) -> str:
+        """
+        Render the template.
+
+        Raises:
+            DataValidationError: If the CV data does not fit the template, e.g. a
+                section has the wrong structure
+        """
+        try:
+            return self.template.render(**context)
+        except Exception as e:
+            raise DataValidationError(f"CV data does not fit the template: {type(e).__name__}: {e}")
+
+    def _parse_html(self, inputs: _RenderInputs, data: Optional[Dict[str, Any]] = None,
+                    sections: Optional[List[str]] = None) -> HTML:
+        """
+        Render the template and parse the result for WeasyPrint.
+
+        Args:
+            inputs: Prepared render inputs
+            data: Data to render instead of the whole preprocessed CV
+            sections: Sections to render. Defaults to all
+        """
+        rendered_html = self._render_template(
+            data=inputs.processed_data if data is None else data,
+            sections=sections,
+            lang=self.lang,
+            profile_image=inputs.profile_image.url if inputs.profile_image else "",
+            document_date=inputs.document_date
+        )
+        logger.info("HTML template rendered successfully")
+
+        base_url = os.path.dirname(os.path.realpath(__file__))
+        return HTML(string=rendered_html, base_url=base_url, url_fetcher=asset_fetcher)
+
+    def _layout(self, inputs: _RenderInputs, html: Optional[HTML] = None, scale: float = 1.0,
+                page: Optional[Tuple[float, float, Tuple[float, ...]]] = None):
+        """
+        Lay out the document with WeasyPrint.
+
+        Args:
+            inputs: Prepared render inputs
+            html: Parsed document to reuse. Defaults to rendering and parsing the template
+            scale: Content scale; see _scale_stylesheet()
+            page: Unscaled page geometry from _page_geometry(), required when scaling
+        """
+        if html is None:
+            html = self._parse_html(inputs)
+        stylesheets = inputs.stylesheet_entry.stylesheets
+        if scale != 1.0:
+            stylesheets = stylesheets + [self._scale_stylesheet(scale, page)]
+        return html.render(
+            stylesheets=stylesheets, font_config=stylesheet_cache.font_config, **inputs.options
+        )
+
+    @staticmethod
+    def _page_geometry(document) -> Tuple[float, float, Tuple[float, ...]]:
+        """
+        Get the size and margins of the first page of a laid-out document.
+
+        Both come from the layout, so @page rules of the stylesheet or the
+        profile are taken into account. WeasyPrint has no public API for the
+        margins, which are read from the page box.
+
+        Returns:
+            Tuple of (width, height, (top, right, bottom, left) margins), in CSS px
+        """
+        page = document.pages[0]
+        box = page._page_box
+        return page.width, page.height, (
+            box.margin_top, box.margin_right, box.margin_bottom, box.margin_left
+        )
+
+    @staticmethod
+    def _scale_stylesheet(scale: float, page: Tuple[float, float, Tuple[float, ...]]) -> CSS:
+        """
+        Stylesheet that shrinks the content by ``scale`` once written with ``zoom=scale``.
+
+        The page box and its margins are enlarged by 1/scale, so fonts and
+        spacing take proportionally less of the page; zooming the PDF brings
+        the pages back to their printed size.
+
+        Args:
+            scale: Content scale
+            page: Unscaled page geometry from _page_geometry()
+        """
+        width, height, margins = page
+        margin = ' '.join(f"{value / scale:.3f}px" for value in margins)
+        return CSS(
+            string=f"@page {{ size: {width / scale:.3f}px {height / scale:.3f}px; margin: {margin}; }}",
+            font_config=stylesheet_cache.font_config
+        )
+
+    def _cached_layout(self, inputs: _RenderInputs):
+        """Lay out the document, reusing and filling the shared layout cache."""
+        document = layout_cache.get(inputs.cache_key)
+        if document is None:
+            document = self._layout(inputs)
+            layout_cache.put(inputs.cache_key, document)
+        return document
+
+    @staticmethod
+    def _pdf_options(inputs: _RenderInputs) -> Dict[str, Any]:
+        """PDF writer options; a content-derived file identifier keeps /ID stable across renders and hosts."""
+        return dict(
+            inputs.options,
+            pdf_identifier=inputs.cache_key[:32].encode('ascii') if inputs.deterministic else None
+        )
+
+    def _generate_pdf(self, cv_data: Dict[str, Any], target: Optional[BinaryIO],
+                      use_cache: Optional[bool], deterministic: Optional[bool],
+                      profile: Optional[str] = None,
+                      preprocessed: bool = False) -> Tuple[Optional[bytes], int]:
+        """
+        Render the PDF and return it as bytes or write it to ``target``.
+
+        Returns:
+            Tuple of (PDF bytes or None when written to target, size in bytes)
+        """
+        try:
+            start = time.perf_counter()
+            inputs = self._prepare_render(cv_data, deterministic, profile, preprocessed)
             
-            # Render HTML template
-            profile_image = self._get_profile_image_base64()
-            rendered_html = self.template.render(
-                data=processed_data, 
-                lang=self.lang,
-                profile_image=profile_image
-            )
-            logger.info("HTML template rendered successfully")
+            # Serve repeated renders of identical inputs from the cache
+            if use_cache is None:
+                use_cache = settings.RENDER_CACHE_ENABLED and inputs.deterministic
+            if use_cache:
+                cached_pdf = render_cache.get(inputs.cache_key)
+                if cached_pdf is not None:
+                    logger.info("PDF served from render cache")
+                    if target is None:
+                        return cached_pdf, len(cached_pdf)
+                    target.write(cached_pdf)
+                    return None, len(cached_pdf)
             
-            # Generate PDF using WeasyPrint
-            base_url = os.path.dirname(os.path.realpath(__file__))
-            pdf_bytes = HTML(string=rendered_html, base_url=base_url).write_pdf()
+            # Reuse the layout of a preview of the same input, if there was one
+            document = layout_cache.pop(inputs.cache_key) or self._layout(inputs)
+            pdf_options = self._pdf_options(inputs)
+            if target is None or use_cache:
+                # The cache needs the bytes anyway
+                pdf_bytes = document.write_pdf(**pdf_options)
+                size = len(pdf_bytes)
+                if target is not None:
+                    target.write(pdf_bytes)
+            else:
+                counter = _CountingWriter(target)
+                document.write_pdf(counter, **pdf_options)
+                pdf_bytes, size = None, counter.size
             
             # Validate PDF size
-            pdf_size_mb = len(pdf_bytes) / (1024 * 1024)
+            pdf_size_mb = size / (1024 * 1024)
             if pdf_size_mb > settings.PDF_MAX_SIZE_MB:
                 logger.warning(f"Generated PDF is large: {pdf_size_mb:.2f} MB")
             
-            logger.info(f"PDF generated successfully ({pdf_size_mb:.2f} MB)")
-            return pdf_bytes
+            seconds = time.perf_counter() - start
+            render_stats.record(inputs.profile, size, seconds)
+            logger.info(
+                f"PDF generated successfully ({pdf_size_mb:.2f} MB, profile '{inputs.profile}') "
+                f"in {seconds:.2f}s"
+            )
+            
+            if use_cache:
+                render_cache.put(inputs.cache_key, pdf_bytes)
+                if target is not None:
+                    pdf_bytes = None
+            return pdf_bytes, size
             
         except Exception as e:
             logger.error(f"Error generating PDF: {e}")
-            raise PDFGenerationError(f"PDF generation failed: {e}")
+            raise _render_error("PDF generation failed", e)
+
+    def generate_preview(self, cv_data: Dict[str, Any], first_page: int = 1,
+                         last_page: Optional[int] = None,
+                         deterministic: Optional[bool] = None) -> PdfPreview:
+        """
+        Generate a PDF of selected pages for on-screen preview.
+
+        The document is laid out once and only the requested pages are
+        written. The layout is kept in the shared layout cache, so a following
+        generate_pdf_bytes() or write_pdf() call for the same input writes the
+        full PDF without laying it out again.
+
+        Args:
+            cv_data: Complete CV data dictionary
+            first_page: First page to include, starting at 1
+            last_page: Last page to include. Defaults to first_page
+            deterministic: Pin metadata and identifiers. Defaults to settings.PDF_DETERMINISTIC
+
+        Returns:
+            PdfPreview with the PDF of the selected pages and the total page count
+
+        Raises:
+            PDFGenerationError: If rendering fails
+            DataValidationError: If the CV data cannot be preprocessed or does not fit the template
+        """
+        try:
+            inputs = self._prepare_render(cv_data, deterministic)
+            document = self._cached_layout(inputs)
+
+            page_count = len(document.pages)
+            first_page = max(1, min(first_page, page_count))
+            last_page = max(first_page, min(last_page or first_page, page_count))
+            pdf_bytes = document.copy(document.pages[first_page - 1:last_page]).write_pdf(
+                **self._pdf_options(inputs)
+            )
+            logger.info(f"Preview generated: pages {first_page}-{last_page} of {page_count}")
+            return PdfPreview(pdf_bytes, page_count, first_page, last_page, inputs.cache_key)
+        except Exception as e:
+            logger.error(f"Error generating preview: {e}")
+            raise _render_error("Preview generation failed", e)
+
+    @staticmethod
+    def has_cached_layout(cache_key: Optional[str]) -> bool:
+        """
+        Check whether this process still holds the layout of a preview.
+
+        If it does, generate_pdf_bytes() for the preview's data writes the
+        full PDF from that layout instead of laying the document out again.
+        Only the layout cache is looked up; nothing is rendered or reordered.
+
+        Args:
+            cache_key: PdfPreview.cache_key of the preview
+
+        Returns:
+            True if the laid-out document is in the layout cache
+        """
+        return cache_key is not None and cache_key in layout_cache
+
+    def generate_large_pdf(self, cv_data: Dict[str, Any], chunk_items: Optional[int] = None,
+                           use_cache: Optional[bool] = None,
+                           deterministic: Optional[bool] = None,
+                           profile: Optional[str] = None) -> bytes:
+        """
+        Generate the PDF of a very large CV by laying it out in chunks.
+
+        Layout time and memory grow steeply with document length, so the
+        sections are split into chunks of about ``chunk_items`` list items
+        (see large_cv.split_into_chunks), each laid out as a separate document,
+        and the pages are merged into one PDF. Every chunk starts on a new
+        page. Pages carry the CV owner's name as a running header and a page
+        number that continues across chunks.
+
+        Args:
+            cv_data: Complete CV data dictionary
+            chunk_items: Target list items per chunk. Defaults to settings.LARGE_CV_CHUNK_ITEMS
+            use_cache: Whether to use the render cache. Defaults to settings.RENDER_CACHE_ENABLED
+            deterministic: Pin metadata and identifiers. Defaults to settings.PDF_DETERMINISTIC
+            profile: Name of a PDF profile in settings.PDF_PROFILES. Defaults to settings.PDF_PROFILE
+
+        Returns:
+            PDF content as bytes
+
+        Raises:
+            PDFGenerationError: If PDF generation fails
+            DataValidationError: If the CV data cannot be preprocessed or does not fit the template
+        """
+        chunk_items = chunk_items or settings.LARGE_CV_CHUNK_ITEMS
+        try:
+            start = time.perf_counter()
+            inputs = self._prepare_render(cv_data, deterministic, profile)
+            cache_key = render_cache.make_key(render=inputs.cache_key, chunk_items=chunk_items)
+            if use_cache is None:
+                use_cache = settings.RENDER_CACHE_ENABLED and inputs.deterministic
+            if use_cache:
+                cached_pdf = render_cache.get(cache_key)
+                if cached_pdf is not None:
+                    logger.info("PDF served from render cache")
+                    return cached_pdf
+
+            chunks = split_into_chunks(inputs.processed_data, settings.CV_SECTIONS, chunk_items)
+            running_header = str(inputs.processed_data.get('personal', {}).get('name', ''))
+            pages = []
+            documents = []
+            for sections, data in chunks:
+                # Each chunk's numbering continues from the pages laid out so far
+                page_css = CSS(
+                    string=chunk_page_css(len(pages) + 1, running_header, self.lang),
+                    font_config=stylesheet_cache.font_config
+                )
+                document = self._parse_html(inputs, data, sections).render(
+                    stylesheets=inputs.stylesheet_entry.stylesheets + [page_css],
+                    font_config=stylesheet_cache.font_config,
+                    **inputs.options
+                )
+                documents.append(document)
+                pages.extend(document.pages)
+
+            pdf_options = self._pdf_options(inputs)
+            if inputs.deterministic:
+                pdf_options['pdf_identifier'] = cache_key[:32].encode('ascii')
+            pdf_bytes = documents[0].copy(pages).write_pdf(**pdf_options)
+
+            seconds = time.perf_counter() - start
+            render_stats.record(inputs.profile, len(pdf_bytes), seconds)
+            logger.info(
+                f"Large PDF generated from {len(chunks)} chunks: {len(pages)} pages, "
+                f"{len(pdf_bytes) / (1024 * 1024):.2f} MB in {seconds:.2f}s"
+            )
+            if use_cache:
+                render_cache.put(cache_key, pdf_bytes)
+            return pdf_bytes
+        except Exception as e:
+            logger.error(f"Error generating large PDF: {e}")
+            raise _render_error("PDF generation failed", e)
+
+    def count_pages(self, cv_data: Dict[str, Any]) -> int:
+        """
+        Count the pages of the CV without writing a PDF.
+
+        Only the layout runs. It is kept in the shared layout cache, so a
+        following PDF or preview of the same input is not laid out again.
+
+        Args:
+            cv_data: Complete CV data dictionary
+
+        Returns:
+            Number of pages
+
+        Raises:
+            PDFGenerationError: If the layout fails
+            DataValidationError: If the CV data cannot be preprocessed or does not fit the template
+        """
+        try:
+            return len(self._cached_layout(self._prepare_render(cv_data, None)).pages)
+        except Exception as e:
+            logger.error(f"Error laying out CV: {e}")
+            raise _render_error("Layout failed", e)
+
+    def fit_to_pages(self, cv_data: Dict[str, Any], max_pages: int,
+                     min_scale: float = 0.7, precision: float = 0.02,
+                     deterministic: Optional[bool] = None) -> FitResult:
+        """
+        Scale the CV down until it fits on ``max_pages`` pages and generate the PDF.
+
+        Fonts and spacing are scaled together. The largest scale that fits is
+        found by a search of layout-only passes, which reuse the parsed HTML
+        and stylesheets; only the chosen layout is written as a PDF. A CV that
+        already fits is not scaled.
+
+        Args:
+            cv_data: Complete CV data dictionary
+            max_pages: Number of pages the CV must fit on
+            min_scale: Smallest scale to try
+            precision: Stop once the best scale is known to within this much
+            deterministic: Pin metadata and identifiers. Defaults to settings.PDF_DETERMINISTIC
+
+        Returns:
+            FitResult; if the CV does not fit even at min_scale, ``fits`` is
+            False and the PDF is rendered at min_scale
+
+        Raises:
+            ValueError: If max_pages or min_scale is out of range
+            PDFGenerationError: If rendering fails
+            DataValidationError: If the CV data cannot be preprocessed or does not fit the template
+        """
+        if max_pages < 1:
+            raise ValueError("max_pages must be at least 1")
+        if not 0 < min_scale <= 1:
+            raise ValueError("min_scale must be greater than 0 and at most 1")
+
+        start = time.perf_counter()
+        passes = 0
+        try:
+            inputs = self._prepare_render(cv_data, deterministic)
+            html = self._parse_html(inputs)
+
+            page = None
+
+            def layout(scale: float):
+                nonlocal passes
+                passes += 1
+                return self._layout(inputs, html, scale, page)
+
+            scale, document = 1.0, layout(1.0)
+            # Scaled passes enlarge the page the stylesheet and profile actually produce
+            page = self._page_geometry(document)
+            unscaled_pages = len(document.pages)
+            if unscaled_pages > max_pages:
+                scale, document = min_scale, layout(min_scale)
+                if len(document.pages) <= max_pages:
+                    # Invariant: `low` fits, `high` does not. Content height shrinks
+                    # roughly with the square of the scale, which gives the first probe.
+                    low, high = min_scale, 1.0
+                    probe = math.sqrt(max_pages / unscaled_pages)
+                    while high - low > precision:
+                        if not low < probe < high:
+                            probe = (low + high) / 2
+                        candidate = layout(probe)
+                        if len(candidate.pages) <= max_pages:
+                            low, scale, document = probe, probe, candidate
+                        else:
+                            high = probe
+                        probe = (low + high) / 2
+
+            pdf_options = self._pdf_options(inputs)
+            if scale != 1.0 and inputs.deterministic:
+                pdf_options['pdf_identifier'] = render_cache.make_key(
+                    render=inputs.cache_key, scale=scale
+                )[:32].encode('ascii')
+            pdf_bytes = document.write_pdf(zoom=scale, **pdf_options)
+        except Exception as e:
+            logger.error(f"Error fitting CV to {max_pages} page(s): {e}")
+            raise _render_error(f"Fitting to {max_pages} page(s) failed", e)
+
+        page_count = len(document.pages)
+        seconds = time.perf_counter() - start
+        fits = page_count <= max_pages
+        logger.info(
+            f"{'Fitted' if fits else 'Could not fit'} CV to {max_pages} page(s): "
+            f"{page_count} page(s) at scale {scale:.3f} after {passes} layout passes in {seconds:.2f}s"
+        )
+        return FitResult(pdf_bytes, scale, page_count, fits, passes, seconds)
+
+    async def agenerate_pdf_bytes(self, cv_data: Dict[str, Any],
+                                  timeout: Optional[float] = None,
+                                  pool: Optional[RenderPool] = None,
+                                  **options: Any) -> Optional[bytes]:
+        """
+        Asynchronously generate a PDF from CV data.
+
+        The render runs on a render worker pool when one is given or
+        settings.RENDER_POOL_ENABLED is set, and on the event loop's default
+        executor otherwise, so the event loop is never blocked. Many renders
+        can be awaited together with ``asyncio.gather``.
+
+        Cancelling the awaiting task cancels the render: a queued pool job is
+        dropped and a running one is interrupted by replacing its worker. A
+        render already running on the executor thread cannot be interrupted;
+        its result is discarded.
+
+        Args:
+            cv_data: Complete CV data dictionary
+            timeout: Deadline in seconds for the whole call, including time spent queued
+            pool: Render pool to use. Defaults to the shared pool if settings.RENDER_POOL_ENABLED
+            **options: Keyword arguments for generate_pdf_bytes
+
+        Returns:
+            PDF content as bytes
+
+        Raises:
+            RenderTimeoutError: If the deadline passes before the PDF is ready
+            PDFGenerationError: If PDF generation fails
+            DataValidationError: If the CV data cannot be preprocessed or does not fit the template
+        """
+        if pool is None and settings.RENDER_POOL_ENABLED:
+            pool = get_render_pool()
+
+        if pool is not None:
+            render = self._arender_on_pool(pool, cv_data, timeout, options)
+        else:
+            loop = asyncio.get_running_loop()
+            render = loop.run_in_executor(
+                None, functools.partial(self.generate_pdf_bytes, cv_data, **options)
+            )
+
+        try:
+            return await asyncio.wait_for(render, timeout)
+        except asyncio.TimeoutError:
+            raise RenderTimeoutError(f"Render did not finish within {timeout:g}s")
+
+    async def _arender_on_pool(self, pool: RenderPool, cv_data: Dict[str, Any],
+                               timeout: Optional[float], options: Dict[str, Any]) -> bytes:
+        """Await a pool render, cancelling the pool job if the awaiting task is cancelled."""
+        future = pool.submit(cv_data, self.lang, timeout=timeout, variant=self.variant, **options)
+        try:
+            return await asyncio.wrap_future(future)
+        except asyncio.CancelledError:
+            pool.cancel(future)
+            raise
+
+    async def arender_html_preview(self, cv_data: Dict[str, Any]) -> str:
+        """
+        Asynchronously render HTML without converting to PDF.
+
+        Args:
+            cv_data: Complete CV data dictionary
+
+        Returns:
+            Rendered HTML as string
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.render_html_preview, cv_data)
 
     def validate_template(self) -> bool:
         """
@@ -155,11 +1048,14 @@ class CVGenerator:
         
         info = {
             'template_name': self.template_name,
+            'variant': self.variant,
             'template_path': self.template_path,
             'full_path': template_file_path,
+            'stylesheet_path': self.stylesheet_path,
             'exists': os.path.exists(template_file_path),
             'language': self.lang,
-            'is_loaded': self.template is not None
+            'is_loaded': self.template is not None,
+            'cache': template_registry.stats()
         }
         
         if info['exists']:
@@ -174,20 +1070,41 @@ class CVGenerator:
 
     def render_html_preview(self, cv_data: Dict[str, Any]) -> str:
         """
-        Render HTML without converting to PDF (for debugging).
+        Render the CV as self-contained HTML without converting to PDF.
+
+        Uses the same template, stylesheet and profile picture as the PDF. The
+        picture is embedded as a data URI and the printed page is emulated on
+        screen, so the result can be shown in a browser as a live preview. This
+        skips WeasyPrint entirely and takes milliseconds instead of seconds;
+        page breaks are only known once the PDF is generated.
         
         Args:
             cv_data: Complete CV data dictionary
             
         Returns:
             Rendered HTML as string
+
+        Raises:
+            DataValidationError: If the CV data cannot be preprocessed or does not fit the template
+            PDFGenerationError: If rendering fails otherwise
         """
         if not self.template:
             raise TemplateNotFoundError("Template not loaded")
         
         try:
-            processed_data = self.data_processor.preprocess_data(cv_data)
-            return self.template.render(data=processed_data, lang=self.lang)
+            start = time.perf_counter()
+            self._refresh_template()
+            processed_data = self._preprocess(cv_data)
+            css_text = stylesheet_cache.build_css_text(self.stylesheet_path, self.lang)
+            profile_image = profile_images.get_profile_image()
+            html = self._render_template(
+                data=processed_data,
+                lang=self.lang,
+                inline_css=css_text + _SCREEN_PAGE_CSS,
+                profile_image=profile_image.data_uri() if profile_image else ""
+            )
+            logger.debug(f"HTML preview rendered in {(time.perf_counter() - start) * 1000:.1f} ms")
+            return html
         except Exception as e:
             logger.error(f"Error rendering HTML preview: {e}")
-            raise PDFGenerationError(f"HTML rendering failed: {e}")
+            raise _render_error("HTML rendering failed", e)
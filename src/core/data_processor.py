@@ -1,7 +1,8 @@
 import json
 import os
+import threading
 from io import BytesIO
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Set, Tuple
 
 from config.settings import settings
 from src.utils.exceptions import FileLoadError, DataValidationError
@@ -10,6 +11,118 @@ from src.utils.logger import setup_logger
 logger = setup_logger(__name__)
 
 
+class _SectionEntry:
+    """Parsed content of a section file together with the file state it was read from."""
+
+    __slots__ = ('data', 'signature')
+
+    def __init__(self, data: Any, signature: Tuple[int, int, int]):
+        self.data = data
+        self.signature = signature
+
+
+class SectionFileCache:
+    """
+    Process-wide, thread-safe cache of parsed section files.
+
+    Files are keyed by their absolute path and revalidated with a single
+    ``os.stat`` per lookup; a file is only re-read and parsed when its
+    modification time, size or inode changes, so edits and atomic
+    replacements are both picked up. Files that cannot be parsed are cached
+    as empty sections until they change, and a missing file is reported once
+    until it reappears.
+
+    Parsed sections are shared by all sessions and must be treated as
+    read-only; preprocess_data() works on a copy.
+    """
+
+    def __init__(self):
+        """Initialize an empty cache."""
+        self._lock = threading.Lock()
+        self._entries: Dict[str, _SectionEntry] = {}
+        self._missing = set()
+        self._hits = 0
+        self._misses = 0
+        self._reloads = 0
+
+    def load(self, filename: str) -> Optional[Any]:
+        """
+        Get the parsed content of a section file, reading it only if it changed.
+
+        Args:
+            filename: Path of the JSON file
+
+        Returns:
+            Parsed content, an empty dict if the file cannot be parsed, or None if it does not exist
+        """
+        path = os.path.abspath(filename)
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            with self._lock:
+                self._entries.pop(path, None)
+                if path not in self._missing:
+                    self._missing.add(path)
+                    logger.warning(f"File not found: {filename}")
+            return None
+        except OSError as e:
+            logger.error(f"Unexpected error loading {filename}: {e}")
+            return {}
+        signature = (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+
+        with self._lock:
+            self._missing.discard(path)
+            entry = self._entries.get(path)
+            if entry is not None and entry.signature == signature:
+                self._hits += 1
+                return entry.data
+
+            self._misses += 1
+            if entry is not None:
+                self._reloads += 1
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                logger.info(f"Loaded {filename}")
+            except json.JSONDecodeError as e:
+                logger.error(f"JSON decode error in {filename}: {e}")
+                data = {}
+            except Exception as e:
+                logger.error(f"Unexpected error loading {filename}: {e}")
+                data = {}
+            self._entries[path] = _SectionEntry(data, signature)
+            return data
+
+    def clear(self):
+        """Drop all cached sections and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self._missing.clear()
+            self._hits = 0
+            self._misses = 0
+            self._reloads = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dictionary with hit, miss and reload counts and the cached and missing file counts
+        """
+        with self._lock:
+            return {
+                'hits': self._hits,
+                'misses': self._misses,
+                'reloads': self._reloads,
+                'files': len(self._entries),
+                'missing': len(self._missing),
+            }
+
+
+# Global section file cache shared by all DataProcessor instances and sessions
+section_cache = SectionFileCache()
+
+
 class DataProcessor:
     """Handles loading and preprocessing of CV data from various sources."""
     
@@ -30,6 +143,10 @@ class DataProcessor:
         """
         Load CV data from JSON files in a directory.
         
+        Section files are served from the shared section cache, so only files
+        changed since the last load are read. The returned dictionary is new,
+        but the section data in it is shared and must not be modified.
+        
         Args:
             data_dir: Directory containing JSON files. Defaults to settings.DATA_DIRECTORY
             
@@ -45,34 +162,57 @@ class DataProcessor:
         if not os.path.isdir(data_dir):
             raise FileLoadError(f"Data directory not found: {data_dir}")
         
-        data = {}
-        missing_files = []
+        return self._load_sections(data_dir)
+    
+    def _load_sections(self, data_dir: str, file_names: Optional[Set[str]] = None) -> Dict[str, Any]:
+        """
+        Load this language's section files from a directory.
         
+        Args:
+            data_dir: Directory containing JSON files
+            file_names: Names of the files in the directory, if already listed.
+                Sections without a file are not looked up
+        """
+        data = {}
         for section in self.data_sections:
-            filename = os.path.join(data_dir, f"{section}_{self.lang}.json")
+            file_name = f"{section}_{self.lang}.json"
+            section_data = None
+            if file_names is None or file_name in file_names:
+                section_data = section_cache.load(os.path.join(data_dir, file_name))
+            data[section] = {} if section_data is None else section_data
+        
+        return data
+    
+    @classmethod
+    def load_languages_from_directory(cls, data_dir: str = None,
+                                      langs: Optional[List[str]] = None) -> Dict[str, Dict[str, Any]]:
+        """
+        Load the CV data of several languages from one directory together.
+        
+        The directory is listed once for all languages, and only section
+        files it contains are loaded. As with load_data_from_directory(),
+        the section data is shared and must not be modified.
+        
+        Args:
+            data_dir: Directory containing JSON files. Defaults to settings.DATA_DIRECTORY
+            langs: Languages to load. Defaults to settings.SUPPORTED_LANGUAGES
             
-            try:
-                with open(filename, 'r', encoding='utf-8') as f:
-                    data[section] = json.load(f)
-                logger.info(f"Loaded {filename}")
-                
-            except FileNotFoundError:
-                missing_files.append(filename)
-                data[section] = {}
-                logger.warning(f"File not found: {filename}")
-                
-            except json.JSONDecodeError as e:
-                logger.error(f"JSON decode error in {filename}: {e}")
-                data[section] = {}
-                
-            except Exception as e:
-                logger.error(f"Unexpected error loading {filename}: {e}")
-                data[section] = {}
+        Returns:
+            Dictionary mapping each language code to its CV data
+            
+        Raises:
+            FileLoadError: If the directory doesn't exist
+        """
+        if data_dir is None:
+            data_dir = settings.DATA_DIRECTORY
+        langs = langs or settings.SUPPORTED_LANGUAGES
         
-        if missing_files:
-            logger.warning(f"Missing data files: {', '.join(missing_files)}")
+        try:
+            file_names = set(os.listdir(data_dir))
+        except (FileNotFoundError, NotADirectoryError):
+            raise FileLoadError(f"Data directory not found: {data_dir}")
         
-        return data
+        return {lang: cls(lang=lang)._load_sections(data_dir, file_names) for lang in langs}
     
     def load_from_file(self, file_content: bytes) -> Dict[str, Any]:
         """
@@ -0,0 +1,172 @@
+import base64
+import hashlib
+import mimetypes
+import os
+import threading
+from io import BytesIO
+from pathlib import Path
+from typing import Dict, Any, Optional, Tuple
+
+from PIL import Image, ImageOps
+
+from config.settings import settings
+from src.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+# CSS reference pixels per inch
+CSS_PX_PER_INCH = 96
+
+
+class ProcessedImage:
+    """An image prepared for printing and the URL it is served under."""
+
+    __slots__ = ('url', 'body', 'mime_type', 'digest', 'source_path', 'pixel_size')
+
+    def __init__(self, url: str, body: bytes, mime_type: str, digest: str,
+                 source_path: str, pixel_size: int):
+        self.url = url
+        self.body = body
+        self.mime_type = mime_type
+        self.digest = digest
+        self.source_path = source_path
+        self.pixel_size = pixel_size
+
+    def data_uri(self) -> str:
+        """Get the image as a ``data:`` URI for HTML shown outside WeasyPrint."""
+        encoded = base64.b64encode(self.body).decode('ascii')
+        return f"data:{self.mime_type};base64,{encoded}"
+
+
+class ProfileImageCache:
+    """
+    Prepares the profile picture once and serves it to WeasyPrint by reference.
+
+    The source image is cropped to a square, downscaled to the printed size at
+    the requested DPI and recompressed as JPEG. Results are cached by source
+    file state (path, mtime_ns, size) and output parameters, and registered
+    with the shared asset fetcher under a content-addressed ``cv-asset:`` URL,
+    so the template only references the image instead of embedding it.
+    """
+
+    def __init__(self):
+        """Initialize an empty cache."""
+        self._lock = threading.Lock()
+        self._entries: Dict[Tuple, ProcessedImage] = {}
+        self._hits = 0
+        self._misses = 0
+
+    @staticmethod
+    def find_profile_image() -> Optional[Path]:
+        """
+        Locate the profile picture, with a fallback to the default image.
+        Looks for 'profile.jpg' first, then 'default_profile_pic.jpg'.
+
+        Returns:
+            Path of the image to use, or None if neither exists
+        """
+        assets_dir = Path(settings.ASSETS_DIR)
+        for candidate in (assets_dir / 'profile.jpg', assets_dir / 'default_profile_pic.jpg'):
+            if candidate.exists():
+                return candidate
+        return None
+
+    def get_profile_image(self, dpi: Optional[int] = None,
+                          quality: Optional[int] = None) -> Optional[ProcessedImage]:
+        """
+        Get the print-ready profile picture.
+
+        Args:
+            dpi: Output resolution. Defaults to settings.PROFILE_IMAGE_DPI
+            quality: JPEG quality. Defaults to settings.PROFILE_IMAGE_QUALITY
+
+        Returns:
+            Processed image, or None if no profile picture exists or it cannot be read
+        """
+        dpi = dpi or settings.PROFILE_IMAGE_DPI
+        quality = quality or settings.PROFILE_IMAGE_QUALITY
+
+        path = self.find_profile_image()
+        if path is None:
+            logger.warning("No profile picture found (neither profile.jpg nor default_profile_pic.jpg).")
+            return None
+
+        try:
+            stat = os.stat(path)
+        except OSError as e:
+            logger.error(f"Could not stat image file {path}: {e}")
+            return None
+
+        pixel_size = round(settings.PROFILE_IMAGE_SIZE_PX * dpi / CSS_PX_PER_INCH)
+        key = (str(path), stat.st_mtime_ns, stat.st_size, pixel_size, quality)
+
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is not None:
+                self._hits += 1
+                return cached
+            self._misses += 1
+
+        image = self._process(path, pixel_size, quality)
+        if image is None:
+            return None
+
+        # Imported here so that importing this module, as the CLI does, does not load WeasyPrint
+        from src.core.assets import asset_fetcher
+
+        with self._lock:
+            # Drop outdated versions of the same source image
+            for old_key in [k for k in self._entries if k[0] == key[0] and k[1:3] != key[1:3]]:
+                asset_fetcher.unregister(self._entries.pop(old_key).url)
+            self._entries[key] = image
+        asset_fetcher.register(image.url, image.body, image.mime_type)
+        return image
+
+    def _process(self, path: Path, pixel_size: int, quality: int) -> Optional[ProcessedImage]:
+        """Crop, downscale and recompress the image at ``path``."""
+        try:
+            with open(path, 'rb') as f:
+                original = f.read()
+        except OSError as e:
+            logger.error(f"Could not read image file {path}: {e}")
+            return None
+
+        try:
+            with Image.open(BytesIO(original)) as source:
+                image = ImageOps.exif_transpose(source).convert('RGB')
+            # Match the template's square, object-fit: cover thumbnail
+            image = ImageOps.fit(image, (pixel_size, pixel_size), Image.LANCZOS)
+            output = BytesIO()
+            image.save(output, format='JPEG', quality=quality, optimize=True)
+            body, mime_type = output.getvalue(), 'image/jpeg'
+            logger.info(
+                f"Profile picture prepared: {path.name} -> {pixel_size}px, "
+                f"{len(original)} -> {len(body)} bytes"
+            )
+        except Exception as e:
+            logger.error(f"Could not process image file {path}, using it unchanged: {e}")
+            body = original
+            mime_type = mimetypes.guess_type(path.name)[0] or 'application/octet-stream'
+
+        digest = hashlib.sha256(body).hexdigest()
+        extension = mimetypes.guess_extension(mime_type) or ''
+        url = f"cv-asset://images/{digest}{extension}"
+        return ProcessedImage(url, body, mime_type, digest, str(path), pixel_size)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dictionary with hit and miss counts and the number of cached images
+        """
+        with self._lock:
+            return {
+                'hits': self._hits,
+                'misses': self._misses,
+                'images': len(self._entries),
+            }
+
+
+# Global cache shared by all CVGenerator instances
+profile_images = ProfileImageCache()
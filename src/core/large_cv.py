@@ -0,0 +1,116 @@
+from typing import Dict, Any, List, Tuple
+
+# List in each section that long CVs grow; teaching holds several lists and is never split
+SPLITTABLE_LISTS = {
+    'skills': 'categories',
+    'experience': 'jobs',
+    'projects': 'items',
+    'education': 'degrees',
+    'publications': 'items',
+}
+
+
+def _section_size(section: str, section_data: Any) -> int:
+    """Number of list items a section contributes to a chunk."""
+    key = SPLITTABLE_LISTS.get(section)
+    if key and isinstance(section_data, dict) and isinstance(section_data.get(key), list):
+        return max(1, len(section_data[key]))
+    return 1
+
+
+def split_into_chunks(data: Dict[str, Any], sections: List[str],
+                      max_items: int) -> List[Tuple[List[str], Dict[str, Any]]]:
+    """
+    Split preprocessed CV data into chunks that are laid out independently.
+
+    Sections are kept in order and grouped until a chunk holds about
+    ``max_items`` list items. A section with more items than that is split
+    into consecutive slices, each repeating the section title. The personal
+    header is shown in the first chunk only, but every chunk's data includes
+    the personal section, which the template also uses for the document title.
+
+    Args:
+        data: Preprocessed CV data
+        sections: Section names in template order
+        max_items: Target number of list items per chunk
+
+    Returns:
+        List of (section names, data) pairs to render with the template's ``sections`` variable
+    """
+    if max_items < 1:
+        raise ValueError("max_items must be at least 1")
+
+    pieces = []
+    for section in sections:
+        if section not in data:
+            continue
+        section_data = data[section]
+        key = SPLITTABLE_LISTS.get(section)
+        size = _section_size(section, section_data)
+        if section == 'personal':
+            size = 0
+        if key and size > max_items:
+            items = section_data[key]
+            for start in range(0, len(items), max_items):
+                sliced = dict(section_data, **{key: items[start:start + max_items]})
+                pieces.append((section, sliced, len(sliced[key])))
+        else:
+            pieces.append((section, section_data, size))
+
+    chunks: List[Tuple[List[str], Dict[str, Any]]] = []
+    current_sections: List[str] = []
+    current_data: Dict[str, Any] = {}
+    current_size = 0
+    for section, section_data, size in pieces:
+        # A section appears at most once per chunk, so slices always start a new one
+        if current_sections and (current_size + size > max_items or section in current_data):
+            chunks.append((current_sections, current_data))
+            current_sections, current_data, current_size = [], {}, 0
+        current_sections.append(section)
+        current_data[section] = section_data
+        current_size += size
+    if current_sections:
+        chunks.append((current_sections, current_data))
+
+    if 'personal' in data:
+        for _, chunk_data in chunks:
+            chunk_data.setdefault('personal', data['personal'])
+    return chunks
+
+
+def _css_string(text: str) -> str:
+    """Quote text as a CSS string."""
+    escaped = text.replace('\\', '\\\\').replace('"', '\\"').replace('\n', ' ')
+    return f'"{escaped}"'
+
+
+def chunk_page_css(first_page_number: int, running_header: str, lang: str) -> str:
+    """
+    Page rules for one chunk of a large CV.
+
+    Every page gets the running header and a page number at the bottom. The
+    page counter of each chunk starts where the previous chunk ended, so the
+    merged PDF is numbered continuously; the first page of the CV, which
+    carries the full header, has no running header.
+
+    Args:
+        first_page_number: Number of the chunk's first page in the merged PDF
+        running_header: Text shown at the top of every page but the first
+        lang: Language code selecting the font
+
+    Returns:
+        CSS source
+    """
+    font = "'Vazirmatn', sans-serif" if lang == 'fa' else "'Roboto', sans-serif"
+    margin_style = f"font-family: {font}; font-size: 8pt; color: #888;"
+    css = (
+        f"@page {{ "
+        f"@top-center {{ content: {_css_string(running_header)}; {margin_style} }} "
+        f"@bottom-center {{ content: counter(page); {margin_style} }} }}\n"
+    )
+    if first_page_number == 1:
+        css += "@page :first { @top-center { content: none; } }\n"
+    else:
+        # Setting the counter replaces the automatic increment on that page
+        css += f"@page :first {{ counter-reset: page {first_page_number}; }}\n"
+    return css
@@ -0,0 +1,239 @@
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from typing import Dict, Any, Optional
+
+from config.settings import settings
+from src.utils.file_utils import atomic_write
+from src.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+
+class RenderCache:
+    """
+    Content-addressed cache of rendered PDFs with a memory and a disk tier.
+
+    Keys are SHA-256 digests of everything that influences the output (see
+    ``make_key``). The memory tier is an LRU bounded by total bytes; the disk
+    tier stores one file per key, is bounded by total size and evicts the
+    least recently used files first. Disk hits are promoted to memory.
+    """
+
+    def __init__(self, memory_max_bytes: Optional[int] = None,
+                 disk_dir: Optional[str] = None,
+                 disk_max_bytes: Optional[int] = None):
+        """
+        Initialize the cache.
+
+        Args:
+            memory_max_bytes: Memory tier capacity. Defaults to settings.RENDER_CACHE_MEMORY_MB
+            disk_dir: Disk tier directory. Defaults to settings.RENDER_CACHE_DIR; empty disables it
+            disk_max_bytes: Disk tier capacity. Defaults to settings.RENDER_CACHE_DISK_MB
+        """
+        if memory_max_bytes is None:
+            memory_max_bytes = int(settings.RENDER_CACHE_MEMORY_MB * 1024 * 1024)
+        if disk_dir is None:
+            disk_dir = settings.RENDER_CACHE_DIR
+        if disk_max_bytes is None:
+            disk_max_bytes = int(settings.RENDER_CACHE_DISK_MB * 1024 * 1024)
+
+        self.memory_max_bytes = memory_max_bytes
+        self.disk_dir = disk_dir or None
+        self.disk_max_bytes = disk_max_bytes
+
+        self._lock = threading.Lock()
+        self._memory: OrderedDict = OrderedDict()
+        self._memory_bytes = 0
+        self._disk_bytes: Optional[int] = None
+
+        self._memory_hits = 0
+        self._disk_hits = 0
+        self._misses = 0
+        self._bytes_saved = 0
+        self._memory_evictions = 0
+        self._disk_evictions = 0
+
+    @staticmethod
+    def make_key(**parts: Any) -> str:
+        """
+        Build a cache key from JSON-serializable parts.
+
+        Args:
+            **parts: Everything that influences the rendered output
+
+        Returns:
+            Hex SHA-256 digest of the canonical JSON encoding of ``parts``
+        """
+        canonical = json.dumps(parts, sort_keys=True, ensure_ascii=False, separators=(',', ':'))
+        return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+    def _disk_path(self, key: str) -> str:
+        return os.path.join(self.disk_dir, key[:2], f"{key}.pdf")
+
+    def get(self, key: str) -> Optional[bytes]:
+        """
+        Look up a rendered PDF.
+
+        Args:
+            key: Cache key from make_key()
+
+        Returns:
+            PDF bytes, or None on a miss
+        """
+        with self._lock:
+            data = self._memory.get(key)
+            if data is not None:
+                self._memory.move_to_end(key)
+                self._memory_hits += 1
+                self._bytes_saved += len(data)
+                return data
+
+        data = self._read_disk(key)
+        with self._lock:
+            if data is None:
+                self._misses += 1
+                return None
+            self._disk_hits += 1
+            self._bytes_saved += len(data)
+            self._store_memory(key, data)
+        return data
+
+    def put(self, key: str, data: bytes):
+        """
+        Store a rendered PDF in both tiers.
+
+        Args:
+            key: Cache key from make_key()
+            data: PDF bytes
+        """
+        with self._lock:
+            self._store_memory(key, data)
+        self._write_disk(key, data)
+
+    def _store_memory(self, key: str, data: bytes):
+        """Insert into the memory tier and evict LRU entries. Caller holds the lock."""
+        if len(data) > self.memory_max_bytes:
+            return
+        previous = self._memory.pop(key, None)
+        if previous is not None:
+            self._memory_bytes -= len(previous)
+        self._memory[key] = data
+        self._memory_bytes += len(data)
+        while self._memory_bytes > self.memory_max_bytes:
+            _, evicted = self._memory.popitem(last=False)
+            self._memory_bytes -= len(evicted)
+            self._memory_evictions += 1
+
+    def _read_disk(self, key: str) -> Optional[bytes]:
+        """Read a disk tier entry and mark it as recently used."""
+        if not self.disk_dir:
+            return None
+        path = self._disk_path(key)
+        try:
+            with open(path, 'rb') as f:
+                data = f.read()
+            os.utime(path)
+            return data
+        except FileNotFoundError:
+            return None
+        except OSError as e:
+            logger.warning(f"Could not read cached PDF {path}: {e}")
+            return None
+
+    def _write_disk(self, key: str, data: bytes):
+        """Write a disk tier entry atomically and enforce the size cap."""
+        if not self.disk_dir or len(data) > self.disk_max_bytes:
+            return
+        path = self._disk_path(key)
+        try:
+            # An entry that is rewritten replaces its old file's size
+            previous_size = os.path.getsize(path)
+        except OSError:
+            previous_size = 0
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            atomic_write(path, data)
+        except OSError as e:
+            logger.warning(f"Could not write cached PDF {path}: {e}")
+            return
+
+        with self._lock:
+            if self._disk_bytes is None:
+                self._disk_bytes = self._scan_disk_usage()
+            else:
+                self._disk_bytes += len(data) - previous_size
+            if self._disk_bytes > self.disk_max_bytes:
+                self._evict_disk()
+
+    def _list_disk_entries(self):
+        """List (mtime, size, path) for all disk tier entries."""
+        entries = []
+        for root, _, files in os.walk(self.disk_dir):
+            for name in files:
+                if not name.endswith('.pdf'):
+                    continue
+                path = os.path.join(root, name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, path))
+        return entries
+
+    def _scan_disk_usage(self) -> int:
+        return sum(size for _, size, _ in self._list_disk_entries())
+
+    def _evict_disk(self):
+        """Delete least recently used files until the tier is at 90% of its cap. Caller holds the lock."""
+        entries = sorted(self._list_disk_entries())
+        total = sum(size for _, size, _ in entries)
+        target = int(self.disk_max_bytes * 0.9)
+        for _, size, path in entries:
+            if total <= target:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
+            self._disk_evictions += 1
+        self._disk_bytes = total
+        logger.info(f"Render cache disk tier trimmed to {total / (1024 * 1024):.1f} MB")
+
+    def clear(self):
+        """Drop the memory tier and reset the counters. Disk entries are kept."""
+        with self._lock:
+            self._memory.clear()
+            self._memory_bytes = 0
+            self._memory_hits = self._disk_hits = self._misses = 0
+            self._bytes_saved = self._memory_evictions = self._disk_evictions = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dictionary with per-tier hits, misses, evictions, sizes and bytes saved
+        """
+        with self._lock:
+            lookups = self._memory_hits + self._disk_hits + self._misses
+            return {
+                'memory_hits': self._memory_hits,
+                'disk_hits': self._disk_hits,
+                'misses': self._misses,
+                'hit_rate': (self._memory_hits + self._disk_hits) / lookups if lookups else 0.0,
+                'bytes_saved': self._bytes_saved,
+                'memory_entries': len(self._memory),
+                'memory_bytes': self._memory_bytes,
+                'memory_evictions': self._memory_evictions,
+                'disk_bytes': self._disk_bytes,
+                'disk_evictions': self._disk_evictions,
+                'disk_dir': self.disk_dir,
+            }
+
+
+# Global cache shared by all CVGenerator instances
+render_cache = RenderCache()
@@ -0,0 +1,704 @@
+import atexit
+import itertools
+import multiprocessing
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+from multiprocessing.connection import wait
+from typing import Dict, Any, List, Optional
+
+from config.settings import settings
+from src.utils.exceptions import (
+    DataValidationError, PDFGenerationError, RenderPoolError, RenderQueueFullError,
+    RenderTimeoutError, RenderMemoryError, RenderWorkerCrashedError, RenderCancelledError
+)
+from src.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+# Consecutive worker start-up failures after which the pool gives up
+MAX_SPAWN_FAILURES = 3
+
+# How often the supervisor checks running jobs against their limits (seconds)
+MONITOR_INTERVAL = 0.5
+
+
+def _process_rss_bytes(pid: int) -> Optional[int]:
+    """
+    Get the resident set size of a process.
+
+    Args:
+        pid: Process ID
+
+    Returns:
+        RSS in bytes, or None where /proc is not available
+    """
+    try:
+        with open(f"/proc/{pid}/statm", 'r') as f:
+            resident_pages = int(f.read().split()[1])
+        return resident_pages * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+def _worker_main(conn, langs: List[str], warm: bool = False):
+    """
+    Entry point of a render worker process.
+
+    Loads WeasyPrint, the compiled template, the parsed stylesheets, fonts and
+    the profile picture once and, with ``warm``, renders the sample CVs to
+    warm up (see warm_up()), then renders jobs received over ``conn`` until
+    it receives ``None`` or the connection closes. Jobs with an output path
+    are written to that file and answered with the size instead of the bytes;
+    preview jobs are answered with the first-page preview and the full PDF.
+    """
+    from src.core.cv_generator import CVGenerator
+    from src.core.images import profile_images
+    from src.core.stylesheets import stylesheet_cache
+    from src.core.warmup import warm_up
+
+    try:
+        generators = {(lang, None): CVGenerator(lang=lang) for lang in langs}
+        for generator in generators.values():
+            stylesheet_cache.get_entry(generator.stylesheet_path, generator.lang)
+        profile_images.get_profile_image()
+    except Exception as e:
+        conn.send(('failed', os.getpid(), f"{type(e).__name__}: {e}"))
+        return
+
+    # Render the sample CVs before taking jobs, so the first job runs at full speed
+    warm_up_seconds = warm_up(langs)['seconds'] if warm and settings.WARM_UP_ENABLED else None
+    conn.send(('ready', os.getpid(), warm_up_seconds))
+
+    while True:
+        try:
+            message = conn.recv()
+        except EOFError:
+            break
+        if message is None:
+            break
+
+        job_id, cv_data, lang, options, output_path = message
+        start = time.perf_counter()
+        try:
+            # Generators of all template variants share this worker's fonts, images and assets
+            variant = options.pop('variant', None)
+            preview = options.pop('preview', False)
+            generator = generators.get((lang, variant))
+            if generator is None:
+                generator = generators[(lang, variant)] = CVGenerator(lang=lang, variant=variant)
+            if output_path:
+                output = generator.write_pdf(cv_data, output_path, **options)
+            elif preview:
+                # The full PDF is written from the layout the preview leaves in the layout cache
+                output = (generator.generate_preview(cv_data),
+                          generator.generate_pdf_bytes(cv_data, **options))
+            else:
+                output = generator.generate_pdf_bytes(cv_data, **options)
+            result = ('done', job_id, output)
+        except DataValidationError as e:
+            # Reported apart from other failures, so callers can blame the input
+            result = ('invalid', job_id, str(e))
+        except Exception as e:
+            result = ('error', job_id, f"{type(e).__name__}: {e}")
+        conn.send(result + (time.perf_counter() - start, _process_rss_bytes(os.getpid())))
+
+
+class RenderFuture(Future):
+    """Future of a pool render job that also records where and how long it ran."""
+
+    def __init__(self, job_id: int):
+        super().__init__()
+        self.job_id = job_id
+        self.worker_pid: Optional[int] = None
+        self.queued_seconds: Optional[float] = None
+        self.render_seconds: Optional[float] = None
+
+
+class _Job:
+    """A queued or running render job."""
+
+    __slots__ = ('id', 'cv_data', 'lang', 'options', 'timeout', 'output_path', 'future',
+                 'submitted_at', 'started_at')
+
+    def __init__(self, job_id: int, cv_data: Dict[str, Any], lang: str,
+                 options: Dict[str, Any], timeout: Optional[float],
+                 output_path: Optional[str] = None):
+        self.id = job_id
+        self.cv_data = cv_data
+        self.lang = lang
+        self.options = options
+        self.timeout = timeout
+        self.output_path = output_path
+        self.future = RenderFuture(job_id)
+        self.submitted_at = time.monotonic()
+        self.started_at = None
+
+    def expired(self, now: float) -> bool:
+        """Whether the job has been running longer than its time limit."""
+        return bool(self.timeout) and self.started_at is not None and now - self.started_at > self.timeout
+
+
+class _Worker:
+    """Parent-side handle of a render worker process."""
+
+    def __init__(self, process, conn):
+        self.process = process
+        self.conn = conn
+        self.pid = None
+        self.ready = False
+        self.retiring = False
+        self.job: Optional[_Job] = None
+        self.jobs_done = 0
+        self.jobs_failed = 0
+        self.busy_seconds = 0.0
+        self.rss_bytes: Optional[int] = None
+        self.warm_up_seconds: Optional[float] = None
+        self.started_at = time.monotonic()
+
+    @property
+    def jobs_total(self) -> int:
+        return self.jobs_done + self.jobs_failed
+
+    def stats(self) -> Dict[str, Any]:
+        uptime = time.monotonic() - self.started_at
+        return {
+            'pid': self.pid,
+            'ready': self.ready,
+            'busy': self.job is not None,
+            'retiring': self.retiring,
+            'jobs': self.jobs_done,
+            'failed': self.jobs_failed,
+            'rss_mb': round(self.rss_bytes / (1024 * 1024), 1) if self.rss_bytes else None,
+            'warm_up_ms': self.warm_up_seconds * 1000 if self.warm_up_seconds is not None else None,
+            'avg_render_ms': self.busy_seconds / self.jobs_done * 1000 if self.jobs_done else None,
+            'jobs_per_minute': self.jobs_done / uptime * 60 if uptime else 0.0,
+            'utilization': self.busy_seconds / uptime if uptime else 0.0,
+        }
+
+
+class RenderPool:
+    """
+    Pool of long-lived, pre-warmed render worker processes.
+
+    Each worker imports WeasyPrint and prepares the compiled template, parsed
+    stylesheets, fonts and profile picture once at start-up, then renders PDFs
+    for jobs taken from a bounded FIFO queue. Rendering therefore never runs
+    on the caller's thread and does not compete for the caller's GIL.
+
+    A supervisor thread dispatches queued jobs to idle workers and resolves
+    the ``concurrent.futures.Future`` returned by ``submit``. It also enforces
+    the per-job time limit and the per-worker memory limit by killing the
+    offending worker and failing its job with RenderTimeoutError or
+    RenderMemoryError, and recycles workers after a number of jobs or when
+    their memory use has grown past the limit between jobs.
+    """
+
+    def __init__(self, workers: Optional[int] = None, max_queue: Optional[int] = None,
+                 langs: Optional[List[str]] = None, start_method: Optional[str] = None,
+                 timeout: Optional[float] = None, max_jobs_per_worker: Optional[int] = None,
+                 max_rss_mb: Optional[int] = None, warm_up: bool = False):
+        """
+        Initialize the pool. Workers are started by start() or on first submit.
+
+        Args:
+            workers: Number of worker processes. Defaults to settings.RENDER_POOL_WORKERS
+            max_queue: Maximum number of queued (not yet running) jobs.
+                Defaults to settings.RENDER_POOL_MAX_QUEUE
+            langs: Languages to pre-warm in each worker. Defaults to settings.SUPPORTED_LANGUAGES
+            start_method: multiprocessing start method. Defaults to settings.RENDER_POOL_START_METHOD
+            timeout: Default per-job render time limit in seconds; 0 disables it.
+                Defaults to settings.RENDER_TIMEOUT_SECONDS
+            max_jobs_per_worker: Jobs after which a worker is replaced; 0 disables it.
+                Defaults to settings.RENDER_WORKER_MAX_JOBS
+            max_rss_mb: Worker memory limit in MB; 0 disables it.
+                Defaults to settings.RENDER_WORKER_MAX_RSS_MB
+            warm_up: Have each worker render the sample CVs before taking jobs
+                (if settings.WARM_UP_ENABLED). Pays off for long-lived pools; a
+                pool started for one batch would spend the time on throwaway renders
+        """
+        self.size = max(1, workers or settings.RENDER_POOL_WORKERS)
+        self.max_queue = max_queue or settings.RENDER_POOL_MAX_QUEUE
+        self.langs = list(langs or settings.SUPPORTED_LANGUAGES)
+        self._context = multiprocessing.get_context(start_method or settings.RENDER_POOL_START_METHOD)
+        self.timeout = settings.RENDER_TIMEOUT_SECONDS if timeout is None else timeout
+        self.max_jobs_per_worker = (
+            settings.RENDER_WORKER_MAX_JOBS if max_jobs_per_worker is None else max_jobs_per_worker
+        )
+        if max_rss_mb is None:
+            max_rss_mb = settings.RENDER_WORKER_MAX_RSS_MB
+        self.max_rss_bytes = int(max_rss_mb * 1024 * 1024)
+        self.warm_up = warm_up
+
+        self._lock = threading.Lock()
+        self._pending: deque = deque()
+        self._workers: List[_Worker] = []
+        self._job_ids = itertools.count(1)
+        self._wakeup_recv, self._wakeup_send = multiprocessing.Pipe(duplex=False)
+        self._supervisor: Optional[threading.Thread] = None
+        self._started = False
+        self._closed = False
+        self._spawn_failures = 0
+        self._started_at = None
+
+        self._submitted = 0
+        self._completed = 0
+        self._failed = 0
+        self._rejected = 0
+        self._timeouts = 0
+        self._memory_kills = 0
+        self._crashes = 0
+        self._cancelled = 0
+        self._recycled = {'max_jobs': 0, 'max_rss': 0}
+
+    # ------------------------------------------------------------------
+    # Public API
+
+    def start(self):
+        """Start the worker processes and the supervisor thread."""
+        with self._lock:
+            if self._started:
+                return
+            if self._closed:
+                raise RenderPoolError("Render pool has been shut down")
+            self._started = True
+            self._started_at = time.monotonic()
+            for _ in range(self.size):
+                self._spawn_worker()
+            self._supervisor = threading.Thread(
+                target=self._supervise, name='render-pool-supervisor', daemon=True
+            )
+            self._supervisor.start()
+        logger.info(f"Render pool started with {self.size} workers (queue limit {self.max_queue})")
+
+    def submit(self, cv_data: Dict[str, Any], lang: str = 'en',
+               timeout: Optional[float] = None, output_path: Optional[str] = None,
+               variant: Optional[str] = None, preview: bool = False,
+               **options: Any) -> RenderFuture:
+        """
+        Queue a render job.
+
+        The future fails with RenderTimeoutError if the render runs longer than
+        ``timeout``, with RenderMemoryError if the worker exceeds the memory
+        limit, and with RenderWorkerCrashedError if the worker dies. It fails
+        with DataValidationError if the CV data does not fit the template and
+        with PDFGenerationError if rendering fails otherwise.
+
+        Args:
+            cv_data: Complete CV data dictionary
+            lang: Language code
+            timeout: Render time limit in seconds, excluding time spent queued.
+                Defaults to the pool's timeout
+            output_path: Have the worker write the PDF to this file instead of
+                sending the bytes back
+            variant: Template variant in settings.TEMPLATE_VARIANTS. Defaults to settings.TEMPLATE_FILE
+            preview: Also render the first-page preview, from the same layout
+            **options: Keyword arguments for CVGenerator.generate_pdf_bytes
+
+        Returns:
+            RenderFuture resolving to the PDF bytes, to the number of bytes
+            written when ``output_path`` is given, or to a tuple of
+            (PdfPreview, PDF bytes) with ``preview``
+
+        Raises:
+            RenderQueueFullError: If the queue already holds max_queue jobs
+            RenderPoolError: If the pool has been shut down
+        """
+        if lang not in settings.SUPPORTED_LANGUAGES:
+            raise ValueError(f"Language must be one of {settings.SUPPORTED_LANGUAGES}")
+        if variant is not None:
+            if variant not in settings.TEMPLATE_VARIANTS:
+                raise ValueError(f"Template variant must be one of {list(settings.TEMPLATE_VARIANTS)}")
+            options['variant'] = variant
+        if preview:
+            if output_path:
+                raise ValueError("Preview jobs cannot write to an output path")
+            options['preview'] = True
+        self.start()
+
+        with self._lock:
+            if self._closed:
+                raise RenderPoolError("Render pool has been shut down")
+            if len(self._pending) >= self.max_queue:
+                self._rejected += 1
+                raise RenderQueueFullError(
+                    f"Render queue is full ({self.max_queue} jobs waiting)"
+                )
+            job = _Job(next(self._job_ids), cv_data, lang, options,
+                       self.timeout if timeout is None else timeout,
+                       os.path.abspath(output_path) if output_path else None)
+            self._pending.append(job)
+            self._submitted += 1
+
+        self._wake()
+        return job.future
+
+    def render(self, cv_data: Dict[str, Any], lang: str = 'en',
+               timeout: Optional[float] = None, **options: Any) -> bytes:
+        """
+        Render a PDF on the pool and wait for the result.
+
+        Args:
+            cv_data: Complete CV data dictionary
+            lang: Language code
+            timeout: Render time limit in seconds. Defaults to the pool's timeout
+            **options: Keyword arguments for CVGenerator.generate_pdf_bytes
+
+        Returns:
+            PDF content as bytes
+
+        Raises:
+            RenderQueueFullError: If the queue is full
+            RenderTimeoutError: If the render exceeds its time limit
+            RenderMemoryError: If the worker exceeds its memory limit
+            DataValidationError: If the CV data does not fit the template
+            PDFGenerationError: If rendering fails
+        """
+        return self.submit(cv_data, lang, timeout=timeout, **options).result()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get pool statistics.
+
+        Returns:
+            Dictionary with queue depth, job counters, limit events and per-worker throughput
+        """
+        with self._lock:
+            return {
+                'workers': self.size,
+                'alive_workers': sum(1 for w in self._workers if w.process.is_alive()),
+                'retiring_workers': sum(1 for w in self._workers if w.retiring),
+                'queue_depth': len(self._pending),
+                'max_queue': self.max_queue,
+                'in_flight': sum(1 for w in self._workers if w.job is not None),
+                'submitted': self._submitted,
+                'completed': self._completed,
+                'failed': self._failed,
+                'rejected': self._rejected,
+                'timeouts': self._timeouts,
+                'memory_kills': self._memory_kills,
+                'crashes': self._crashes,
+                'cancelled': self._cancelled,
+                'recycled': dict(self._recycled),
+                'limits': {
+                    'timeout_seconds': self.timeout,
+                    'max_jobs_per_worker': self.max_jobs_per_worker,
+                    'max_rss_mb': self.max_rss_bytes // (1024 * 1024),
+                },
+                'uptime_seconds': time.monotonic() - self._started_at if self._started_at else 0.0,
+                'per_worker': [w.stats() for w in self._workers],
+            }
+
+    def cancel(self, future: RenderFuture, interrupt: bool = True) -> bool:
+        """
+        Cancel a submitted job.
+
+        A queued job is dropped. A running job cannot be stopped inside its
+        worker, so with ``interrupt`` the worker is killed and replaced, and
+        the future fails with RenderCancelledError.
+
+        Args:
+            future: Future returned by submit()
+            interrupt: Also cancel the job if it is already running
+
+        Returns:
+            True if the job was cancelled
+        """
+        with self._lock:
+            if future.cancel():
+                self._pending = deque(job for job in self._pending if job.future is not future)
+                self._cancelled += 1
+                return True
+            if not interrupt:
+                return False
+            for worker in self._workers:
+                job = worker.job
+                if job is None or job.future is not future or worker.retiring:
+                    continue
+                worker.job = None
+                self._cancelled += 1
+                job.future.render_seconds = time.monotonic() - job.started_at
+                job.future.set_exception(RenderCancelledError(f"Render job {job.id} was cancelled"))
+                self._retire(worker, 'cancelled', force=True)
+                return True
+        return False
+
+    def shutdown(self, wait: bool = True):
+        """
+        Stop the pool. Queued jobs are failed; running jobs are allowed to finish if ``wait``.
+
+        Args:
+            wait: Wait for running jobs and worker processes to finish
+        """
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            pending = list(self._pending)
+            self._pending.clear()
+
+        for job in pending:
+            if job.future.set_running_or_notify_cancel():
+                job.future.set_exception(RenderPoolError("Render pool shut down"))
+
+        self._wake()
+        if wait and self._supervisor is not None:
+            self._supervisor.join()
+        logger.info("Render pool shut down")
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.shutdown()
+
+    # ------------------------------------------------------------------
+    # Supervisor
+
+    def _wake(self):
+        """Wake the supervisor so it dispatches new jobs promptly."""
+        try:
+            self._wakeup_send.send(None)
+        except OSError:
+            pass
+
+    def _spawn_worker(self):
+        """Start one worker process. Caller holds the lock."""
+        parent_conn, child_conn = self._context.Pipe()
+        process = self._context.Process(
+            target=_worker_main, args=(child_conn, self.langs, self.warm_up),
+            name='cv-render-worker', daemon=True
+        )
+        process.start()
+        child_conn.close()
+        self._workers.append(_Worker(process, parent_conn))
+
+    def _supervise(self):
+        """Dispatch jobs, collect results and replace dead workers."""
+        while True:
+            with self._lock:
+                if self._closed and not any(w.job for w in self._workers):
+                    break
+                self._enforce_limits()
+                self._dispatch()
+                # Snapshot: the worker list changes under the lock while messages are handled
+                workers = {w.conn: w for w in self._workers}
+
+            for conn in wait(list(workers) + [self._wakeup_recv], timeout=MONITOR_INTERVAL):
+                if conn is self._wakeup_recv:
+                    while self._wakeup_recv.poll():
+                        self._wakeup_recv.recv()
+                    continue
+                self._handle_message(workers[conn])
+
+        self._stop_workers()
+
+    def _dispatch(self):
+        """Hand queued jobs to idle workers. Caller holds the lock."""
+        for worker in self._workers:
+            if not self._pending:
+                return
+            if not worker.ready or worker.retiring or worker.job is not None:
+                continue
+            while self._pending:
+                job = self._pending.popleft()
+                if not job.future.set_running_or_notify_cancel():
+                    continue  # Cancelled while queued
+                job.started_at = time.monotonic()
+                job.future.queued_seconds = job.started_at - job.submitted_at
+                job.future.worker_pid = worker.pid
+                worker.job = job
+                try:
+                    worker.conn.send((job.id, job.cv_data, job.lang, job.options, job.output_path))
+                except (OSError, ValueError) as e:
+                    self._fail_job(worker, RenderPoolError(f"Could not send job to worker: {e}"))
+                except Exception as e:
+                    # The job could not be pickled, so nothing reached the worker,
+                    # which stays idle and takes the next job
+                    self._fail_job(worker, RenderPoolError(
+                        f"Could not send job to worker: {type(e).__name__}: {e}"
+                    ))
+                    continue
+                break
+
+    def _handle_message(self, worker: _Worker):
+        """Process one message (or the death) of a worker."""
+        try:
+            message = worker.conn.recv()
+        except (EOFError, OSError):
+            self._handle_worker_exit(worker)
+            return
+
+        kind = message[0]
+        with self._lock:
+            if kind == 'ready':
+                worker.pid, worker.warm_up_seconds = message[1:3]
+                worker.ready = True
+                self._spawn_failures = 0
+                warm_up = f" (warm-up {worker.warm_up_seconds:.2f}s)" if worker.warm_up_seconds is not None else ""
+                logger.info(f"Render worker {worker.pid} ready{warm_up}")
+            elif kind == 'failed':
+                logger.error(f"Render worker {message[1]} failed to start: {message[2]}")
+            elif kind in ('done', 'error', 'invalid'):
+                job = worker.job
+                worker.job = None
+                if job is None or job.id != message[1]:
+                    return
+                payload, elapsed, rss_bytes = message[2:]
+                worker.busy_seconds += elapsed
+                worker.rss_bytes = rss_bytes
+                job.future.render_seconds = elapsed
+                if kind == 'done':
+                    worker.jobs_done += 1
+                    self._completed += 1
+                    job.future.set_result(payload)
+                else:
+                    worker.jobs_failed += 1
+                    self._failed += 1
+                    error_type = DataValidationError if kind == 'invalid' else PDFGenerationError
+                    job.future.set_exception(error_type(payload))
+                self._recycle_if_needed(worker)
+
+    def _enforce_limits(self):
+        """Kill workers whose job ran out of time or memory. Caller holds the lock."""
+        now = time.monotonic()
+        for worker in list(self._workers):
+            job = worker.job
+            if job is None or worker.retiring:
+                continue
+            if job.expired(now):
+                self._timeouts += 1
+                self._fail_job(worker, RenderTimeoutError(
+                    f"Render exceeded the {job.timeout:g}s time limit (job {job.id}, worker {worker.pid})"
+                ))
+                self._retire(worker, 'timeout', force=True)
+                continue
+            if self.max_rss_bytes and worker.pid:
+                rss_bytes = _process_rss_bytes(worker.pid)
+                if rss_bytes is not None:
+                    worker.rss_bytes = rss_bytes
+                    if rss_bytes > self.max_rss_bytes:
+                        self._memory_kills += 1
+                        self._fail_job(worker, RenderMemoryError(
+                            f"Render worker {worker.pid} exceeded the memory limit "
+                            f"({rss_bytes // (1024 * 1024)} MB > {self.max_rss_bytes // (1024 * 1024)} MB, "
+                            f"job {job.id})"
+                        ))
+                        self._retire(worker, 'max_rss', force=True)
+
+    def _recycle_if_needed(self, worker: _Worker):
+        """Replace a worker that reached its job count or memory limit. Caller holds the lock."""
+        if self.max_jobs_per_worker and worker.jobs_total >= self.max_jobs_per_worker:
+            self._recycled['max_jobs'] += 1
+            self._retire(worker, 'max_jobs')
+        elif self.max_rss_bytes and worker.rss_bytes and worker.rss_bytes > self.max_rss_bytes:
+            self._recycled['max_rss'] += 1
+            self._retire(worker, 'max_rss')
+
+    def _retire(self, worker: _Worker, reason: str, force: bool = False):
+        """
+        Stop dispatching to a worker, start its replacement and make it exit.
+        Caller holds the lock.
+
+        Args:
+            worker: Worker to retire
+            reason: Reason recorded in the log
+            force: Kill the process instead of asking it to exit after its current job
+        """
+        worker.retiring = True
+        logger.warning(
+            f"Recycling render worker {worker.pid} ({reason}) after {worker.jobs_total} jobs"
+        )
+        if not self._closed:
+            self._spawn_worker()
+        if force:
+            worker.process.kill()
+        else:
+            try:
+                worker.conn.send(None)
+            except (OSError, ValueError):
+                worker.process.kill()
+
+    def _handle_worker_exit(self, worker: _Worker):
+        """Fail the worker's current job and start a replacement unless it was retired."""
+        worker.process.join(timeout=1.0)
+        with self._lock:
+            if worker in self._workers:
+                self._workers.remove(worker)
+            worker.conn.close()
+
+            if worker.retiring:
+                return
+
+            if worker.job is not None:
+                self._crashes += 1
+                self._fail_job(worker, RenderWorkerCrashedError(
+                    f"Render worker {worker.pid} exited unexpectedly "
+                    f"(exit code {worker.process.exitcode})"
+                ))
+
+            if self._closed:
+                return
+            if not worker.ready:
+                self._spawn_failures += 1
+            if self._spawn_failures >= MAX_SPAWN_FAILURES:
+                logger.error("Render workers keep failing to start; failing queued jobs")
+                while self._pending:
+                    job = self._pending.popleft()
+                    if job.future.set_running_or_notify_cancel():
+                        self._failed += 1
+                        job.future.set_exception(RenderPoolError("Render workers failed to start"))
+                if not self._workers:
+                    self._closed = True
+                return
+            logger.warning(f"Render worker {worker.pid} exited; starting a replacement")
+            self._spawn_worker()
+
+    def _fail_job(self, worker: _Worker, error: Exception):
+        """Fail the worker's current job. Caller holds the lock."""
+        job = worker.job
+        worker.job = None
+        worker.jobs_failed += 1
+        self._failed += 1
+        if job.started_at is not None:
+            job.future.render_seconds = time.monotonic() - job.started_at
+        job.future.set_exception(error)
+
+    def _stop_workers(self):
+        """Ask all workers to exit and terminate those that do not."""
+        with self._lock:
+            workers = list(self._workers)
+        for worker in workers:
+            try:
+                worker.conn.send(None)
+            except (OSError, ValueError):
+                pass
+        for worker in workers:
+            worker.process.join(timeout=5.0)
+            if worker.process.is_alive():
+                worker.process.terminate()
+                worker.process.join()
+            worker.conn.close()
+
+
+_pool: Optional[RenderPool] = None
+_pool_lock = threading.Lock()
+
+
+def get_render_pool() -> RenderPool:
+    """
+    Get the process-wide render pool, creating and starting it on first use.
+
+    Returns:
+        Shared RenderPool configured from settings, with warmed-up workers
+    """
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = RenderPool(warm_up=True)
+            _pool.start()
+            atexit.register(_pool.shutdown)
+        return _pool
@@ -0,0 +1,231 @@
+import threading
+from collections import OrderedDict
+from concurrent.futures import CancelledError, ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from typing import Dict, Any, Optional, Set, Tuple
+
+from config.settings import settings
+from src.core.cv_generator import CVGenerator, PdfPreview
+from src.core.render_cache import RenderCache
+from src.core.render_pool import RenderPool, get_render_pool
+from src.utils.exceptions import RenderPoolError
+from src.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+# Finished speculative renders kept for sessions that have not clicked yet
+MAX_RESULTS = 4
+
+
+class _SpeculativeJob:
+    """A background render, its cancellation flag and the sessions waiting for it."""
+
+    __slots__ = ('future', 'pool', 'cancelled', 'sessions')
+
+    def __init__(self):
+        self.future = None
+        self.pool = None
+        self.cancelled = threading.Event()
+        self.sessions: Set[str] = set()
+
+
+class SpeculativeRenderer:
+    """
+    Renders the standard CV in the background before it is asked for.
+
+    Renders are keyed by a hash of the CV data and language, so sessions
+    viewing the same CV share one render, and run on the render pool when
+    settings.RENDER_POOL_ENABLED is set, otherwise one at a time on a
+    background thread of this process. The finished preview and PDF are at
+    hand when the user clicks generate.
+
+    Each session holds one render. Starting a render for new data releases
+    the session's previous one, which is cancelled once no session holds it:
+    a queued render is dropped, and a running one is left to finish and its
+    result discarded. Beyond ``max_results`` renders, the least recently
+    used finished ones are forgotten; renders still in progress are never
+    cancelled to make room.
+    """
+
+    def __init__(self, max_results: int = MAX_RESULTS):
+        """
+        Initialize the renderer; the background thread starts with the first render.
+
+        Args:
+            max_results: Number of speculative renders to keep
+        """
+        self.max_results = max_results
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='speculative-render')
+        self._lock = threading.Lock()
+        self._jobs: OrderedDict = OrderedDict()
+        self._session_keys: Dict[str, str] = {}
+        self._started = 0
+        self._cancelled = 0
+        self._discarded = 0
+        self._evicted = 0
+        self._hits = 0
+        self._misses = 0
+
+    @staticmethod
+    def make_key(cv_data: Dict[str, Any], lang: str) -> str:
+        """Content hash identifying a speculative render."""
+        return RenderCache.make_key(data=cv_data, lang=lang)
+
+    def start(self, cv_data: Dict[str, Any], lang: str, session: str) -> Optional[str]:
+        """
+        Start rendering a CV in the background unless it is already rendered or rendering.
+
+        Args:
+            cv_data: Complete CV data dictionary
+            lang: Language code
+            session: ID of the session asking; its previous render is released
+
+        Returns:
+            Key to pass to result(), or None if the render could not be started
+        """
+        key = self.make_key(cv_data, lang)
+        # Starting the shared pool spawns its workers; do that before taking the lock
+        pool = get_render_pool() if settings.RENDER_POOL_ENABLED else None
+        with self._lock:
+            previous = self._session_keys.get(session)
+            if previous is not None and previous != key:
+                self._release(previous, session)
+
+            job = self._jobs.get(key)
+            if job is None:
+                job = _SpeculativeJob()
+                try:
+                    self._submit(cv_data, lang, job, pool)
+                except RenderPoolError as e:
+                    # The pool is busy with real renders; the click renders instead
+                    logger.debug(f"Speculative render not started: {e}")
+                    self._session_keys.pop(session, None)
+                    return None
+                self._jobs[key] = job
+                self._started += 1
+                logger.debug(f"Speculative render started: {key[:12]} ({lang})")
+            self._jobs.move_to_end(key)
+            job.sessions.add(session)
+            self._session_keys[session] = key
+            self._evict()
+        return key
+
+    def _submit(self, cv_data: Dict[str, Any], lang: str, job: _SpeculativeJob,
+                pool: Optional[RenderPool]):
+        """Start the render on the pool if given, otherwise on the background thread."""
+        if pool is not None:
+            job.pool = pool
+            job.future = pool.submit(cv_data, lang, preview=True)
+        else:
+            job.future = self._executor.submit(self._render, cv_data, lang, job)
+
+    def _release(self, key: str, session: str):
+        """Drop a session's hold on a render and cancel it if no session holds it. Caller holds the lock."""
+        job = self._jobs.get(key)
+        if job is None:
+            return
+        job.sessions.discard(session)
+        if not job.sessions:
+            self._drop(key)
+
+    def _drop(self, key: str):
+        """Forget a render, cancelling it if it has not finished. Caller holds the lock."""
+        job = self._jobs.pop(key)
+        for session in job.sessions:
+            if self._session_keys.get(session) == key:
+                del self._session_keys[session]
+        job.cancelled.set()
+        if job.future.done():
+            return
+        # A pool job is also taken out of the pool's queue; a running one is not interrupted
+        cancelled = job.pool.cancel(job.future, interrupt=False) if job.pool else job.future.cancel()
+        if cancelled:
+            self._cancelled += 1
+            logger.debug(f"Speculative render cancelled: {key[:12]}")
+        else:
+            # Already running; it finishes on its own and the result is thrown away
+            self._discarded += 1
+            logger.debug(f"Speculative render discarded while running: {key[:12]}")
+
+    def _evict(self):
+        """Forget the least recently used finished renders beyond max_results. Caller holds the lock."""
+        excess = len(self._jobs) - self.max_results
+        for key in [key for key, job in self._jobs.items() if job.future.done()][:max(excess, 0)]:
+            self._drop(key)
+            self._evicted += 1
+
+    @staticmethod
+    def _render(cv_data: Dict[str, Any], lang: str,
+                job: _SpeculativeJob) -> Optional[Tuple[PdfPreview, bytes]]:
+        """Render the first-page preview and the full PDF from a single layout."""
+        generator = CVGenerator(lang=lang)
+        preview = generator.generate_preview(cv_data)
+        if job.cancelled.is_set():
+            return None
+        # The preview left its layout in the layout cache, so this only writes the PDF
+        pdf_bytes = generator.generate_pdf_bytes(cv_data)
+        return preview, pdf_bytes
+
+    def result(self, key: Optional[str],
+               timeout: Optional[float] = None) -> Optional[Tuple[PdfPreview, bytes]]:
+        """
+        Get a speculative render, waiting for it if it is still running.
+
+        Args:
+            key: Key returned by start()
+            timeout: Seconds to wait for a queued or running render.
+                Defaults to settings.RENDER_TIMEOUT_SECONDS; 0 waits until it finishes
+
+        Returns:
+            Tuple of (first-page preview, full PDF bytes), or None if there is no
+            usable render for the key
+        """
+        if timeout is None:
+            timeout = settings.RENDER_TIMEOUT_SECONDS
+        with self._lock:
+            job = self._jobs.get(key) if key else None
+        if job is not None:
+            try:
+                # A render stuck on the background thread must not hang the caller
+                result = job.future.result(timeout or None)
+            except (CancelledError, FutureTimeoutError):
+                result = None
+            except Exception as e:
+                logger.warning(f"Speculative render failed: {e}")
+                result = None
+            if result is not None:
+                with self._lock:
+                    self._hits += 1
+                return result
+        with self._lock:
+            self._misses += 1
+        return None
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get speculative render statistics.
+
+        Returns:
+            Dictionary with started, cancelled (while queued), discarded (while
+            running), evicted, hit and miss counts and the renders kept
+        """
+        with self._lock:
+            return {
+                'enabled': settings.SPECULATIVE_RENDER_ENABLED,
+                'started': self._started,
+                'cancelled': self._cancelled,
+                'discarded': self._discarded,
+                'evicted': self._evicted,
+                'hits': self._hits,
+                'misses': self._misses,
+                'renders': {
+                    key[:12]: {
+                        'state': 'done' if job.future.done() else 'running' if job.future.running() else 'queued',
+                        'sessions': len(job.sessions),
+                    }
+                    for key, job in self._jobs.items()
+                },
+            }
+
+
+# Global speculative renderer shared by all sessions
+speculative_renderer = SpeculativeRenderer()
@@ -0,0 +1,150 @@
+import hashlib
+import os
+import threading
+from typing import Dict, Any, List, Tuple
+
+from weasyprint import CSS
+from weasyprint.text.fonts import FontConfiguration
+
+from config.settings import settings
+from src.core.assets import asset_fetcher
+from src.utils.exceptions import TemplateNotFoundError
+from src.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+
+class _StylesheetEntry:
+    """Parsed stylesheets for one (stylesheet file, language) pair."""
+
+    __slots__ = ('stylesheets', 'css_text', 'signature', 'digest')
+
+    def __init__(self, stylesheets: List[CSS], css_text: str, signature: Tuple[int, int], digest: str):
+        self.stylesheets = stylesheets
+        self.css_text = css_text
+        self.signature = signature
+        self.digest = digest
+
+
+class StylesheetCache:
+    """
+    Process-wide cache of parsed WeasyPrint stylesheets.
+
+    Each template stylesheet is parsed once per language, together with the
+    language's remote font and icon stylesheets, into a reusable ``CSS``
+    object. All stylesheets register their ``@font-face`` rules with one
+    shared ``FontConfiguration``, which must be passed to every render that
+    uses them. Files are revalidated by (mtime_ns, size) on each lookup.
+    """
+
+    def __init__(self):
+        """Initialize an empty cache with a shared font configuration."""
+        self._lock = threading.RLock()
+        self._entries: Dict[Tuple[str, str], _StylesheetEntry] = {}
+        self.font_config = FontConfiguration()
+        self._hits = 0
+        self._misses = 0
+
+    def build_css_text(self, stylesheet_path: str, lang: str) -> str:
+        """
+        Read a stylesheet file prefixed with the language's remote imports.
+
+        Args:
+            stylesheet_path: Path to the template's CSS file
+            lang: Language code selecting the remote font stylesheets
+
+        Returns:
+            Complete CSS source as used for PDF renders
+        """
+        with open(stylesheet_path, 'r', encoding='utf-8') as f:
+            local_css = f.read()
+        imports = ''.join(
+            f"@import url('{url}');\n" for url in settings.REMOTE_STYLESHEETS.get(lang, [])
+        )
+        return imports + local_css
+
+    def get_entry(self, stylesheet_path: str, lang: str) -> _StylesheetEntry:
+        """
+        Get the parsed stylesheets for a stylesheet file and language.
+
+        Args:
+            stylesheet_path: Path to the template's CSS file
+            lang: Language code selecting the remote font stylesheets
+
+        Returns:
+            Cache entry holding the parsed ``CSS`` objects, source text and digest
+
+        Raises:
+            TemplateNotFoundError: If the stylesheet cannot be read or parsed
+        """
+        stylesheet_path = os.path.abspath(stylesheet_path)
+        try:
+            stat = os.stat(stylesheet_path)
+        except OSError as e:
+            raise TemplateNotFoundError(f"Could not load stylesheet: {e}")
+        signature = (stat.st_mtime_ns, stat.st_size)
+        key = (stylesheet_path, lang)
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.signature == signature:
+                self._hits += 1
+                return entry
+
+            self._misses += 1
+            try:
+                css_text = self.build_css_text(stylesheet_path, lang)
+                stylesheet = CSS(
+                    string=css_text,
+                    base_url=os.path.dirname(stylesheet_path) + os.sep,
+                    url_fetcher=asset_fetcher,
+                    font_config=self.font_config
+                )
+            except Exception as e:
+                logger.error(f"Error parsing stylesheet {stylesheet_path}: {e}")
+                raise TemplateNotFoundError(f"Could not load stylesheet: {e}")
+
+            digest = hashlib.sha256(css_text.encode('utf-8')).hexdigest()
+            entry = _StylesheetEntry([stylesheet], css_text, signature, digest)
+            self._entries[key] = entry
+            logger.info(f"Stylesheet parsed and cached: {stylesheet_path} ({lang})")
+            return entry
+
+    def get_stylesheets(self, stylesheet_path: str, lang: str) -> List[CSS]:
+        """
+        Get the parsed stylesheets to pass as ``stylesheets=`` to a render.
+
+        Args:
+            stylesheet_path: Path to the template's CSS file
+            lang: Language code
+
+        Returns:
+            List of parsed WeasyPrint ``CSS`` objects
+        """
+        return self.get_entry(stylesheet_path, lang).stylesheets
+
+    def clear(self):
+        """Drop all parsed stylesheets and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self.font_config = FontConfiguration()
+            self._hits = 0
+            self._misses = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dictionary with hit and miss counts and the cached (path, language) pairs
+        """
+        with self._lock:
+            return {
+                'hits': self._hits,
+                'misses': self._misses,
+                'stylesheets': [f"{path} ({lang})" for path, lang in sorted(self._entries)],
+            }
+
+
+# Global cache shared by all CVGenerator instances
+stylesheet_cache = StylesheetCache()
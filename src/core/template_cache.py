@@ -0,0 +1,214 @@
+import hashlib
+import os
+import threading
+import time
+from typing import Dict, Any, Optional, Tuple
+
+from jinja2 import BytecodeCache, Environment, FileSystemBytecodeCache, FileSystemLoader, Template
+
+from config.settings import settings
+from src.utils.exceptions import TemplateNotFoundError
+from src.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+
+class _TemplateEntry:
+    """A compiled template together with the file state it was compiled from."""
+
+    __slots__ = ('template', 'signature', 'digest')
+
+    def __init__(self, template: Template, signature: Tuple[int, int], digest: str):
+        self.template = template
+        self.signature = signature
+        self.digest = digest
+
+
+class TemplateRegistry:
+    """
+    Process-wide, thread-safe cache of compiled Jinja2 templates.
+
+    Templates are keyed by their absolute path and revalidated with a single
+    ``os.stat`` per lookup; a template is only re-read and recompiled when its
+    modification time or size changes. One Jinja2 environment is kept per
+    template directory so all CVGenerator instances share the same loader.
+
+    Compiled template code is also persisted to an on-disk bytecode cache, so
+    a freshly started process loads it instead of compiling the template.
+    """
+
+    def __init__(self, bytecode_cache_dir: Optional[str] = None):
+        """
+        Initialize an empty registry.
+
+        Args:
+            bytecode_cache_dir: Directory for persisted template bytecode.
+                Defaults to settings.TEMPLATE_BYTECODE_CACHE_DIR; empty disables it.
+        """
+        if bytecode_cache_dir is None:
+            bytecode_cache_dir = settings.TEMPLATE_BYTECODE_CACHE_DIR
+        self.bytecode_cache_dir = bytecode_cache_dir or None
+        self._bytecode_cache = None
+
+        self._lock = threading.RLock()
+        self._environments: Dict[str, Environment] = {}
+        self._entries: Dict[str, _TemplateEntry] = {}
+        self._hits = 0
+        self._misses = 0
+        self._reloads = 0
+
+    def _get_bytecode_cache(self) -> Optional[BytecodeCache]:
+        """Return the on-disk bytecode cache, creating its directory on first use."""
+        if self._bytecode_cache is None and self.bytecode_cache_dir:
+            try:
+                os.makedirs(self.bytecode_cache_dir, exist_ok=True)
+                self._bytecode_cache = FileSystemBytecodeCache(self.bytecode_cache_dir)
+            except OSError as e:
+                logger.warning(f"Template bytecode cache disabled ({self.bytecode_cache_dir}): {e}")
+                self.bytecode_cache_dir = None
+        return self._bytecode_cache
+
+    def _create_environment(self, template_dir: str) -> Environment:
+        """Create a Jinja2 environment backed by the bytecode cache."""
+        # The registry does its own caching and staleness checks, so the
+        # environment's internal cache would only hold duplicate copies.
+        return Environment(
+            loader=FileSystemLoader(template_dir),
+            cache_size=0,
+            bytecode_cache=self._get_bytecode_cache()
+        )
+
+    def _get_environment(self, template_dir: str) -> Environment:
+        """Return the shared environment for a template directory."""
+        env = self._environments.get(template_dir)
+        if env is None:
+            env = self._create_environment(template_dir)
+            self._environments[template_dir] = env
+        return env
+
+    def get_entry(self, template_dir: str, template_name: str) -> _TemplateEntry:
+        """
+        Get the cache entry for a template, compiling it if needed.
+
+        Args:
+            template_dir: Directory containing the template
+            template_name: Template file name relative to ``template_dir``
+
+        Returns:
+            Cache entry holding the compiled template, its file signature and digest
+
+        Raises:
+            TemplateNotFoundError: If the template file cannot be read or compiled
+        """
+        template_dir = os.path.abspath(template_dir)
+        full_path = os.path.join(template_dir, template_name)
+
+        try:
+            stat = os.stat(full_path)
+        except OSError as e:
+            raise TemplateNotFoundError(f"Could not load template: {e}")
+        signature = (stat.st_mtime_ns, stat.st_size)
+
+        with self._lock:
+            entry = self._entries.get(full_path)
+            if entry is not None and entry.signature == signature:
+                self._hits += 1
+                return entry
+
+            self._misses += 1
+            if entry is not None:
+                self._reloads += 1
+                logger.info(f"Template changed on disk, reloading: {full_path}")
+
+            try:
+                env = self._get_environment(template_dir)
+                with open(full_path, 'rb') as f:
+                    digest = hashlib.sha256(f.read()).hexdigest()
+                template = env.get_template(template_name)
+            except Exception as e:
+                logger.error(f"Error compiling template {full_path}: {e}")
+                raise TemplateNotFoundError(f"Could not load template: {e}")
+
+            entry = _TemplateEntry(template, signature, digest)
+            self._entries[full_path] = entry
+            logger.info(f"Template compiled and cached: {full_path}")
+            return entry
+
+    def get_template(self, template_dir: str, template_name: str) -> Template:
+        """
+        Get a compiled template, reusing the cached one if the file is unchanged.
+
+        Args:
+            template_dir: Directory containing the template
+            template_name: Template file name relative to ``template_dir``
+
+        Returns:
+            Compiled Jinja2 template
+
+        Raises:
+            TemplateNotFoundError: If the template file cannot be read or compiled
+        """
+        return self.get_entry(template_dir, template_name).template
+
+    def precompile(self, template_dir: str) -> Dict[str, float]:
+        """
+        Compile every template in a directory into the on-disk bytecode cache.
+
+        Intended as a build/deploy step so that new processes never compile
+        templates. Templates whose bytecode is already current are only loaded.
+
+        Args:
+            template_dir: Directory containing the templates
+
+        Returns:
+            Dictionary mapping template names to compile/load time in seconds
+
+        Raises:
+            TemplateNotFoundError: If a template cannot be compiled
+        """
+        if not self._get_bytecode_cache():
+            logger.warning("No bytecode cache directory configured; nothing will be persisted")
+
+        with self._lock:
+            env = self._create_environment(os.path.abspath(template_dir))
+
+        timings = {}
+        for name in env.list_templates(extensions=['html']):
+            start = time.perf_counter()
+            try:
+                env.get_template(name)
+            except Exception as e:
+                raise TemplateNotFoundError(f"Could not compile template {name}: {e}")
+            timings[name] = time.perf_counter() - start
+            logger.info(f"Precompiled {name} in {timings[name] * 1000:.1f} ms")
+        return timings
+
+    def clear(self):
+        """Drop all cached templates and environments and reset the counters."""
+        with self._lock:
+            self._environments.clear()
+            self._entries.clear()
+            self._hits = 0
+            self._misses = 0
+            self._reloads = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dictionary with hit, miss and reload counts and the cached template paths
+        """
+        with self._lock:
+            return {
+                'hits': self._hits,
+                'misses': self._misses,
+                'reloads': self._reloads,
+                'templates': sorted(self._entries),
+                'bytecode_cache_dir': self.bytecode_cache_dir,
+            }
+
+
+# Global registry shared by all CVGenerator instances
+template_registry = TemplateRegistry()
+
@@ -0,0 +1,110 @@
+import os
+import threading
+import time
+from typing import Dict, Any, List, Optional
+
+from config.settings import settings
+from src.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+_lock = threading.Lock()
+_last_warm_up: Optional[Dict[str, Any]] = None
+_background_thread: Optional[threading.Thread] = None
+
+
+def warm_up(langs: Optional[List[str]] = None, sample_dir: Optional[str] = None,
+            pdf: bool = True) -> Dict[str, Any]:
+    """
+    Prime this process's render caches by rendering the sample CV in each language.
+
+    The first render in a process imports WeasyPrint, scans the system fonts,
+    loads the hyphenation dictionaries, compiles the template, parses the
+    stylesheets, fetches the remote fonts and prepares the profile picture.
+    Doing that here means the first real request sees steady-state latency.
+    The output is discarded and never stored in the render cache. A language
+    that fails to render is logged and skipped.
+
+    Args:
+        langs: Languages to warm. Defaults to settings.SUPPORTED_LANGUAGES
+        sample_dir: Directory holding ``personal_<lang>.json``. Defaults to settings.SAMPLE_DATA_DIRECTORY
+        pdf: Render PDFs as well as the HTML. Processes that only render HTML can skip WeasyPrint
+
+    Returns:
+        Dictionary with the total seconds, seconds per language and failed languages
+    """
+    global _last_warm_up
+    # Imported here so that importing WeasyPrint is part of the warm-up
+    from src.core.cv_generator import CVGenerator
+    from src.core.data_processor import DataProcessor
+
+    langs = langs or settings.SUPPORTED_LANGUAGES
+    sample_dir = sample_dir or settings.SAMPLE_DATA_DIRECTORY
+
+    start = time.perf_counter()
+    timings = {}
+    failed = []
+    for lang in langs:
+        lang_start = time.perf_counter()
+        try:
+            with open(os.path.join(sample_dir, f"personal_{lang}.json"), 'rb') as f:
+                cv_data = DataProcessor(lang=lang).load_from_file(f.read())
+            generator = CVGenerator(lang=lang)
+            generator.render_html_preview(cv_data)
+            if pdf:
+                generator.generate_pdf_bytes(cv_data, use_cache=False)
+        except Exception as e:
+            logger.warning(f"Warm-up render failed for '{lang}': {e}")
+            failed.append(lang)
+            continue
+        timings[lang] = time.perf_counter() - lang_start
+
+    result = {
+        'seconds': time.perf_counter() - start,
+        'languages': timings,
+        'failed': failed,
+        'pdf': pdf,
+        'finished_at': time.time(),
+    }
+    with _lock:
+        _last_warm_up = result
+    logger.info(f"Warm-up finished in {result['seconds']:.2f}s ({', '.join(timings) or 'no languages'})")
+    return result
+
+
+def start_background_warm_up() -> bool:
+    """
+    Warm the renderer of this process on a background thread, once per process.
+
+    With the render pool enabled the pool is started instead, and its
+    workers warm themselves up before they take jobs.
+
+    Returns:
+        True if this call started the warm-up
+    """
+    global _background_thread
+    with _lock:
+        if _background_thread is not None or not settings.WARM_UP_ENABLED:
+            return False
+
+        def run():
+            if settings.RENDER_POOL_ENABLED:
+                from src.core.render_pool import get_render_pool
+                get_render_pool()
+            else:
+                warm_up()
+
+        _background_thread = threading.Thread(target=run, name='render-warm-up', daemon=True)
+        _background_thread.start()
+        return True
+
+
+def warm_up_stats() -> Optional[Dict[str, Any]]:
+    """
+    Get the result of this process's last warm-up.
+
+    Returns:
+        Dictionary as returned by warm_up(), or None if the process has not warmed up
+    """
+    with _lock:
+        return dict(_last_warm_up) if _last_warm_up else None
@@ -0,0 +1,389 @@
+"""
+Local HTTP render service, run separately from the Streamlit app:
+
+    python -m src.server --port 8600 --workers 4
+
+Endpoints:
+
+    POST /render?lang=en&format=pdf   CV JSON in the body; returns the PDF
+                                      (optional &profile=<PDF profile name>)
+    POST /render?lang=en&format=html  Same, returns the rendered HTML
+    GET  /health                      200 when render workers are available
+    GET  /metrics                     Request, latency and worker pool statistics
+
+Connections are kept alive (HTTP/1.1). PDFs are rendered on a pool of
+render worker processes; when its queue is full the service answers
+429 Too Many Requests with a Retry-After header. HTML is rendered on the
+request threads, at most as many at once as there are render workers;
+further HTML requests wait briefly and are then answered with 429 as well.
+CV data that does not fit the template is answered with 422, a render that
+exceeds the worker memory limit with 503 and a Retry-After header, and
+other render failures with 500.
+"""
+import argparse
+import hashlib
+import json
+import signal
+import threading
+import time
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Any, List, Optional
+from urllib.parse import parse_qs, urlsplit
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+from config.settings import settings  # noqa: E402
+from src import __version__  # noqa: E402
+from src.core.cv_generator import CVGenerator  # noqa: E402
+from src.core.render_pool import RenderPool  # noqa: E402
+from src.core.warmup import warm_up, warm_up_stats  # noqa: E402
+from src.utils.exceptions import (  # noqa: E402
+    DataValidationError, PDFGenerationError, RenderMemoryError, RenderPoolError,
+    RenderQueueFullError, RenderTimeoutError
+)
+from src.utils.logger import setup_logger  # noqa: E402
+
+logger = setup_logger(__name__)
+
+FORMATS = ('pdf', 'html')
+
+# How long an HTML request waits for a free render slot before it is rejected (seconds)
+HTML_RENDER_WAIT_SECONDS = 5
+
+
+class RenderService:
+    """Rendering and metrics shared by all connections of a RenderServer."""
+
+    def __init__(self, pool: RenderPool):
+        """
+        Initialize the service.
+
+        Args:
+            pool: Worker pool used for PDF rendering
+        """
+        self.pool = pool
+        self.started_at = time.monotonic()
+        self._lock = threading.Lock()
+        # HTML renders run on the request threads; bound them like the PDF workers
+        self._html_slots = threading.BoundedSemaphore(pool.size)
+        self._generators: Dict[str, CVGenerator] = {}
+        self._responses: Dict[int, int] = {}
+        self._latency: Dict[str, Dict[str, float]] = {}
+        self._in_flight = 0
+
+    def _generator(self, lang: str) -> CVGenerator:
+        """Get the in-process generator used for HTML rendering."""
+        with self._lock:
+            generator = self._generators.get(lang)
+            if generator is None:
+                generator = self._generators[lang] = CVGenerator(lang=lang)
+            return generator
+
+    def render(self, cv_data: Dict[str, Any], lang: str, output_format: str,
+               profile: Optional[str] = None) -> tuple:
+        """
+        Render a CV.
+
+        Args:
+            cv_data: Complete CV data dictionary
+            lang: Language code
+            output_format: 'pdf' or 'html'
+            profile: PDF profile name. Defaults to settings.PDF_PROFILE
+
+        Returns:
+            Tuple of (body bytes, content type, render seconds)
+
+        Raises:
+            RenderQueueFullError: If the render queue or all HTML render slots are busy
+        """
+        if output_format == 'html':
+            if not self._html_slots.acquire(timeout=HTML_RENDER_WAIT_SECONDS):
+                raise RenderQueueFullError(f"All {self.pool.size} HTML render slots are busy")
+            try:
+                start = time.perf_counter()
+                html = self._generator(lang).render_html_preview(cv_data)
+                return html.encode('utf-8'), 'text/html; charset=utf-8', time.perf_counter() - start
+            finally:
+                self._html_slots.release()
+
+        future = self.pool.submit(cv_data, lang, profile=profile)
+        pdf_bytes = future.result()
+        return pdf_bytes, 'application/pdf', future.render_seconds
+
+    def request_started(self):
+        with self._lock:
+            self._in_flight += 1
+
+    def request_finished(self, endpoint: str, status: int, seconds: float):
+        """Record a finished request."""
+        with self._lock:
+            self._in_flight -= 1
+            self._responses[status] = self._responses.get(status, 0) + 1
+            latency = self._latency.setdefault(endpoint, {'count': 0, 'total': 0.0, 'max': 0.0})
+            latency['count'] += 1
+            latency['total'] += seconds
+            latency['max'] = max(latency['max'], seconds)
+
+    def healthy(self) -> bool:
+        """Whether at least one render worker is alive."""
+        return self.pool.stats()['alive_workers'] > 0
+
+    def metrics(self) -> Dict[str, Any]:
+        """
+        Get service metrics.
+
+        Returns:
+            Dictionary with response counts by status, latency per endpoint, pool and warm-up statistics
+        """
+        with self._lock:
+            latency = {
+                endpoint: {
+                    'count': int(values['count']),
+                    'avg_ms': values['total'] / values['count'] * 1000,
+                    'max_ms': values['max'] * 1000,
+                }
+                for endpoint, values in self._latency.items()
+            }
+            metrics = {
+                'uptime_seconds': time.monotonic() - self.started_at,
+                'in_flight_requests': self._in_flight,
+                'responses': {str(status): count for status, count in sorted(self._responses.items())},
+                'latency': latency,
+            }
+        metrics['pool'] = self.pool.stats()
+        metrics['warm_up'] = warm_up_stats()
+        return metrics
+
+
+class RenderRequestHandler(BaseHTTPRequestHandler):
+    """HTTP/1.1 request handler for the render service."""
+
+    protocol_version = 'HTTP/1.1'
+    server_version = f"CVGenerator/{__version__}"
+    # Idle keep-alive connections are closed after this many seconds
+    timeout = settings.SERVER_KEEPALIVE_SECONDS
+
+    @property
+    def service(self) -> RenderService:
+        return self.server.service
+
+    def log_message(self, format: str, *args):
+        logger.debug(f"{self.address_string()} - {format % args}")
+
+    def _send(self, status: int, body: bytes, content_type: str,
+              headers: Optional[Dict[str, str]] = None):
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+        self._status = status
+
+    def _send_json(self, status: int, payload: Dict[str, Any],
+                   headers: Optional[Dict[str, str]] = None):
+        body = json.dumps(payload, default=str).encode('utf-8')
+        self._send(status, body, 'application/json', headers)
+
+    def _send_error(self, status: int, message: str, headers: Optional[Dict[str, str]] = None):
+        self._send_json(status, {'error': HTTPStatus(status).phrase, 'message': message}, headers)
+
+    def _handle(self, endpoint: str, handler):
+        self._status = 500
+        start = time.perf_counter()
+        self.service.request_started()
+        try:
+            handler()
+        except Exception as e:
+            logger.error(f"Unhandled error for {self.command} {self.path}: {e}")
+            self._send_error(500, str(e))
+        finally:
+            self.service.request_finished(endpoint, self._status, time.perf_counter() - start)
+
+    def do_GET(self):
+        path = urlsplit(self.path).path
+        if path == '/health':
+            self._handle('health', self._health)
+        elif path == '/metrics':
+            self._handle('metrics', lambda: self._send_json(200, self.service.metrics()))
+        else:
+            self._handle('other', lambda: self._send_error(404, f"Unknown path: {path}"))
+
+    def do_POST(self):
+        path = urlsplit(self.path).path
+        if path == '/render':
+            self._handle('render', self._render)
+        else:
+            self._handle('other', lambda: self._send_error(404, f"Unknown path: {path}"))
+
+    def _health(self):
+        if self.service.healthy():
+            self._send_json(200, {'status': 'ok'})
+        else:
+            self._send_json(503, {'status': 'unavailable'})
+
+    def _read_body(self) -> Optional[bytes]:
+        """Read the request body, answering 411/413 and returning None if it is not acceptable."""
+        length = self.headers.get('Content-Length')
+        if length is None:
+            self._send_error(411, "Content-Length is required")
+            return None
+        try:
+            length = int(length)
+        except ValueError:
+            self._send_error(400, "Invalid Content-Length")
+            return None
+        if length > settings.SERVER_MAX_BODY_MB * 1024 * 1024:
+            self.close_connection = True
+            self._send_error(413, f"Request body exceeds {settings.SERVER_MAX_BODY_MB} MB")
+            return None
+        return self.rfile.read(length)
+
+    def _render(self):
+        query = parse_qs(urlsplit(self.path).query)
+        lang = query.get('lang', [settings.DEFAULT_LANGUAGE])[0]
+        output_format = query.get('format', [None])[0]
+        profile = query.get('profile', [settings.PDF_PROFILE])[0]
+        if output_format is None:
+            output_format = 'html' if 'text/html' in self.headers.get('Accept', '') else 'pdf'
+
+        body = self._read_body()
+        if body is None:
+            return
+        if lang not in settings.SUPPORTED_LANGUAGES:
+            self._send_error(400, f"Language must be one of {settings.SUPPORTED_LANGUAGES}")
+            return
+        if output_format not in FORMATS:
+            self._send_error(400, f"Format must be one of {list(FORMATS)}")
+            return
+        if profile not in settings.PDF_PROFILES:
+            self._send_error(400, f"Profile must be one of {list(settings.PDF_PROFILES)}")
+            return
+
+        try:
+            cv_data = json.loads(body)
+            if not isinstance(cv_data, dict):
+                raise DataValidationError("Request body must be a JSON object")
+        except (ValueError, DataValidationError) as e:
+            self._send_error(400, f"Invalid CV JSON: {e}")
+            return
+
+        try:
+            content, content_type, render_seconds = self.service.render(
+                cv_data, lang, output_format, profile
+            )
+        except RenderQueueFullError as e:
+            self._send_error(429, str(e), {'Retry-After': '1'})
+            return
+        except RenderTimeoutError as e:
+            self._send_error(504, str(e))
+            return
+        except RenderMemoryError as e:
+            # The worker was replaced; a retry runs on a fresh one
+            self._send_error(503, str(e), {'Retry-After': '1'})
+            return
+        except RenderPoolError as e:
+            # A worker crashed or the pool is shutting down
+            self._send_error(503, str(e))
+            return
+        except DataValidationError as e:
+            # The CV data does not fit the template
+            self._send_error(422, str(e))
+            return
+        except PDFGenerationError as e:
+            # A server-side failure, e.g. missing fonts or assets
+            logger.error(f"Render failed: {e}")
+            self._send_error(500, str(e))
+            return
+
+        etag = '"' + hashlib.sha256(content).hexdigest()[:32] + '"'
+        headers = {
+            'ETag': etag,
+            'X-Render-Time-Ms': f"{(render_seconds or 0) * 1000:.0f}",
+        }
+        if output_format == 'pdf':
+            headers['Content-Disposition'] = f'inline; filename="CV_{lang.upper()}.pdf"'
+        self._send(200, content, content_type, headers)
+
+
+class RenderServer(ThreadingHTTPServer):
+    """Threaded HTTP server holding the shared RenderService."""
+
+    daemon_threads = True
+
+    def __init__(self, address: tuple, service: RenderService):
+        self.service = service
+        super().__init__(address, RenderRequestHandler)
+
+
+def create_server(host: Optional[str] = None, port: Optional[int] = None,
+                  pool: Optional[RenderPool] = None) -> RenderServer:
+    """
+    Create a render server.
+
+    Args:
+        host: Interface to bind. Defaults to settings.SERVER_HOST
+        port: Port to bind, 0 for any free port. Defaults to settings.SERVER_PORT
+        pool: Worker pool. Defaults to a new RenderPool configured from settings,
+            with warmed-up workers
+
+    Returns:
+        Server ready for serve_forever(); its worker pool is started
+    """
+    pool = pool or RenderPool(warm_up=True)
+    pool.start()
+    host = host or settings.SERVER_HOST
+    port = settings.SERVER_PORT if port is None else port
+    return RenderServer((host, port), RenderService(pool))
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Run the render service until interrupted.
+
+    Args:
+        argv: Command-line arguments. Defaults to sys.argv[1:]
+
+    Returns:
+        Process exit code
+    """
+    parser = argparse.ArgumentParser(
+        prog='python -m src.server', description='Serve CV rendering over HTTP.'
+    )
+    parser.add_argument('--host', default=settings.SERVER_HOST,
+                        help=f"Interface to bind (default: {settings.SERVER_HOST})")
+    parser.add_argument('--port', type=int, default=settings.SERVER_PORT,
+                        help=f"Port to bind (default: {settings.SERVER_PORT})")
+    parser.add_argument('--workers', type=int, default=settings.RENDER_POOL_WORKERS,
+                        help=f"Render worker processes (default: {settings.RENDER_POOL_WORKERS})")
+    parser.add_argument('--max-queue', type=int, default=settings.RENDER_POOL_MAX_QUEUE,
+                        help='Queued renders before requests are rejected with 429 '
+                             f"(default: {settings.RENDER_POOL_MAX_QUEUE})")
+    args = parser.parse_args(argv)
+
+    pool = RenderPool(workers=args.workers, max_queue=args.max_queue, warm_up=True)
+    server = create_server(args.host, args.port, pool)
+    host, port = server.server_address[:2]
+    if settings.WARM_UP_ENABLED:
+        # PDFs render on the workers, which warm up by themselves; this process renders HTML
+        warm_up(pdf=False)
+    logger.info(f"Render service listening on http://{host}:{port}")
+
+    # Stop serving on SIGTERM as on Ctrl+C; shutdown() must not run on the serving thread
+    signal.signal(signal.SIGTERM, lambda sig, frame: threading.Thread(target=server.shutdown).start())
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        logger.info("Shutting down render service")
+    finally:
+        server.server_close()
+        pool.shutdown()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -328,6 +328,7 @@ import os
 from typing import Dict, Any, Optional, List
 from pathlib import Path
 import streamlit as st
+import streamlit.components.v1 as st_components
 
 from config.settings import settings
 from src.utils.logger import setup_logger
@@ -516,6 +517,17 @@ class UIComponents:
             st.error(f"Cannot display PDF preview: {e}")
             logger.error(f"PDF preview error: {e}")
     
+    @staticmethod
+    def display_html_preview(html: str, height: int = 800):
+        """
+        Display rendered CV HTML in a sandboxed, scrollable frame.
+        
+        Args:
+            html: Self-contained HTML document
+            height: Height of the frame in pixels
+        """
+        st_components.html(html, height=height, scrolling=True)
+    
     @staticmethod
     def create_download_section(pdf_bytes: bytes, filename: str, 
                               customized_data: Optional[Dict[str, Any]] = None,
@@ -340,14 +340,28 @@
 #                 self.ui.display_error_message(e, show_traceback=True)
 
 import json
+import os
+import tempfile
+import time
+import uuid
 from typing import Dict, Any, Optional
 
 import streamlit as st
 
 from config.settings import settings
-from src.core.cv_generator import CVGenerator
+from src.core.cv_generator import CVGenerator, PdfPreview, image_cache, render_stats
 from src.core.ai_agent import CVAgent
-from src.core.data_processor import DataProcessor
+from src.core.assets import asset_fetcher
+from src.core.batch import generate_languages
+from src.core.bundle import generate_bundle, zip_pdfs
+from src.core.data_processor import DataProcessor, section_cache
+from src.core.images import profile_images
+from src.core.render_cache import render_cache
+from src.core.render_pool import get_render_pool
+from src.core.speculative import speculative_renderer
+from src.core.stylesheets import stylesheet_cache
+from src.core.template_cache import template_registry
+from src.core.warmup import warm_up_stats
 from src.ui.components import UIComponents
 from src.utils.exceptions import CVGeneratorException, DataValidationError
 from src.utils.logger import setup_logger
@@ -413,7 +427,10 @@ class MainPage:
 
         if last_config and last_config != current_config:
             logger.info("Configuration changed. Clearing previous results.")
-            for key in ['pdf_bytes', 'filename', 'analysis_result', 'customized_data', 'last_generation_config']:
+            self._discard_bundle()
+            for key in ['pdf_bytes', 'preview', 'render_request', 'filename', 'analysis_result',
+                        'customized_data', 'bilingual_pdfs', 'bilingual_zip', 'bilingual_digest',
+                        'last_generation_config']:
                 if key in st.session_state:
                     del st.session_state[key]
 
@@ -435,11 +452,35 @@ class MainPage:
         """Render the standard CV generation mode."""
         st.header("📄 Standard CV Generation")
         
+        # Start rendering while the user is still looking at the data
+        if settings.SPECULATIVE_RENDER_ENABLED:
+            session = st.session_state.setdefault('speculative_session', uuid.uuid4().hex)
+            speculative_renderer.start(cv_data, lang_choice, session)
+        
         with st.expander("View Loaded Data"):
             st.json(cv_data)
         
         if st.button("🚀 Generate Standard CV", type="primary", use_container_width=True):
             self._generate_standard_cv(lang_choice, cv_data, uploaded_file)
+        
+        # Both languages can only be built from the data directory
+        if not uploaded_file:
+            if st.button("🌐 Build Both Languages", use_container_width=True):
+                self._generate_bilingual_cvs()
+            self._render_bilingual_downloads()
+            
+            if st.button("📦 Build Bundle (all languages and template variants)", use_container_width=True):
+                self._generate_bundle()
+            bundle_path = st.session_state.get('bundle_path')
+            if bundle_path and os.path.isfile(bundle_path):
+                with open(bundle_path, 'rb') as bundle_file:
+                    st.download_button(
+                        label="📥 Download Bundle (ZIP)",
+                        data=bundle_file,
+                        file_name="CV_Bundle.zip",
+                        mime="application/zip",
+                        use_container_width=True
+                    )
     
     def _render_ai_mode(self, lang_choice: str, cv_data: Dict[str, Any], uploaded_file):
         """Render the AI-customized CV generation mode."""
@@ -453,18 +494,60 @@ class MainPage:
             else:
                 self._generate_ai_customized_cv(lang_choice, cv_data, job_description, uploaded_file)
     
+    @staticmethod
+    def _render_pdf(cv_data: Dict[str, Any], lang: str, preview: PdfPreview) -> Optional[bytes]:
+        """
+        Render the full PDF of a preview.
+        A preview this process laid out is written here from its layout, anything else on the worker pool when enabled.
+        """
+        if settings.RENDER_POOL_ENABLED and not CVGenerator.has_cached_layout(preview.cache_key):
+            return get_render_pool().render(cv_data, lang)
+        return CVGenerator(lang=lang).generate_pdf_bytes(cv_data)
+    
+    @staticmethod
+    def _render_preview(cv_data: Dict[str, Any], lang: str) -> Optional[PdfPreview]:
+        """
+        Render the first page for display and remember the input for the full PDF.
+        With the worker pool enabled, the worker also writes the full PDF from the same layout;
+        otherwise the full PDF is only produced when the user asks to download it.
+        """
+        if settings.RENDER_POOL_ENABLED:
+            preview, pdf_bytes = get_render_pool().submit(cv_data, lang, preview=True).result()
+            st.session_state.pdf_bytes = pdf_bytes
+        else:
+            preview = CVGenerator(lang=lang).generate_preview(cv_data)
+            st.session_state.pop('pdf_bytes', None)
+        st.session_state.preview = preview
+        st.session_state.render_request = (cv_data, lang)
+        return preview
+    
+    @staticmethod
+    def _use_speculative_render(cv_data: Dict[str, Any], lang: str) -> Optional[PdfPreview]:
+        """
+        Take the preview and full PDF from the background render of this data, if there is one.
+        A render still in progress is awaited, as it is ahead of a fresh one.
+        """
+        if not settings.SPECULATIVE_RENDER_ENABLED:
+            return None
+        rendered = speculative_renderer.result(speculative_renderer.make_key(cv_data, lang))
+        if rendered is None:
+            return None
+        preview, pdf_bytes = rendered
+        st.session_state.preview = preview
+        st.session_state.render_request = (cv_data, lang)
+        st.session_state.pdf_bytes = pdf_bytes
+        return preview
+    
     def _generate_standard_cv(self, lang_choice: str, cv_data: Dict[str, Any], uploaded_file):
         """Generate standard CV without AI customization."""
         try:
-            generator = CVGenerator(lang=lang_choice)
-            
-            with self.ui.display_loading_state("Generating PDF..."):
-                pdf_bytes = generator.generate_pdf_bytes(cv_data)
+            with self.ui.display_loading_state("Generating preview..."):
+                preview = self._use_speculative_render(cv_data, lang_choice) or \
+                    self._render_preview(cv_data, lang_choice)
             
-            if pdf_bytes:
+            if preview:
                 st.success("✅ CV Generated Successfully!")
                 
-                st.session_state.pdf_bytes = pdf_bytes
                 st.session_state.filename = f"CV_Standard_{lang_choice.upper()}.pdf"
                 st.session_state.analysis_result = None
                 st.session_state.customized_data = None
@@ -480,6 +563,99 @@ class MainPage:
         except Exception as e:
             self.ui.display_error_message(e, show_traceback=True)
     
+    def _generate_bilingual_cvs(self):
+        """
+        Build the CV in every supported language from the data directory concurrently.
+        The PDFs and their ZIP are kept in the session until the data changes.
+        """
+        try:
+            cv_data_by_lang = DataProcessor.load_languages_from_directory()
+            digest = render_cache.make_key(data=cv_data_by_lang)
+            if st.session_state.get('bilingual_digest') == digest:
+                return
+            
+            with self.ui.display_loading_state("Generating PDFs in all languages..."):
+                results = generate_languages(cv_data_by_lang)
+            
+            pdfs = {}
+            for lang, result in results.items():
+                if result.ok:
+                    pdfs[f"CV_Standard_{lang.upper()}.pdf"] = result.pdf_bytes
+                else:
+                    st.error(f"❌ Failed to generate the {lang.upper()} PDF: {result.error}")
+            st.session_state.bilingual_pdfs = pdfs
+            st.session_state.bilingual_zip = zip_pdfs(pdfs)
+            # A build with failed languages is retried on the next click
+            st.session_state.bilingual_digest = digest if len(pdfs) == len(results) else None
+            
+        except CVGeneratorException as e:
+            self.ui.display_error_message(e)
+        except Exception as e:
+            self.ui.display_error_message(e, show_traceback=True)
+    
+    def _generate_bundle(self):
+        """Render every language and template variant from the data directory into one ZIP."""
+        try:
+            cv_data_by_lang = DataProcessor.load_languages_from_directory()
+            jobs = [
+                (f"CV_{variant}_{lang.upper()}.pdf", (cv_data, lang, {'variant': variant}))
+                for variant in settings.TEMPLATE_VARIANTS
+                for lang, cv_data in cv_data_by_lang.items()
+            ]
+            
+            # The PDFs are streamed into a temporary file, which the download button reads
+            fd, bundle_path = tempfile.mkstemp(prefix='cv-bundle-', suffix='.zip')
+            os.close(fd)
+            try:
+                with self.ui.display_loading_state(f"Generating {len(jobs)} PDFs..."):
+                    results = generate_bundle(jobs, bundle_path)
+            except BaseException:
+                os.remove(bundle_path)
+                raise
+            
+            for (filename, _), result in zip(jobs, results):
+                if not result.ok:
+                    st.error(f"❌ Failed to generate {filename}: {result.error}")
+            self._discard_bundle()
+            st.session_state.bundle_path = bundle_path
+            
+        except CVGeneratorException as e:
+            self.ui.display_error_message(e)
+        except Exception as e:
+            self.ui.display_error_message(e, show_traceback=True)
+    
+    @staticmethod
+    def _discard_bundle():
+        """Delete the session's bundle file, if there is one."""
+        bundle_path = st.session_state.pop('bundle_path', None)
+        if bundle_path and os.path.exists(bundle_path):
+            os.remove(bundle_path)
+    
+    def _render_bilingual_downloads(self):
+        """Offer the PDFs of the last bilingual build, one by one or as a zip."""
+        pdfs = st.session_state.get('bilingual_pdfs')
+        if not pdfs:
+            return
+        
+        columns = st.columns(len(pdfs) + 1)
+        for column, (filename, pdf_bytes) in zip(columns, pdfs.items()):
+            with column:
+                st.download_button(
+                    label=f"📥 {filename}",
+                    data=pdf_bytes,
+                    file_name=filename,
+                    mime="application/pdf",
+                    use_container_width=True
+                )
+        with columns[-1]:
+            st.download_button(
+                label="🗜️ Download All (ZIP)",
+                data=st.session_state.bilingual_zip,
+                file_name="CV_Standard.zip",
+                mime="application/zip",
+                use_container_width=True
+            )
+    
     def _generate_ai_customized_cv(self, lang_choice: str, cv_data: Dict[str, Any], 
                                  job_description: str, uploaded_file):
         """Generate AI-customized CV based on job description."""
@@ -493,13 +669,10 @@ class MainPage:
                 st.success("✅ AI Analysis Complete!")
                 customized_data = result['customized_data']
                 
-                generator = CVGenerator(lang=lang_choice)
+                with self.ui.display_loading_state("Generating customized preview..."):
+                    preview = self._render_preview(customized_data, lang_choice)
                 
-                with self.ui.display_loading_state("Generating customized PDF..."):
-                    pdf_bytes = generator.generate_pdf_bytes(customized_data)
-                
-                if pdf_bytes:
-                    st.session_state.pdf_bytes = pdf_bytes
+                if preview:
                     st.session_state.filename = f"CV_Customized_{lang_choice.upper()}.pdf"
                     st.session_state.analysis_result = result
                     st.session_state.customized_data = customized_data
@@ -516,8 +689,9 @@ class MainPage:
             self.ui.display_error_message(e, show_traceback=True)
     
     def _render_results(self):
-        """Render the results section if PDF is available."""
-        if 'pdf_bytes' not in st.session_state or not st.session_state.pdf_bytes:
+        """Render the results section if a preview is available."""
+        preview = st.session_state.get('preview')
+        if not preview:
             return
         
         st.header("🎉 Your CV is Ready!")
@@ -532,14 +706,26 @@ class MainPage:
         with tab1:
             st.subheader("Preview & Download")
             
-            self.ui.create_download_section(
-                pdf_bytes=st.session_state.pdf_bytes,
-                filename=st.session_state.filename,
-                customized_data=st.session_state.get('customized_data'),
-                lang_choice=self._get_current_language()
-            )
+            if not st.session_state.get('pdf_bytes'):
+                if st.button("📄 Prepare PDF for Download", use_container_width=True):
+                    try:
+                        with self.ui.display_loading_state("Generating full PDF..."):
+                            st.session_state.pdf_bytes = self._render_pdf(
+                                *st.session_state.render_request, preview
+                            )
+                    except Exception as e:
+                        self.ui.display_error_message(e)
+            
+            if st.session_state.get('pdf_bytes'):
+                self.ui.create_download_section(
+                    pdf_bytes=st.session_state.pdf_bytes,
+                    filename=st.session_state.filename,
+                    customized_data=st.session_state.get('customized_data'),
+                    lang_choice=self._get_current_language()
+                )
             
-            self.ui.display_pdf_preview(st.session_state.pdf_bytes)
+            st.caption(f"Showing page {preview.first_page} of {preview.page_count}")
+            self.ui.display_pdf_preview(preview.pdf_bytes)
         
         if analysis_result:
             with tab2:
@@ -557,7 +743,7 @@ class MainPage:
         
         col1, col2 = st.columns([1, 1])
         with col1:
-            st.info("💡 **Tip:** You can manually edit the AI-generated JSON here. Make changes and click regenerate.")
+            st.info("💡 **Tip:** You can manually edit the AI-generated JSON here. The live preview below updates with each edit; regenerate the PDF when you are done.")
         with col2:
             st.warning("⚠️ **Warning:** Be careful not to break the JSON structure. Use the guide for reference.")
 
@@ -595,13 +781,11 @@ class MainPage:
                 st.session_state.customized_data = new_data
                 
                 lang = self._get_current_language()
-                generator = CVGenerator(lang=lang)
                 
                 with self.ui.display_loading_state("Regenerating PDF with your edits..."):
-                    pdf_bytes = generator.generate_pdf_bytes(new_data)
+                    preview = self._render_preview(new_data, lang)
                 
-                if pdf_bytes:
-                    st.session_state.pdf_bytes = pdf_bytes
+                if preview:
                     st.success("✅ PDF regenerated successfully with your changes!")
                 else:
                     st.error("❌ Failed to regenerate PDF.")
@@ -610,6 +794,31 @@ class MainPage:
                 st.error("❌ Invalid JSON format. Please check your edits for syntax errors.")
             except Exception as e:
                 self.ui.display_error_message(e)
+        
+        self._render_live_preview(edited_json_str)
+    
+    def _render_live_preview(self, json_str: str):
+        """Show an HTML preview of the editor content; it is re-rendered on every edit."""
+        st.markdown("#### 👁️ Live Preview")
+        try:
+            data = json.loads(json_str)
+        except json.JSONDecodeError as e:
+            st.caption(f"Live preview paused: invalid JSON at line {e.lineno}, column {e.colno}.")
+            return
+        if not isinstance(data, dict):
+            st.caption("Live preview paused: the content must be a JSON object.")
+            return
+        
+        start = time.perf_counter()
+        try:
+            html = CVGenerator(lang=self._get_current_language()).render_html_preview(data)
+        except CVGeneratorException as e:
+            st.caption(f"Live preview unavailable: {e}")
+            return
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        
+        st.caption(f"HTML preview rendered in {elapsed_ms:.0f} ms. Page breaks may differ from the PDF.")
+        self.ui.display_html_preview(html)
     
     def _render_instructions(self):
         """Render the instructions section."""
@@ -725,6 +934,30 @@ class DebugPage:
         file_status = self.ui.display_file_status()
         st.json(file_status)
         
+        # Cache statistics
+        st.subheader("Caches")
+        st.json({
+            'templates': template_registry.stats(),
+            'stylesheets': stylesheet_cache.stats(),
+            'images': profile_images.stats(),
+            'rendered_pdfs': render_cache.stats(),
+            'data_files': section_cache.stats(),
+            'speculative_renders': speculative_renderer.stats(),
+            'warm_up': warm_up_stats(),
+            'assets': asset_fetcher.stats()
+        })
+        
+        st.subheader("PDF Profiles")
+        st.json({
+            'active': settings.PDF_PROFILE,
+            'renders': render_stats.stats(),
+            'image_cache': image_cache.stats()
+        })
+        
+        if settings.RENDER_POOL_ENABLED:
+            st.subheader("Render Pool")
+            st.json(get_render_pool().stats())
+        
         # Session state
         st.subheader("Session State")
         st.json({k: v for k, v in st.session_state.items()})
@@ -1,11 +1,15 @@
 from .exceptions import (
     CVGeneratorException, TemplateNotFoundError, DataValidationError,
-    AIServiceError, PDFGenerationError, FileLoadError, ConfigurationError
+    AIServiceError, PDFGenerationError, FileLoadError, ConfigurationError,
+    RenderPoolError, RenderQueueFullError, RenderTimeoutError, RenderMemoryError,
+    RenderWorkerCrashedError, RenderCancelledError
 )
 from .logger import setup_logger, get_logger
 
 __all__ = [
     'CVGeneratorException', 'TemplateNotFoundError', 'DataValidationError',
     'AIServiceError', 'PDFGenerationError', 'FileLoadError', 'ConfigurationError',
+    'RenderPoolError', 'RenderQueueFullError', 'RenderTimeoutError', 'RenderMemoryError',
+    'RenderWorkerCrashedError', 'RenderCancelledError',
     'setup_logger', 'get_logger'
 ]
\ No newline at end of file
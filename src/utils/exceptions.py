@@ -30,4 +30,34 @@ class FileLoadError(CVGeneratorException):
 
 class ConfigurationError(CVGeneratorException):
     """Raised when configuration is invalid."""
+    pass
+
+
+class RenderPoolError(PDFGenerationError):
+    """Raised when the out-of-process render pool cannot complete a job."""
+    pass
+
+
+class RenderQueueFullError(RenderPoolError):
+    """Raised when the render pool's job queue is full."""
+    pass
+
+
+class RenderTimeoutError(RenderPoolError):
+    """Raised when a render job exceeds its wall-clock time limit."""
+    pass
+
+
+class RenderMemoryError(RenderPoolError):
+    """Raised when a render worker exceeds its memory limit during a job."""
+    pass
+
+
+class RenderWorkerCrashedError(RenderPoolError):
+    """Raised when a render worker exits unexpectedly during a job."""
+    pass
+
+
+class RenderCancelledError(RenderPoolError):
+    """Raised for a render job that was cancelled while running."""
     pass
\ No newline at end of file
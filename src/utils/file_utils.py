@@ -0,0 +1,49 @@
+import os
+import uuid
+from contextlib import contextmanager
+from typing import BinaryIO, Iterator, Union
+
+# Flags for creating a new temporary file exclusively
+_CREATE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, 'O_BINARY', 0)
+
+
+@contextmanager
+def atomic_open(path: Union[str, os.PathLike]) -> Iterator[BinaryIO]:
+    """
+    Open a file for writing bytes atomically.
+
+    Data is written to a temporary file in the same directory, which is
+    renamed over ``path`` when the block exits without an exception and
+    removed otherwise, so concurrent readers (including other processes)
+    never observe a partially written file.
+
+    Args:
+        path: Destination file path; its directory must exist
+
+    Yields:
+        Binary file object to write to
+    """
+    directory = os.path.dirname(os.fspath(path)) or '.'
+    tmp_path = os.path.join(directory, f".tmp-{uuid.uuid4().hex}")
+    # Mode 0666 lets the process umask apply, giving the permissions open() would
+    fd = os.open(tmp_path, _CREATE_FLAGS, 0o666)
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            yield f
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def atomic_write(path: Union[str, os.PathLike], data: bytes):
+    """
+    Write bytes to a file atomically.
+
+    Args:
+        path: Destination file path; its directory must exist
+        data: Content to write
+    """
+    with atomic_open(path) as f:
+        f.write(data)
@@ -1,16 +1,18 @@
 import logging
+import os
 import sys
 from typing import Optional
 
 
-def setup_logger(name: str, level: str = "INFO", 
+def setup_logger(name: str, level: Optional[str] = None, 
                 format_string: Optional[str] = None) -> logging.Logger:
     """
     Set up a logger with console output.
     
     Args:
         name: Logger name (typically __name__)
-        level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
+        level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL).
+            Defaults to the LOG_LEVEL environment variable, or INFO
         format_string: Custom format string for log messages
     
     Returns:
@@ -34,7 +36,7 @@ def setup_logger(name: str, level: str = "INFO",
     
     # Add handler to logger
     logger.addHandler(handler)
-    logger.setLevel(getattr(logging, level.upper()))
+    logger.setLevel(getattr(logging, (level or os.getenv('LOG_LEVEL', 'INFO')).upper()))
     
     return logger
 
@@ -0,0 +1,131 @@
+import importlib
+import sys
+import types
+
+import pytest
+
+from src.utils.exceptions import FileLoadError
+
+
+class _FakeResponse:
+    def __init__(self, url, body, headers=None):
+        self.url = url
+        self.body = body
+        self.content_type = (headers or {}).get('Content-Type')
+
+    def read(self):
+        return self.body
+
+    def close(self):
+        pass
+
+
+class _FakeURLFetcher:
+    """Stand-in for WeasyPrint's URLFetcher that records network fetches."""
+
+    fetched = []
+
+    def fetch(self, url, headers=None):
+        self.fetched.append(url)
+        return _FakeResponse(url, f"body of {url}".encode(), {'Content-Type': 'text/css'})
+
+
+@pytest.fixture
+def assets(monkeypatch):
+    """Import src.core.assets against a fake weasyprint.urls, so no request reaches the network."""
+    urls = types.ModuleType('weasyprint.urls')
+    urls.URLFetcher = _FakeURLFetcher
+    urls.URLFetcherResponse = _FakeResponse
+    monkeypatch.setitem(sys.modules, 'weasyprint.urls', urls)
+    monkeypatch.delitem(sys.modules, 'src.core.assets', raising=False)
+    monkeypatch.setattr(_FakeURLFetcher, 'fetched', [])
+    yield importlib.import_module('src.core.assets')
+    sys.modules.pop('src.core.assets', None)
+
+
+@pytest.fixture
+def store(tmp_path, assets):
+    store = assets.AssetStore(root=str(tmp_path / 'vendor'))
+    store.add('https://fonts.example/a.css', b'a { }', 'text/css')
+    return store
+
+
+# AssetStore
+
+def test_store_keeps_identical_content_once(tmp_path, assets):
+    store = assets.AssetStore(root=str(tmp_path))
+
+    first = store.add('https://one.example/font.woff2', b'font', 'font/woff2')
+    second = store.add('https://two.example/font.woff2', b'font', 'font/woff2')
+
+    assert first == second
+    assert len(list((tmp_path / 'objects').rglob('*'))) == 2  # one prefix directory, one blob
+    assert store.lookup('https://two.example/font.woff2') == (b'font', 'font/woff2')
+    assert store.lookup('https://three.example/font.woff2') is None
+
+
+def test_store_manifest_is_read_back(store):
+    reopened = type(store)(root=str(store.root))
+
+    assert reopened.urls() == ['https://fonts.example/a.css']
+    assert reopened.digest() == store.digest()
+
+
+# AssetFetcher
+
+def test_store_hit_is_kept_in_memory(assets, store):
+    fetcher = assets.AssetFetcher(store=store, offline=True)
+
+    first = fetcher.get('https://fonts.example/a.css')
+    second = fetcher.get('https://fonts.example/a.css')
+
+    assert first == second == (b'a { }', 'text/css', 'https://fonts.example/a.css')
+    stats = fetcher.stats()
+    assert (stats['store_hits'], stats['memory_hits'], stats['network_fetches']) == (1, 1, 0)
+
+
+def test_registered_content_is_served_from_memory(assets, store):
+    fetcher = assets.AssetFetcher(store=store, offline=True)
+
+    fetcher.register('cv-asset://images/abc.jpg', b'jpeg', 'image/jpeg')
+    response = fetcher.fetch('cv-asset://images/abc.jpg')
+
+    assert (response.url, response.body, response.content_type) == (
+        'cv-asset://images/abc.jpg', b'jpeg', 'image/jpeg')
+    assert fetcher.stats()['memory_hits'] == 1
+
+    fetcher.unregister('cv-asset://images/abc.jpg')
+    with pytest.raises(FileLoadError):
+        fetcher.get('cv-asset://images/abc.jpg')
+
+
+def test_offline_fetcher_never_uses_the_network(assets, store):
+    fetcher = assets.AssetFetcher(store=store, offline=True)
+
+    for _ in range(2):
+        with pytest.raises(FileLoadError):
+            fetcher.get('https://fonts.example/missing.css')
+
+    assert _FakeURLFetcher.fetched == []
+    stats = fetcher.stats()
+    assert stats['blocked_urls'] == {'https://fonts.example/missing.css': 2}
+    assert stats['network_fetches'] == 0
+
+
+def test_network_fall_through_is_counted_and_remembered(assets, store):
+    fetcher = assets.AssetFetcher(store=store, offline=False)
+
+    fetcher.get('https://fonts.example/b.css')
+    body, mime_type, _ = fetcher.get('https://fonts.example/b.css')
+
+    assert (body, mime_type) == (b'body of https://fonts.example/b.css', 'text/css')
+    assert _FakeURLFetcher.fetched == ['https://fonts.example/b.css']
+    stats = fetcher.stats()
+    assert stats['network_urls'] == {'https://fonts.example/b.css': 1}
+    assert stats['memory_hits'] == 1
+
+
+def test_find_remote_urls_keeps_first_occurrence(assets):
+    text = 'url("https://a.example/x.woff2") <link href="https://b.example/y.css"> https://a.example/x.woff2'
+
+    assert assets.find_remote_urls(text) == ['https://a.example/x.woff2', 'https://b.example/y.css']
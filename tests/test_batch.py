@@ -0,0 +1,166 @@
+import sys
+import threading
+import types
+
+import pytest
+
+from config.settings import settings
+from src.core import batch
+from src.core.batch import generate_languages, generate_many
+from src.core.render_pool import RenderFuture
+from src.utils.exceptions import RenderQueueFullError
+
+
+class _FakeGenerator:
+    """CVGenerator stand-in that renders the language, variant and options into the PDF."""
+
+    def __init__(self, lang='en', variant=None):
+        self.lang = lang
+        self.variant = variant
+
+    def generate_pdf_bytes(self, cv_data, **options):
+        if cv_data.get('fail'):
+            raise RuntimeError('render failed')
+        return f"%PDF {cv_data['name']} {self.lang} {self.variant} {sorted(options)}".encode()
+
+
+class _FakePool:
+    """
+    RenderPool stand-in whose jobs finish after the delay given in the CV data.
+
+    The first ``rejections`` submits are turned away as if other clients had
+    filled the queue.
+    """
+
+    size = 1
+    max_queue = 8
+
+    def __init__(self, rejections=0):
+        self.rejections = rejections
+        self.submitted = []
+        self.cancelled = []
+        self._timers = {}
+
+    def submit(self, cv_data, lang='en', **options):
+        if self.rejections:
+            self.rejections -= 1
+            raise RenderQueueFullError("Render queue is full")
+        if lang not in settings.SUPPORTED_LANGUAGES:
+            raise ValueError(f"Language must be one of {settings.SUPPORTED_LANGUAGES}")
+        future = RenderFuture(len(self.submitted))
+        self.submitted.append(cv_data['name'])
+        timer = self._timers[future] = threading.Timer(cv_data.get('delay', 0), self._finish,
+                                                       (future, cv_data, lang))
+        timer.daemon = True
+        timer.start()
+        return future
+
+    @staticmethod
+    def _finish(future, cv_data, lang):
+        if future.set_running_or_notify_cancel():
+            future.set_result(f"%PDF {cv_data['name']} {lang}".encode())
+
+    def cancel(self, future, interrupt=True):
+        self._timers[future].cancel()
+        self.cancelled.append(future.job_id)
+        return future.cancel()
+
+
+@pytest.fixture
+def fake_generator(monkeypatch):
+    """Make in-process renders use _FakeGenerator instead of WeasyPrint."""
+    module = types.ModuleType('src.core.cv_generator')
+    module.CVGenerator = _FakeGenerator
+    monkeypatch.setitem(sys.modules, 'src.core.cv_generator', module)
+    monkeypatch.setattr(settings, 'RENDER_POOL_ENABLED', False)
+
+
+# generate_languages without a render pool
+
+def test_languages_render_in_process_in_order(fake_generator):
+    results = generate_languages({'fa': {'name': 'ada'}, 'en': {'name': 'ada'}})
+
+    assert list(results) == ['fa', 'en']
+    assert [result.pdf_bytes for result in results.values()] == [
+        b"%PDF ada fa None []",
+        b"%PDF ada en None []",
+    ]
+    assert all(result.ok for result in results.values())
+
+
+def test_variant_selects_the_template_instead_of_being_a_render_option(fake_generator):
+    results = generate_languages({'en': {'name': 'ada'}}, variant='classic', profile='draft-fast')
+
+    assert results['en'].pdf_bytes == b"%PDF ada en classic ['profile']"
+    assert results['en'].variant == 'classic'
+
+
+def test_failing_language_does_not_stop_the_others(fake_generator):
+    results = generate_languages({'en': {'name': 'ada'}, 'fa': {'name': 'ada', 'fail': True}})
+
+    assert results['en'].ok
+    assert not results['fa'].ok
+    assert str(results['fa'].error) == 'render failed'
+
+
+def test_no_languages(fake_generator):
+    assert generate_languages({}) == {}
+
+
+# generate_many on an existing pool
+
+def test_results_are_yielded_as_they_finish_or_in_job_order():
+    jobs = [({'name': 'slow', 'delay': 0.2}, 'en'), ({'name': 'fast'}, 'en')]
+
+    finished = [result.index for result in generate_many(jobs, pool=_FakePool())]
+    ordered = [result.pdf_bytes for result in generate_many(jobs, ordered=True, pool=_FakePool())]
+
+    assert finished == [1, 0]
+    assert ordered == [b"%PDF slow en", b"%PDF fast en"]
+
+
+def test_jobs_are_taken_from_the_iterable_as_results_are_consumed():
+    pulled = []
+
+    def jobs():
+        for index in range(5):
+            pulled.append(index)
+            yield {'name': str(index)}, 'en'
+
+    results = generate_many(jobs(), ordered=True, pool=_FakePool(), max_in_flight=2)
+    first = next(results)
+
+    assert first.index == 0
+    assert pulled == [0, 1]
+    assert [result.index for result in results] == [1, 2, 3, 4]
+
+
+def test_jobs_turned_away_by_a_full_queue_are_resubmitted(monkeypatch):
+    monkeypatch.setattr(batch, 'QUEUE_FULL_RETRY_INTERVAL', 0)
+    pool = _FakePool(rejections=3)
+    jobs = [({'name': name}, 'en') for name in ('a', 'b', 'c')]
+
+    results = list(generate_many(jobs, ordered=True, pool=pool))
+
+    assert [result.pdf_bytes for result in results] == [b"%PDF a en", b"%PDF b en", b"%PDF c en"]
+    assert pool.submitted == ['a', 'b', 'c']
+
+
+def test_rejected_job_is_reported_without_stopping_the_batch():
+    jobs = [({'name': 'a'}, 'xx'), ({'name': 'b'}, 'en')]
+
+    results = list(generate_many(jobs, ordered=True, pool=_FakePool()))
+
+    assert isinstance(results[0].error, ValueError)
+    assert results[1].ok
+
+
+def test_closing_the_batch_early_cancels_the_jobs_in_flight():
+    pool = _FakePool()
+    jobs = [({'name': 'a'}, 'en')] + [({'name': name, 'delay': 30}, 'en') for name in ('b', 'c')]
+
+    results = generate_many(jobs, pool=pool)
+    assert next(results).index == 0
+    results.close()
+
+    assert sorted(pool.cancelled) == [1, 2]
@@ -0,0 +1,146 @@
+import io
+import os
+import zipfile
+from concurrent.futures import Future
+
+import pytest
+
+from src.core.bundle import BundleWriter, generate_bundle, zip_pdfs
+
+PDFS = {'CV_EN.pdf': b'%PDF-1.7 english', 'CV_FA.pdf': b'%PDF-1.7 farsi'}
+
+
+class _NonSeekableStream:
+    """Write-only sink like a socket or HTTP response."""
+
+    def __init__(self):
+        self.chunks = []
+
+    def write(self, data):
+        self.chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self):
+        pass
+
+    def getvalue(self):
+        return b''.join(self.chunks)
+
+
+class _FakePool:
+    """Render pool stand-in whose jobs write their CV data as the PDF."""
+
+    size = 2
+    max_queue = 8
+
+    def submit(self, cv_data, lang, output_path=None, **options):
+        future = Future()
+        future.worker_pid = future.queued_seconds = future.render_seconds = None
+        if cv_data.get('fail'):
+            future.set_exception(RuntimeError('render failed'))
+        else:
+            body = f"%PDF {cv_data['name']} {lang}".encode()
+            with open(output_path, 'wb') as f:
+                f.write(body)
+            future.set_result(len(body))
+        return future
+
+
+def _entries(archive_bytes):
+    with zipfile.ZipFile(io.BytesIO(archive_bytes)) as archive:
+        assert archive.testzip() is None
+        return {info.filename: (archive.read(info), info.date_time, info.compress_type)
+                for info in archive.infolist()}
+
+
+def test_zip_pdfs_is_deterministic():
+    assert zip_pdfs(PDFS) == zip_pdfs(dict(PDFS))
+
+
+def test_entries_are_stored_with_a_fixed_timestamp():
+    entries = _entries(zip_pdfs(PDFS))
+
+    assert {name: body for name, (body, _, _) in entries.items()} == PDFS
+    assert {(date_time, compress_type) for _, date_time, compress_type in entries.values()} == \
+        {((1980, 1, 1, 0, 0, 0), zipfile.ZIP_STORED)}
+
+
+def test_files_and_bytes_give_the_same_archive(tmp_path):
+    for name, body in PDFS.items():
+        (tmp_path / name).write_bytes(body)
+
+    from_files = io.BytesIO()
+    with BundleWriter(from_files) as bundle:
+        for name in PDFS:
+            bundle.add_file(name, tmp_path / name)
+
+    assert _entries(from_files.getvalue()) == _entries(zip_pdfs(PDFS))
+    assert (bundle.files, bundle.bytes_added) == (2, sum(map(len, PDFS.values())))
+
+
+def test_non_seekable_target():
+    stream = _NonSeekableStream()
+    with BundleWriter(stream) as bundle:
+        for name, body in PDFS.items():
+            bundle.add(name, body)
+
+    assert {name: body for name, (body, _, _) in _entries(stream.getvalue()).items()} == PDFS
+
+
+def test_path_target_is_written_on_close(tmp_path):
+    target = tmp_path / 'bundle.zip'
+    with BundleWriter(target) as bundle:
+        bundle.add('CV_EN.pdf', PDFS['CV_EN.pdf'])
+
+    assert target.read_bytes() == zip_pdfs({'CV_EN.pdf': PDFS['CV_EN.pdf']})
+
+
+def test_failed_bundle_leaves_no_file(tmp_path):
+    target = tmp_path / 'bundle.zip'
+    with pytest.raises(RuntimeError):
+        with BundleWriter(target) as bundle:
+            bundle.add('CV_EN.pdf', PDFS['CV_EN.pdf'])
+            raise RuntimeError('interrupted')
+
+    assert os.listdir(tmp_path) == []
+
+
+def test_failed_bundle_to_a_stream_is_left_unfinished():
+    stream = io.BytesIO()
+    with pytest.raises(RuntimeError):
+        with BundleWriter(stream) as bundle:
+            bundle.add('CV_EN.pdf', PDFS['CV_EN.pdf'])
+            raise RuntimeError('interrupted')
+
+    # No central directory: readers reject the archive instead of seeing a partial bundle
+    with pytest.raises(zipfile.BadZipFile):
+        zipfile.ZipFile(io.BytesIO(stream.getvalue()))
+
+
+def test_duplicate_names_are_rejected():
+    with BundleWriter(io.BytesIO()) as bundle:
+        bundle.add('CV.pdf', b'one')
+        with pytest.raises(ValueError):
+            bundle.add('CV.pdf', b'two')
+
+
+def test_generate_bundle_streams_results_and_reports_failures(tmp_path):
+    jobs = [
+        ('ada.pdf', ({'name': 'ada'}, 'en')),
+        ('broken.pdf', ({'name': 'broken', 'fail': True}, 'en')),
+        ('grace.pdf', ({'name': 'grace'}, 'fa')),
+    ]
+    spool = tmp_path / 'spool'
+    spool.mkdir()
+    target = tmp_path / 'bundle.zip'
+
+    results = generate_bundle(jobs, target, pool=_FakePool(), spool_dir=str(spool))
+
+    assert [result.ok for result in results] == [True, False, True]
+    assert str(results[1].error) == 'render failed'
+    assert {name: body for name, (body, _, _) in _entries(target.read_bytes()).items()} == {
+        'ada.pdf': b'%PDF ada en',
+        'grace.pdf': b'%PDF grace fa',
+    }
+    # Spool files are removed as soon as they are in the archive
+    assert os.listdir(spool) == []
@@ -0,0 +1,182 @@
+import json
+import os
+
+import pytest
+
+from config.settings import settings
+from src.cli import (
+    BuildTarget, build_environment_digest, discover_targets, main, save_manifest, target_fingerprint
+)
+
+
+def _write_json(path, data):
+    path.write_text(json.dumps(data), encoding='utf-8')
+    return path
+
+
+def _targets(targets):
+    return sorted((t.output_name, t.lang, t.is_directory) for t in targets)
+
+
+# discover_targets
+
+def test_json_file_with_language_suffix_builds_that_language(tmp_path):
+    path = _write_json(tmp_path / 'cv_fa.json', {})
+
+    targets = discover_targets([str(path)], ['en', 'fa'])
+
+    assert _targets(targets) == [('cv_fa.pdf', 'fa', False)]
+
+
+def test_json_file_without_language_suffix_builds_every_language(tmp_path):
+    path = _write_json(tmp_path / 'cv.json', {})
+
+    targets = discover_targets([str(path)], ['en', 'fa'])
+
+    assert _targets(targets) == [('cv_en.pdf', 'en', False), ('cv_fa.pdf', 'fa', False)]
+
+
+def test_json_file_in_unrequested_language_is_skipped(tmp_path):
+    path = _write_json(tmp_path / 'cv_fa.json', {})
+
+    assert discover_targets([str(path)], ['en']) == []
+
+
+def test_directory_builds_each_language_with_section_files(tmp_path):
+    data_dir = tmp_path / 'data'
+    data_dir.mkdir()
+    _write_json(data_dir / 'personal_en.json', {'name': 'Ada'})
+    _write_json(data_dir / 'skills_en.json', [])
+    _write_json(data_dir / 'notes_fa.json', {})
+
+    targets = discover_targets([str(data_dir)], ['en', 'fa'])
+
+    assert _targets(targets) == [('data_en.pdf', 'en', True)]
+    assert sorted(os.path.basename(f) for f in targets[0].input_files) == \
+        ['personal_en.json', 'skills_en.json']
+
+
+def test_directory_with_complete_cv_builds_from_that_file(tmp_path):
+    sample_dir = tmp_path / 'sample'
+    sample_dir.mkdir()
+    path = _write_json(sample_dir / 'personal_en.json', {'personal': {}, 'skills': []})
+
+    targets = discover_targets([str(sample_dir)], ['en'])
+
+    assert _targets(targets) == [('sample_en.pdf', 'en', False)]
+    assert targets[0].source == str(path)
+
+
+def test_conflicting_output_names_are_rejected(tmp_path):
+    first = _write_json(tmp_path / 'cv_en.json', {})
+    (tmp_path / 'other').mkdir()
+    second = _write_json(tmp_path / 'other' / 'cv_en.json', {})
+
+    with pytest.raises(ValueError):
+        discover_targets([str(first), str(second)], ['en'])
+
+
+def test_missing_input_is_rejected(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        discover_targets([str(tmp_path / 'missing.json')], ['en'])
+
+
+# Environment digest and target fingerprints
+
+@pytest.fixture
+def variant_files(tmp_path, monkeypatch):
+    template = tmp_path / 'modern.html'
+    template.write_text('<html></html>', encoding='utf-8')
+    stylesheet = tmp_path / 'modern.css'
+    stylesheet.write_text('body {}', encoding='utf-8')
+    monkeypatch.setitem(settings.TEMPLATE_VARIANTS, 'modern', str(template))
+    return template, stylesheet
+
+
+def test_environment_digest_is_stable():
+    assert build_environment_digest({'profile': 'standard'}) == \
+        build_environment_digest({'profile': 'standard'})
+
+
+def test_environment_digest_covers_profile_name():
+    assert build_environment_digest({'profile': 'standard'}) != \
+        build_environment_digest({'profile': 'draft-fast'})
+
+
+def test_environment_digest_covers_profile_settings(monkeypatch):
+    before = build_environment_digest({'profile': 'draft-fast'})
+    monkeypatch.setitem(settings.PDF_PROFILES, 'draft-fast', {'image_dpi': 100})
+
+    assert build_environment_digest({'profile': 'draft-fast'}) != before
+
+
+def test_environment_digest_covers_variant_template_and_stylesheet(variant_files):
+    template, stylesheet = variant_files
+    options = {'profile': 'standard', 'variant': 'modern'}
+    before = build_environment_digest(options)
+
+    template.write_text('<html><body></body></html>', encoding='utf-8')
+    after_template = build_environment_digest(options)
+    stylesheet.write_text('body { margin: 0 }', encoding='utf-8')
+    after_stylesheet = build_environment_digest(options)
+
+    assert len({before, after_template, after_stylesheet}) == 3
+
+
+def test_target_fingerprint_covers_inputs(tmp_path):
+    path = _write_json(tmp_path / 'cv_en.json', {'personal': {'name': 'Ada'}})
+    target = BuildTarget(str(path), 'en', 'cv_en.pdf', [str(path)], False)
+    before = target_fingerprint(target, 'environment')
+
+    _write_json(path, {'personal': {'name': 'Grace'}})
+
+    assert target_fingerprint(target, 'environment') != before
+    assert target_fingerprint(target, 'other environment') != target_fingerprint(target, 'environment')
+
+
+# main
+
+@pytest.fixture
+def batch_calls(monkeypatch):
+    """Record the worker count of every batch main() starts, without rendering."""
+    import src.core.batch
+
+    calls = []
+
+    def fake_generate_many(jobs, workers=None):
+        calls.append((workers, [options for _, _, options in jobs]))
+        return iter([])
+
+    monkeypatch.setattr(src.core.batch, 'generate_many', fake_generate_many)
+    return calls
+
+
+def test_main_starts_one_worker_per_pending_target_at_most(tmp_path, batch_calls):
+    source = _write_json(tmp_path / 'cv_en.json', {})
+
+    main([str(source), '--lang', 'en', '--output-dir', str(tmp_path / 'out'), '--workers', '8', '-v'])
+
+    assert [workers for workers, _ in batch_calls] == [1]
+
+
+def test_main_starts_no_workers_when_everything_is_unchanged(tmp_path, batch_calls):
+    source = _write_json(tmp_path / 'cv_en.json', {})
+    output_dir = tmp_path / 'out'
+    target = discover_targets([str(source)], ['en'])[0]
+    output_dir.mkdir()
+    (output_dir / 'cv_en.pdf').write_bytes(b'%PDF')
+    save_manifest(str(output_dir), {'cv_en.pdf': {
+        'fingerprint': target_fingerprint(target, build_environment_digest({'profile': settings.PDF_PROFILE})),
+    }})
+
+    assert main([str(source), '--lang', 'en', '--output-dir', str(output_dir), '-v']) == 0
+    assert batch_calls == []
+
+
+def test_main_passes_the_variant_to_every_job(tmp_path, batch_calls, variant_files):
+    source = _write_json(tmp_path / 'cv.json', {})
+
+    main([str(source), '--output-dir', str(tmp_path / 'out'), '--variant', 'modern', '-v'])
+
+    (_, options), = batch_calls
+    assert [job['variant'] for job in options] == ['modern'] * len(settings.SUPPORTED_LANGUAGES)
@@ -0,0 +1,136 @@
+import json
+import os
+
+import pytest
+
+from src.core.data_processor import DataProcessor, SectionFileCache, section_cache
+from src.utils.exceptions import FileLoadError
+
+
+def _write_json(path, data):
+    path.write_text(json.dumps(data), encoding='utf-8')
+    return path
+
+
+def _touch_later(path):
+    """Move a file's modification time forward so the change is always detected."""
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+@pytest.fixture
+def cache():
+    return SectionFileCache()
+
+
+# SectionFileCache
+
+def test_unchanged_file_is_read_once(tmp_path, cache):
+    path = _write_json(tmp_path / 'skills_en.json', {'categories': []})
+
+    first = cache.load(str(path))
+    second = cache.load(str(path))
+
+    assert first is second
+    stats = cache.stats()
+    assert (stats['hits'], stats['misses'], stats['reloads']) == (1, 1, 0)
+
+
+def test_edited_file_is_reloaded(tmp_path, cache):
+    path = _write_json(tmp_path / 'skills_en.json', {'categories': []})
+    cache.load(str(path))
+
+    _write_json(path, {'categories': ['Python']})
+    _touch_later(path)
+
+    assert cache.load(str(path)) == {'categories': ['Python']}
+    assert cache.stats()['reloads'] == 1
+
+
+def test_atomically_replaced_file_is_reloaded(tmp_path, cache):
+    path = _write_json(tmp_path / 'skills_en.json', {'categories': ['a']})
+    cache.load(str(path))
+    stat = os.stat(path)
+
+    # Same size and modification time, new inode: only the inode tells them apart
+    replacement = _write_json(tmp_path / 'skills_en.json.tmp', {'categories': ['b']})
+    os.utime(replacement, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    os.replace(replacement, path)
+
+    assert cache.load(str(path)) == {'categories': ['b']}
+
+
+def test_invalid_json_is_cached_as_empty_section(tmp_path, cache):
+    path = tmp_path / 'skills_en.json'
+    path.write_text('{not json', encoding='utf-8')
+
+    assert cache.load(str(path)) == {}
+    assert cache.load(str(path)) == {}
+    assert cache.stats()['misses'] == 1
+
+
+def test_missing_file_returns_none_until_it_appears(tmp_path, cache):
+    path = tmp_path / 'skills_en.json'
+
+    assert cache.load(str(path)) is None
+    assert cache.load(str(path)) is None
+    assert cache.stats()['missing'] == 1
+
+    _write_json(path, {'categories': []})
+    assert cache.load(str(path)) == {'categories': []}
+    assert cache.stats()['missing'] == 0
+
+
+def test_deleted_file_is_forgotten(tmp_path, cache):
+    path = _write_json(tmp_path / 'skills_en.json', {'categories': []})
+    cache.load(str(path))
+
+    path.unlink()
+
+    assert cache.load(str(path)) is None
+    assert cache.stats()['files'] == 0
+
+
+def test_clear_resets_entries_and_counters(tmp_path, cache):
+    path = _write_json(tmp_path / 'skills_en.json', {})
+    cache.load(str(path))
+
+    cache.clear()
+
+    assert cache.stats() == {'hits': 0, 'misses': 0, 'reloads': 0, 'files': 0, 'missing': 0}
+
+
+# DataProcessor directory loading
+
+def test_directory_load_uses_section_files_and_fills_missing_sections(tmp_path):
+    _write_json(tmp_path / 'personal_en.json', {'name': 'Ada'})
+    section_cache.clear()
+
+    data = DataProcessor(lang='en').load_data_from_directory(str(tmp_path))
+
+    assert data['personal'] == {'name': 'Ada'}
+    assert all(data[section] == {} for section in data if section != 'personal')
+
+
+def test_languages_are_loaded_together(tmp_path):
+    _write_json(tmp_path / 'personal_en.json', {'name': 'Ada'})
+    _write_json(tmp_path / 'personal_fa.json', {'name': 'آدا'})
+
+    data = DataProcessor.load_languages_from_directory(str(tmp_path), ['en', 'fa'])
+
+    assert {lang: cv['personal']['name'] for lang, cv in data.items()} == {'en': 'Ada', 'fa': 'آدا'}
+
+
+def test_languages_skip_sections_without_a_file(tmp_path, monkeypatch):
+    _write_json(tmp_path / 'personal_en.json', {'name': 'Ada'})
+    loaded = []
+    monkeypatch.setattr(section_cache, 'load', lambda filename: loaded.append(filename) or {})
+
+    DataProcessor.load_languages_from_directory(str(tmp_path), ['en', 'fa'])
+
+    assert loaded == [str(tmp_path / 'personal_en.json')]
+
+
+def test_languages_from_missing_directory_are_rejected(tmp_path):
+    with pytest.raises(FileLoadError):
+        DataProcessor.load_languages_from_directory(str(tmp_path / 'missing'), ['en'])
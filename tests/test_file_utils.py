@@ -0,0 +1,40 @@
+import os
+import stat
+
+import pytest
+
+from src.utils.file_utils import atomic_open, atomic_write
+
+
+def test_atomic_write_replaces_the_file(tmp_path):
+    path = tmp_path / 'cv.pdf'
+    path.write_bytes(b'old')
+
+    atomic_write(path, b'new')
+
+    assert path.read_bytes() == b'new'
+    assert os.listdir(tmp_path) == ['cv.pdf']
+
+
+def test_failed_write_keeps_the_old_file(tmp_path):
+    path = tmp_path / 'cv.pdf'
+    path.write_bytes(b'old')
+
+    with pytest.raises(RuntimeError):
+        with atomic_open(path) as f:
+            f.write(b'partial')
+            raise RuntimeError('interrupted')
+
+    assert path.read_bytes() == b'old'
+    assert os.listdir(tmp_path) == ['cv.pdf']
+
+
+@pytest.mark.skipif(os.name != 'posix', reason='POSIX permissions')
+def test_new_file_gets_the_permissions_of_the_umask(tmp_path):
+    previous = os.umask(0o027)
+    try:
+        atomic_write(tmp_path / 'cv.pdf', b'%PDF')
+    finally:
+        os.umask(previous)
+
+    assert stat.S_IMODE(os.stat(tmp_path / 'cv.pdf').st_mode) == 0o640
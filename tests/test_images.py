@@ -0,0 +1,108 @@
+import hashlib
+import os
+import sys
+import types
+from io import BytesIO
+
+import pytest
+from PIL import Image
+
+from config.settings import settings
+from src.core.images import ProfileImageCache
+
+
+class _RecordingFetcher:
+    """Stand-in for the shared asset fetcher that records registered URLs."""
+
+    def __init__(self):
+        self.served = {}
+
+    def register(self, url, body, mime_type):
+        self.served[url] = (body, mime_type)
+
+    def unregister(self, url):
+        self.served.pop(url, None)
+
+
+@pytest.fixture
+def fetcher(monkeypatch, tmp_path):
+    """Serve the assets directory from tmp_path and record what the cache registers."""
+    fetcher = _RecordingFetcher()
+    module = types.ModuleType('src.core.assets')
+    module.asset_fetcher = fetcher
+    monkeypatch.setitem(sys.modules, 'src.core.assets', module)
+    monkeypatch.setattr(settings, 'ASSETS_DIR', tmp_path)
+    return fetcher
+
+
+def _write_image(path, size=(400, 300), color=(200, 30, 30)):
+    Image.new('RGB', size, color).save(path, format='JPEG')
+    return path
+
+
+def _touch_later(path):
+    """Move a file's modification time forward so the change is always detected."""
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+# ProfileImageCache
+
+def test_image_is_processed_once(tmp_path, fetcher):
+    _write_image(tmp_path / 'profile.jpg')
+    cache = ProfileImageCache()
+
+    first = cache.get_profile_image(dpi=96, quality=80)
+    second = cache.get_profile_image(dpi=96, quality=80)
+
+    assert first is second
+    assert (cache.stats()['hits'], cache.stats()['misses']) == (1, 1)
+    assert first.pixel_size == settings.PROFILE_IMAGE_SIZE_PX
+    with Image.open(BytesIO(first.body)) as processed:
+        assert processed.size == (first.pixel_size, first.pixel_size)
+    assert first.url == f"cv-asset://images/{hashlib.sha256(first.body).hexdigest()}.jpg"
+    assert fetcher.served == {first.url: (first.body, 'image/jpeg')}
+
+
+def test_output_parameters_are_part_of_the_key(tmp_path, fetcher):
+    _write_image(tmp_path / 'profile.jpg')
+    cache = ProfileImageCache()
+
+    screen = cache.get_profile_image(dpi=96, quality=80)
+    printed = cache.get_profile_image(dpi=300, quality=80)
+    smaller = cache.get_profile_image(dpi=300, quality=40)
+
+    assert printed.pixel_size == round(settings.PROFILE_IMAGE_SIZE_PX * 300 / 96)
+    assert len({screen.url, printed.url, smaller.url}) == 3
+    assert cache.stats() == {'hits': 0, 'misses': 3, 'images': 3}
+    assert set(fetcher.served) == {screen.url, printed.url, smaller.url}
+
+
+def test_changed_image_replaces_the_old_version(tmp_path, fetcher):
+    path = _write_image(tmp_path / 'profile.jpg')
+    cache = ProfileImageCache()
+    old = cache.get_profile_image(dpi=96, quality=80)
+
+    _write_image(path, color=(30, 30, 200))
+    _touch_later(path)
+    new = cache.get_profile_image(dpi=96, quality=80)
+
+    assert new.url != old.url
+    assert list(fetcher.served) == [new.url]
+    assert cache.stats()['images'] == 1
+
+
+def test_default_picture_is_the_fallback(tmp_path, fetcher):
+    _write_image(tmp_path / 'default_profile_pic.jpg')
+
+    image = ProfileImageCache().get_profile_image(dpi=96, quality=80)
+
+    assert image.source_path == str(tmp_path / 'default_profile_pic.jpg')
+    assert image.data_uri().startswith('data:image/jpeg;base64,')
+
+
+def test_missing_picture(fetcher):
+    cache = ProfileImageCache()
+
+    assert cache.get_profile_image() is None
+    assert fetcher.served == {}
@@ -0,0 +1,91 @@
+import pytest
+
+from src.core.large_cv import chunk_page_css, split_into_chunks
+
+SECTIONS = ['personal', 'summary', 'skills', 'experience', 'projects', 'education']
+
+
+def _cv(jobs=3, projects=2):
+    return {
+        'personal': {'name': 'Ada Lovelace'},
+        'summary': {'text': 'Mathematician'},
+        'experience': {'title': 'Experience', 'jobs': [{'id': n} for n in range(jobs)]},
+        'projects': {'title': 'Projects', 'items': [{'id': n} for n in range(projects)]},
+    }
+
+
+def test_small_cv_is_one_chunk():
+    chunks = split_into_chunks(_cv(), SECTIONS, max_items=150)
+
+    assert len(chunks) == 1
+    sections, data = chunks[0]
+    assert sections == ['personal', 'summary', 'experience', 'projects']
+    assert data == _cv()
+
+
+def test_sections_are_grouped_up_to_max_items():
+    chunks = split_into_chunks(_cv(jobs=3, projects=3), SECTIONS, max_items=4)
+
+    assert [sections for sections, _ in chunks] == [['personal', 'summary', 'experience'], ['projects']]
+
+
+def test_long_section_is_split_into_slices():
+    chunks = split_into_chunks(_cv(jobs=5, projects=1), SECTIONS, max_items=2)
+
+    slices = [data['experience'] for _, data in chunks if 'experience' in data]
+    assert [[job['id'] for job in part['jobs']] for part in slices] == [[0, 1], [2, 3], [4]]
+    # Every slice keeps the section's other fields, such as its title
+    assert all(part['title'] == 'Experience' for part in slices)
+
+
+def test_every_item_is_rendered_once_in_order():
+    cv = _cv(jobs=7, projects=5)
+    chunks = split_into_chunks(cv, SECTIONS, max_items=3)
+
+    jobs = [job['id'] for sections, data in chunks if 'experience' in sections
+            for job in data['experience']['jobs']]
+    projects = [item['id'] for sections, data in chunks if 'projects' in sections
+                for item in data['projects']['items']]
+    assert jobs == list(range(7))
+    assert projects == list(range(5))
+
+
+def test_personal_header_is_shown_once_but_available_everywhere():
+    chunks = split_into_chunks(_cv(jobs=6), SECTIONS, max_items=2)
+
+    assert len(chunks) > 1
+    assert [sections.count('personal') for sections, _ in chunks] == [1] + [0] * (len(chunks) - 1)
+    assert all(data['personal'] == {'name': 'Ada Lovelace'} for _, data in chunks)
+
+
+def test_missing_sections_are_skipped():
+    chunks = split_into_chunks({'summary': {'text': 'x'}}, SECTIONS, max_items=10)
+
+    assert chunks == [(['summary'], {'summary': {'text': 'x'}})]
+
+
+def test_input_data_is_not_modified():
+    cv = _cv(jobs=5)
+    split_into_chunks(cv, SECTIONS, max_items=2)
+
+    assert cv == _cv(jobs=5)
+
+
+def test_max_items_must_be_positive():
+    with pytest.raises(ValueError):
+        split_into_chunks(_cv(), SECTIONS, max_items=0)
+
+
+def test_first_chunk_page_css_hides_running_header_on_first_page():
+    css = chunk_page_css(1, 'Ada "Countess" Lovelace', 'en')
+
+    assert 'content: "Ada \\"Countess\\" Lovelace"' in css
+    assert '@page :first { @top-center { content: none; } }' in css
+    assert 'counter-reset' not in css
+
+
+def test_later_chunk_page_css_continues_page_numbers():
+    css = chunk_page_css(5, 'Ada Lovelace', 'fa')
+
+    assert 'counter-reset: page 5' in css
+    assert 'Vazirmatn' in css
@@ -0,0 +1,130 @@
+import os
+
+import pytest
+
+from src.core.render_cache import RenderCache
+
+
+def _disk_files(directory):
+    return sorted(
+        name for _, _, files in os.walk(directory) for name in files if name.endswith('.pdf')
+    )
+
+
+def _key(n):
+    return RenderCache.make_key(n=n)
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return RenderCache(memory_max_bytes=250, disk_dir=str(tmp_path), disk_max_bytes=1000)
+
+
+def test_make_key_is_canonical():
+    assert RenderCache.make_key(a=1, b={'x': 1, 'y': 2}) == RenderCache.make_key(b={'y': 2, 'x': 1}, a=1)
+    assert RenderCache.make_key(a=1) != RenderCache.make_key(a=2)
+
+
+def test_memory_hit(cache):
+    cache.put(_key(1), b'pdf')
+
+    assert cache.get(_key(1)) == b'pdf'
+    stats = cache.stats()
+    assert (stats['memory_hits'], stats['misses'], stats['bytes_saved']) == (1, 0, 3)
+
+
+def test_miss(cache):
+    assert cache.get(_key(1)) is None
+    assert cache.stats()['misses'] == 1
+
+
+def test_memory_tier_evicts_least_recently_used(cache):
+    for n in range(3):
+        cache.put(_key(n), bytes(100))
+    stats = cache.stats()
+    assert stats['memory_entries'] == 2
+    assert stats['memory_bytes'] == 200
+    assert stats['memory_evictions'] == 1
+
+
+def test_memory_get_refreshes_recency():
+    cache = RenderCache(memory_max_bytes=250, disk_dir='')
+    cache.put(_key(0), bytes(100))
+    cache.put(_key(1), bytes(100))
+    cache.get(_key(0))
+    cache.put(_key(2), bytes(100))
+
+    assert cache.get(_key(0)) is not None
+    assert cache.get(_key(1)) is None
+
+
+def test_overwriting_memory_entry_keeps_size(cache):
+    cache.put(_key(1), bytes(100))
+    cache.put(_key(1), bytes(50))
+
+    stats = cache.stats()
+    assert (stats['memory_entries'], stats['memory_bytes']) == (1, 50)
+
+
+def test_entry_larger_than_memory_tier_goes_to_disk_only(cache):
+    cache.put(_key(1), bytes(300))
+
+    assert cache.stats()['memory_entries'] == 0
+    assert cache.get(_key(1)) == bytes(300)
+    assert cache.stats()['disk_hits'] == 1
+
+
+def test_disk_hit_is_promoted_to_memory(tmp_path):
+    RenderCache(disk_dir=str(tmp_path)).put(_key(1), b'pdf')
+    cache = RenderCache(disk_dir=str(tmp_path))
+
+    assert cache.get(_key(1)) == b'pdf'
+    assert cache.get(_key(1)) == b'pdf'
+    stats = cache.stats()
+    assert (stats['disk_hits'], stats['memory_hits']) == (1, 1)
+
+
+def test_disk_size_is_tracked(cache, tmp_path):
+    cache.put(_key(1), bytes(100))
+    cache.put(_key(2), bytes(150))
+
+    assert cache.stats()['disk_bytes'] == 250
+    assert len(_disk_files(tmp_path)) == 2
+
+
+def test_overwriting_disk_entry_replaces_its_size(cache):
+    cache.put(_key(1), bytes(100))
+    cache.put(_key(2), bytes(100))
+    cache.put(_key(2), bytes(100))
+    cache.put(_key(2), bytes(40))
+
+    assert cache.stats()['disk_bytes'] == 140
+
+
+def test_disk_tier_evicts_oldest_files(cache, tmp_path):
+    for n in range(4):
+        cache.put(_key(n), bytes(300))
+        path = cache._disk_path(_key(n))
+        os.utime(path, (n, n))
+
+    # 1200 bytes exceed the 1000 byte cap; the oldest files go until 900 bytes remain
+    stats = cache.stats()
+    assert stats['disk_bytes'] <= 900
+    assert stats['disk_evictions'] == 1
+    assert not os.path.exists(cache._disk_path(_key(0)))
+    assert os.path.exists(cache._disk_path(_key(3)))
+
+
+def test_entry_larger_than_disk_tier_is_not_written(cache, tmp_path):
+    cache.put(_key(1), bytes(1200))
+
+    assert _disk_files(tmp_path) == []
+
+
+def test_clear_keeps_disk_entries(cache):
+    cache.put(_key(1), b'pdf')
+    cache.clear()
+
+    assert cache.stats()['memory_entries'] == 0
+    assert cache.get(_key(1)) == b'pdf'
+    assert cache.stats()['disk_hits'] == 1
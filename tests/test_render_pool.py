@@ -0,0 +1,128 @@
+import multiprocessing
+import sys
+import time
+import types
+
+import pytest
+
+from config.settings import settings
+from src.core.render_pool import RenderPool
+from src.utils.exceptions import (
+    DataValidationError, PDFGenerationError, RenderCancelledError, RenderQueueFullError,
+    RenderTimeoutError
+)
+
+# Workers are forked, so they inherit the fake generator installed in sys.modules
+pytestmark = pytest.mark.skipif(
+    'fork' not in multiprocessing.get_all_start_methods(),
+    reason="render pool tests fork their workers"
+)
+
+
+class _FakeGenerator:
+    """CVGenerator stand-in whose renders sleep, fail or succeed as the CV data asks."""
+
+    def __init__(self, lang='en', variant=None):
+        self.lang = lang
+        self.variant = variant
+        self.stylesheet_path = 'style.css'
+
+    def generate_pdf_bytes(self, cv_data, **options):
+        time.sleep(cv_data.get('sleep', 0))
+        if cv_data.get('invalid'):
+            raise DataValidationError('missing field')
+        if cv_data.get('fail'):
+            raise RuntimeError('render failed')
+        return f"%PDF {cv_data['name']} {self.lang} {self.variant}".encode()
+
+
+@pytest.fixture
+def pool(monkeypatch, tmp_path):
+    """A one-worker pool rendering with _FakeGenerator instead of WeasyPrint."""
+    generator = types.ModuleType('src.core.cv_generator')
+    generator.CVGenerator = _FakeGenerator
+    stylesheets = types.ModuleType('src.core.stylesheets')
+    stylesheets.stylesheet_cache = types.SimpleNamespace(get_entry=lambda path, lang: None)
+    monkeypatch.setitem(sys.modules, 'src.core.cv_generator', generator)
+    monkeypatch.setitem(sys.modules, 'src.core.stylesheets', stylesheets)
+    # No profile picture to prepare
+    monkeypatch.setattr(settings, 'ASSETS_DIR', tmp_path)
+
+    pool = RenderPool(workers=1, max_queue=1, langs=['en'], start_method='fork',
+                      timeout=0, max_jobs_per_worker=0, max_rss_mb=0)
+    yield pool
+    pool.shutdown()
+
+
+def _wait_until_running(future, timeout=10.0):
+    deadline = time.monotonic() + timeout
+    while not future.running():
+        assert time.monotonic() < deadline, "job was never dispatched"
+        time.sleep(0.01)
+
+
+# Rendering
+
+def test_render_returns_the_pdf(pool):
+    future = pool.submit({'name': 'ada'}, 'en', variant='classic')
+
+    assert future.result(timeout=10) == b"%PDF ada en classic"
+    assert future.worker_pid is not None
+    assert pool.stats()['completed'] == 1
+
+
+def test_invalid_data_is_reported_apart_from_render_failures(pool):
+    with pytest.raises(DataValidationError):
+        pool.render({'name': 'ada', 'invalid': True})
+    with pytest.raises(PDFGenerationError) as excinfo:
+        pool.render({'name': 'ada', 'fail': True})
+
+    assert not isinstance(excinfo.value, DataValidationError)
+    assert pool.stats()['failed'] == 2
+
+
+# Limits
+
+def test_full_queue_rejects_jobs(pool):
+    running = pool.submit({'name': 'ada', 'sleep': 1})
+    _wait_until_running(running)
+    pool.submit({'name': 'ada'})
+
+    with pytest.raises(RenderQueueFullError):
+        pool.submit({'name': 'ada'})
+    assert pool.stats()['rejected'] == 1
+
+
+def test_job_over_its_time_limit_is_killed_and_the_worker_replaced(pool):
+    slow = pool.submit({'name': 'ada', 'sleep': 30}, timeout=0.5)
+
+    with pytest.raises(RenderTimeoutError):
+        slow.result(timeout=10)
+    assert pool.render({'name': 'ada'}) == b"%PDF ada en None"
+    assert pool.stats()['timeouts'] == 1
+
+
+# Cancellation
+
+def test_queued_job_is_dropped(pool):
+    running = pool.submit({'name': 'ada', 'sleep': 1})
+    _wait_until_running(running)
+    queued = pool.submit({'name': 'grace'})
+
+    assert pool.cancel(queued)
+    assert queued.cancelled()
+    assert running.result(timeout=10) == b"%PDF ada en None"
+    assert pool.stats()['queue_depth'] == 0
+
+
+def test_running_job_is_only_interrupted_when_asked(pool):
+    running = pool.submit({'name': 'ada', 'sleep': 30})
+    _wait_until_running(running)
+
+    assert not pool.cancel(running, interrupt=False)
+    assert pool.cancel(running)
+    with pytest.raises(RenderCancelledError):
+        running.result(timeout=0)
+    # The killed worker is replaced
+    assert pool.render({'name': 'ada'}) == b"%PDF ada en None"
+    assert pool.stats()['cancelled'] == 1
@@ -0,0 +1,120 @@
+import importlib
+import sys
+import threading
+import time
+import types
+
+import pytest
+
+from config.settings import settings
+
+# Renders wait for this gate, so tests control when they finish
+_gate = threading.Event()
+
+
+class _FakeGenerator:
+    """CVGenerator stand-in whose preview waits for the gate."""
+
+    def __init__(self, lang='en', variant=None):
+        self.lang = lang
+
+    def generate_preview(self, cv_data):
+        _gate.wait(10)
+        return f"preview {cv_data['name']} {self.lang}"
+
+    def generate_pdf_bytes(self, cv_data, **options):
+        return f"%PDF {cv_data['name']} {self.lang}".encode()
+
+
+@pytest.fixture
+def renderer(monkeypatch):
+    """A SpeculativeRenderer rendering with _FakeGenerator on its background thread."""
+    module = types.ModuleType('src.core.cv_generator')
+    module.CVGenerator = _FakeGenerator
+    module.PdfPreview = object
+    monkeypatch.setitem(sys.modules, 'src.core.cv_generator', module)
+    monkeypatch.delitem(sys.modules, 'src.core.speculative', raising=False)
+    monkeypatch.setattr(settings, 'RENDER_POOL_ENABLED', False)
+    _gate.set()
+
+    renderer = importlib.import_module('src.core.speculative').SpeculativeRenderer(max_results=2)
+    yield renderer
+    _gate.set()
+    renderer._executor.shutdown(wait=True)
+    sys.modules.pop('src.core.speculative', None)
+
+
+def _wait_until_running(renderer, key, timeout=10.0):
+    deadline = time.monotonic() + timeout
+    while not renderer._jobs[key].future.running():
+        assert time.monotonic() < deadline, "render never started"
+        time.sleep(0.01)
+
+
+# Sharing
+
+def test_sessions_viewing_the_same_cv_share_one_render(renderer):
+    first = renderer.start({'name': 'ada'}, 'en', session='s1')
+    second = renderer.start({'name': 'ada'}, 'en', session='s2')
+
+    assert first == second
+    assert renderer.result(first) == ("preview ada en", b"%PDF ada en")
+    stats = renderer.stats()
+    assert (stats['started'], stats['hits']) == (1, 1)
+    assert stats['renders'][first[:12]]['sessions'] == 2
+
+
+def test_unknown_key_is_a_miss(renderer):
+    assert renderer.result(None) is None
+    assert renderer.result('0' * 64) is None
+    assert renderer.stats()['misses'] == 2
+
+
+# Per-session hold and replace
+
+def test_new_data_releases_the_previous_render(renderer):
+    _gate.clear()
+    running = renderer.start({'name': 'v1'}, 'en', session='s1')
+    _wait_until_running(renderer, running)
+    queued = renderer.start({'name': 'v2'}, 'en', session='s1')
+    latest = renderer.start({'name': 'v3'}, 'en', session='s1')
+    _gate.set()
+
+    # The running render finishes and is thrown away; the queued one never runs
+    stats = renderer.stats()
+    assert (stats['discarded'], stats['cancelled']) == (1, 1)
+    assert list(stats['renders']) == [latest[:12]]
+    assert renderer.result(running) is None
+    assert renderer.result(queued) is None
+    assert renderer.result(latest) == ("preview v3 en", b"%PDF v3 en")
+
+
+def test_render_held_by_another_session_is_kept(renderer):
+    shared = renderer.start({'name': 'ada'}, 'en', session='s1')
+    renderer.start({'name': 'ada'}, 'en', session='s2')
+    renderer.start({'name': 'grace'}, 'en', session='s1')
+
+    assert renderer.result(shared) == ("preview ada en", b"%PDF ada en")
+    assert renderer.stats()['renders'][shared[:12]]['sessions'] == 1
+
+
+def test_finished_renders_beyond_the_limit_are_evicted(renderer):
+    keys = [renderer.start({'name': name}, 'en', session=name) for name in ('a', 'b')]
+    for key in keys:
+        renderer.result(key)
+    newest = renderer.start({'name': 'c'}, 'en', session='c')
+
+    stats = renderer.stats()
+    assert stats['evicted'] == 1
+    assert set(stats['renders']) == {keys[1][:12], newest[:12]}
+
+
+# Waiting
+
+def test_result_gives_up_after_the_timeout(renderer):
+    _gate.clear()
+    key = renderer.start({'name': 'ada'}, 'en', session='s1')
+
+    assert renderer.result(key, timeout=0.1) is None
+    _gate.set()
+    assert renderer.result(key) == ("preview ada en", b"%PDF ada en")
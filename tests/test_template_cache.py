@@ -0,0 +1,96 @@
+import os
+
+import pytest
+
+from src.core.template_cache import TemplateRegistry
+from src.utils.exceptions import TemplateNotFoundError
+
+
+def _write_template(directory, name, content):
+    path = directory / name
+    path.write_text(content, encoding='utf-8')
+    return path
+
+
+def _touch_later(path):
+    """Move a file's modification time forward so the change is always detected."""
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+@pytest.fixture
+def registry():
+    return TemplateRegistry(bytecode_cache_dir='')
+
+
+def test_template_is_compiled_once(tmp_path, registry):
+    _write_template(tmp_path, 'cv.html', 'Hello {{ name }}')
+
+    first = registry.get_template(str(tmp_path), 'cv.html')
+    second = registry.get_template(str(tmp_path), 'cv.html')
+
+    assert first is second
+    assert first.render(name='Ada') == 'Hello Ada'
+    stats = registry.stats()
+    assert (stats['hits'], stats['misses'], stats['reloads']) == (1, 1, 0)
+
+
+def test_changed_template_is_reloaded(tmp_path, registry):
+    path = _write_template(tmp_path, 'cv.html', 'Hello {{ name }}')
+    first = registry.get_entry(str(tmp_path), 'cv.html')
+
+    _write_template(tmp_path, 'cv.html', 'Goodbye {{ name }}')
+    _touch_later(path)
+    second = registry.get_entry(str(tmp_path), 'cv.html')
+
+    assert second.template.render(name='Ada') == 'Goodbye Ada'
+    assert second.digest != first.digest
+    assert registry.stats()['reloads'] == 1
+
+
+def test_templates_are_keyed_by_path(tmp_path, registry):
+    for name in ('a', 'b'):
+        (tmp_path / name).mkdir()
+        _write_template(tmp_path / name, 'cv.html', name)
+
+    a = registry.get_template(str(tmp_path / 'a'), 'cv.html')
+    b = registry.get_template(str(tmp_path / 'b'), 'cv.html')
+
+    assert (a.render(), b.render()) == ('a', 'b')
+
+
+def test_missing_template_raises(tmp_path, registry):
+    with pytest.raises(TemplateNotFoundError):
+        registry.get_template(str(tmp_path), 'missing.html')
+
+
+def test_invalid_template_raises(tmp_path, registry):
+    _write_template(tmp_path, 'cv.html', '{% if %}')
+
+    with pytest.raises(TemplateNotFoundError):
+        registry.get_template(str(tmp_path), 'cv.html')
+
+
+def test_precompile_persists_bytecode(tmp_path):
+    templates = tmp_path / 'templates'
+    templates.mkdir()
+    _write_template(templates, 'cv.html', 'Hello {{ name }}')
+    bytecode_dir = tmp_path / 'bytecode'
+
+    timings = TemplateRegistry(bytecode_cache_dir=str(bytecode_dir)).precompile(str(templates))
+
+    assert list(timings) == ['cv.html']
+    assert os.listdir(bytecode_dir)
+    # A fresh registry loads the persisted bytecode and renders the same output
+    fresh = TemplateRegistry(bytecode_cache_dir=str(bytecode_dir))
+    assert fresh.get_template(str(templates), 'cv.html').render(name='Ada') == 'Hello Ada'
+
+
+def test_clear_resets_entries_and_counters(tmp_path, registry):
+    _write_template(tmp_path, 'cv.html', 'x')
+    registry.get_template(str(tmp_path), 'cv.html')
+
+    registry.clear()
+
+    stats = registry.stats()
+    assert (stats['hits'], stats['misses'], stats['reloads']) == (0, 0, 0)